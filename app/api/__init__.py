@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from api.api_v1 import router
+from api.metrics import router as metrics_router
 
 api_router = APIRouter()
 api_router.include_router(router)
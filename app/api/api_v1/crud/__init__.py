@@ -1,7 +1,21 @@
-__all__ = ("read_all_trade_results", "read_last_trading_dates", "read_dynamics")
+__all__ = (
+    "read_all_trade_results",
+    "read_last_trading_dates",
+    "read_dynamics",
+    "stream_dynamics",
+    "read_daily_aggregates",
+    "read_aggregates",
+    "read_oils",
+    "read_delivery_bases",
+    "read_delivery_types",
+)
 
+from .dictionaries import read_delivery_bases, read_delivery_types, read_oils
 from .trade_results import (
+    read_aggregates,
     read_all_trade_results,
+    read_daily_aggregates,
     read_dynamics,
     read_last_trading_dates,
+    stream_dynamics,
 )
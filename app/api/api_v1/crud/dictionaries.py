@@ -0,0 +1,53 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import SpimexDeliveryBasis as delivery_basis_model
+from core.models import SpimexDeliveryType as delivery_type_model
+from core.models import SpimexOil as oil_model
+
+
+async def read_oils(session: AsyncSession) -> list[oil_model]:
+    """Fetches all traded oil types ordered by their ids.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        list[oil_model]: A list of oil types
+    """
+
+    db_results = await session.scalars(select(oil_model).order_by(oil_model.oil_id))
+
+    return db_results.all()
+
+
+async def read_delivery_bases(session: AsyncSession) -> list[delivery_basis_model]:
+    """Fetches all delivery bases ordered by their ids.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        list[delivery_basis_model]: A list of delivery bases with their names
+    """
+
+    stmt = select(delivery_basis_model).order_by(delivery_basis_model.delivery_basis_id)
+    db_results = await session.scalars(stmt)
+
+    return db_results.all()
+
+
+async def read_delivery_types(session: AsyncSession) -> list[delivery_type_model]:
+    """Fetches all delivery types ordered by their ids.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        list[delivery_type_model]: A list of delivery types
+    """
+
+    stmt = select(delivery_type_model).order_by(delivery_type_model.delivery_type_id)
+    db_results = await session.scalars(stmt)
+
+    return db_results.all()
@@ -1,9 +1,114 @@
 import datetime
+from collections.abc import AsyncIterator, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    Numeric,
+    Row,
+    RowMapping,
+    Select,
+    cast,
+    func,
+    select,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+from utils import TradeResultCursor
 
+from core.models import SpimexDailyAggregate as daily_aggregate_model
 from core.models import SpimexTradeResult as trade_result_model
+from core.schemas import TradeResultOut
+
+
+def select_trade_results(as_rows: bool = False) -> Select:
+    """Builds the select statement of trade results.
+
+    Args:
+        as_rows (bool): Select plain columns of "TradeResultOut" fields instead of
+        ORM entities. False by default
+
+    Returns:
+        Select: Select statement of trade results
+    """
+
+    if as_rows:
+        return select(
+            *(getattr(trade_result_model, name) for name in TradeResultOut.model_fields)
+        )
+
+    return select(trade_result_model)
+
+
+def filter_trade_results(
+    stmt: Select,
+    oil_id: str | None,
+    delivery_type_id: str | None,
+    delivery_basis_id: str | None,
+    model: type[trade_result_model] | type[daily_aggregate_model] = trade_result_model,
+) -> Select:
+    """Applies optional filters to the trade results select statement.
+
+    Args:
+        stmt (Select): Select statement of trade results
+        oil_id (str | None): Oil id filter parameter
+        delivery_type_id (str | None): delivery type id filter parameter
+        delivery_basis_id (str | None): delivery basis id filter parameter
+        model (type[trade_result_model] | type[daily_aggregate_model]): Model to
+        filter by. Trade results model by default
+
+    Returns:
+        Select: Filtered select statement
+    """
+
+    if oil_id:
+        stmt = stmt.filter(model.oil_id == oil_id)
+    if delivery_type_id:
+        stmt = stmt.filter(model.delivery_type_id == delivery_type_id)
+    if delivery_basis_id:
+        stmt = stmt.filter(model.delivery_basis_id == delivery_basis_id)
+
+    return stmt
+
+
+def paginate(
+    stmt: Select,
+    limit: int,
+    skip: int,
+    keyset: bool = False,
+    after: TradeResultCursor | None = None,
+) -> Select:
+    """Applies offset or keyset pagination to the trade results select statement.
+
+    Results are ordered by (date, id) in descending order in both modes, so pages
+    are stable and served by the (date, id) trailing columns of the indexes. Keyset
+    pagination seeks past the given cursor, so the cost of a page does not depend
+    on its depth.
+
+    Args:
+        stmt (Select): Select statement of trade results
+        limit (int): The maximum number of records to retrieve
+        skip (int): The number of records to skip in offset mode
+        keyset (bool): Use keyset pagination instead of offset. False by default
+        after (TradeResultCursor | None): Position of the last record of the
+        previous page in keyset mode. None for the first page
+
+    Returns:
+        Select: Paginated select statement
+    """
+
+    stmt = stmt.order_by(trade_result_model.date.desc(), trade_result_model.id.desc())
+
+    if not keyset:
+        return stmt.offset(skip).limit(limit)
+
+    if after is not None:
+        stmt = stmt.filter(
+            tuple_(trade_result_model.date, trade_result_model.id)
+            < tuple_(after.date, after.id)
+        )
+
+    return stmt.limit(limit)
 
 
 async def read_all_trade_results(
@@ -13,7 +118,10 @@ async def read_all_trade_results(
     limit: int,
     skip: int,
     session: AsyncSession,
-) -> list[trade_result_model]:
+    keyset: bool = False,
+    after: TradeResultCursor | None = None,
+    as_rows: bool = False,
+) -> list[trade_result_model] | list[Row]:
     """Fetches a list of trade results from the database with given limit and offset.
 
     Args:
@@ -23,25 +131,23 @@ async def read_all_trade_results(
         delivery_type_id (str): delivery type id filter parameter
         delivery_basis_id (str): delivery basis id filter parameter
         session (AsyncSession): The async database session's instance
+        keyset (bool): Use keyset pagination instead of offset. False by default
+        after (TradeResultCursor | None): Position of the last record of the
+        previous page in keyset mode. None by default
+        as_rows (bool): Fetch plain rows skipping ORM hydration. False by default
 
     Returns:
-        list[trade_result_model]: A list containing trade results model objects
+        list[trade_result_model] | list[Row]: A list containing trade results model
+        objects or rows if "as_rows" is set
     """
 
-    stmt = select(trade_result_model)
+    stmt = select_trade_results(as_rows)
+    stmt = filter_trade_results(stmt, oil_id, delivery_type_id, delivery_basis_id)
+    stmt = paginate(stmt, limit, skip, keyset, after)
 
-    if oil_id:
-        stmt = stmt.filter(trade_result_model.oil_id == oil_id)
-    if delivery_type_id:
-        stmt = stmt.filter(trade_result_model.delivery_type_id == delivery_type_id)
-    if delivery_basis_id:
-        stmt = stmt.filter(trade_result_model.delivery_basis_id == delivery_basis_id)
+    db_results = await session.execute(stmt)
 
-    stmt = stmt.offset(skip).limit(limit)
-
-    db_results = await session.scalars(stmt)
-
-    return db_results.all()
+    return db_results.all() if as_rows else db_results.scalars().all()
 
 
 async def read_last_trading_dates(
@@ -73,7 +179,10 @@ async def read_dynamics(
     limit: int,
     skip: int,
     session: AsyncSession,
-) -> list[trade_result_model]:
+    keyset: bool = False,
+    after: TradeResultCursor | None = None,
+    as_rows: bool = False,
+) -> list[trade_result_model] | list[Row]:
     """Fetches a list of trade results from the database within the specified date
     range.
 
@@ -86,24 +195,215 @@ async def read_dynamics(
         delivery_type_id (str): delivery type id filter parameter
         delivery_basis_id (str): delivery basis id filter parameter
         session (AsyncSession): The async database session's instance
+        keyset (bool): Use keyset pagination instead of offset. False by default
+        after (TradeResultCursor | None): Position of the last record of the
+        previous page in keyset mode. None by default
+        as_rows (bool): Fetch plain rows skipping ORM hydration. False by default
 
     Returns:
-        list[trade_result_model]: A list containing trade results model objects
+        list[trade_result_model] | list[Row]: A list containing trade results model
+        objects or rows if "as_rows" is set
     """
 
-    stmt = select(trade_result_model).filter(
+    stmt = select_trade_results(as_rows).filter(
         trade_result_model.date <= end_date, trade_result_model.date >= start_date
     )
 
-    if oil_id:
-        stmt = stmt.filter(trade_result_model.oil_id == oil_id)
-    if delivery_type_id:
-        stmt = stmt.filter(trade_result_model.delivery_type_id == delivery_type_id)
-    if delivery_basis_id:
-        stmt = stmt.filter(trade_result_model.delivery_basis_id == delivery_basis_id)
+    stmt = filter_trade_results(stmt, oil_id, delivery_type_id, delivery_basis_id)
+    stmt = paginate(stmt, limit, skip, keyset, after)
+
+    db_results = await session.execute(stmt)
+
+    return db_results.all() if as_rows else db_results.scalars().all()
+
+
+async def stream_dynamics(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    oil_id: str | None,
+    delivery_type_id: str | None,
+    delivery_basis_id: str | None,
+    session: AsyncSession,
+    chunk_size: int = 1000,
+) -> AsyncIterator[Sequence[RowMapping]]:
+    """Streams trade results within the specified date range in chunks using a
+    server-side cursor, so memory usage does not depend on the size of the range.
+
+    Rows are selected as plain mappings bypassing ORM objects and are ordered by
+    date and id.
+
+    Args:
+        start_date (datetime.date): The start date of quering period
+        end_date (datetime.date): The end date of quering period
+        oil_id (str | None): Oil id filter parameter
+        delivery_type_id (str | None): delivery type id filter parameter
+        delivery_basis_id (str | None): delivery basis id filter parameter
+        session (AsyncSession): The async database session's instance
+        chunk_size (int): The number of rows fetched from the cursor at once. 1000
+        by default
+
+    Yields:
+        Sequence[RowMapping]: Chunks of trade results rows
+    """
+
+    table = trade_result_model.__table__
+    stmt = select(table).filter(
+        trade_result_model.date <= end_date, trade_result_model.date >= start_date
+    )
+    stmt = filter_trade_results(stmt, oil_id, delivery_type_id, delivery_basis_id)
+    stmt = stmt.order_by(trade_result_model.date, trade_result_model.id)
+
+    db_results = await session.stream(stmt.execution_options(yield_per=chunk_size))
+
+    async for chunk in db_results.mappings().partitions():
+        yield chunk
+
+
+async def read_daily_aggregates(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    oil_id: str | None,
+    delivery_type_id: str | None,
+    delivery_basis_id: str | None,
+    limit: int,
+    skip: int,
+    session: AsyncSession,
+) -> list[daily_aggregate_model]:
+    """Fetches daily totals of trade results within the specified date range from
+    the daily aggregates rollup.
 
-    stmt = stmt.offset(skip).limit(limit)
+    Args:
+        start_date (datetime.date): The start date of quering period
+        end_date (datetime.date): The end date of quering period
+        oil_id (str | None): Oil id filter parameter
+        delivery_type_id (str | None): delivery type id filter parameter
+        delivery_basis_id (str | None): delivery basis id filter parameter
+        limit (int): The maximum number of records to retrieve
+        skip (int): The number of records to skip in the database
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        list[daily_aggregate_model]: A list containing daily aggregates model objects
+        ordered by date and group
+    """
+
+    stmt = select(daily_aggregate_model).filter(
+        daily_aggregate_model.date <= end_date,
+        daily_aggregate_model.date >= start_date,
+    )
+    stmt = filter_trade_results(
+        stmt, oil_id, delivery_type_id, delivery_basis_id, daily_aggregate_model
+    )
+    stmt = (
+        stmt.order_by(
+            daily_aggregate_model.date,
+            daily_aggregate_model.oil_id,
+            daily_aggregate_model.delivery_basis_id,
+            daily_aggregate_model.delivery_type_id,
+        )
+        .offset(skip)
+        .limit(limit)
+    )
 
     db_results = await session.scalars(stmt)
 
     return db_results.all()
+
+
+def select_aggregates(
+    group_by: Sequence[str], bucket: str, start_date: datetime.date
+) -> tuple[Select, list[ColumnElement]]:
+    """Builds the statement summing daily aggregates by time bucket and groups.
+
+    Weeks start on Monday and months on the first day, the first bucket starts on
+    the period's start date instead, as it only sums days of the period. VWAP is the
+    total value divided by the total volume, None for zero volume.
+
+    Args:
+        group_by (Sequence[str]): Names of columns to group by besides the bucket
+        bucket (str): Time bucket: "day", "week" or "month"
+        start_date (datetime.date): The start date of quering period
+
+    Returns:
+        tuple[Select, list[ColumnElement]]: Select statement and its grouping
+        columns
+    """
+
+    if bucket == "day":
+        period = daily_aggregate_model.date
+    else:
+        period = func.greatest(
+            cast(
+                func.date_trunc(bucket, cast(daily_aggregate_model.date, DateTime)),
+                daily_aggregate_model.date.type,
+            ),
+            start_date,
+        )
+
+    group_columns = [period.label("date")] + [
+        getattr(daily_aggregate_model, name) for name in group_by
+    ]
+    volume = func.sum(daily_aggregate_model.volume)
+    total = func.sum(daily_aggregate_model.total)
+
+    stmt = select(
+        *group_columns,
+        volume.label("volume"),
+        total.label("total"),
+        func.sum(daily_aggregate_model.count).label("count"),
+        func.round(cast(total, Numeric) / func.nullif(volume, 0), 2).label("vwap"),
+    )
+
+    return stmt, group_columns
+
+
+async def read_aggregates(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    oil_id: str | None,
+    delivery_type_id: str | None,
+    delivery_basis_id: str | None,
+    group_by: Sequence[str],
+    bucket: str,
+    limit: int,
+    skip: int,
+    session: AsyncSession,
+) -> list[Row]:
+    """Fetches total volume, value, deal count and VWAP of trade results within the
+    specified date range by time bucket and groups.
+
+    Totals are summed in the database from the daily aggregates rollup, so only one
+    row per bucket and group is transferred.
+
+    Args:
+        start_date (datetime.date): The start date of quering period
+        end_date (datetime.date): The end date of quering period
+        oil_id (str | None): Oil id filter parameter
+        delivery_type_id (str | None): delivery type id filter parameter
+        delivery_basis_id (str | None): delivery basis id filter parameter
+        group_by (Sequence[str]): Names of columns to group by besides the bucket
+        bucket (str): Time bucket: "day", "week" or "month"
+        limit (int): The maximum number of records to retrieve
+        skip (int): The number of records to skip in the database
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        list[Row]: Rows with the bucket's start date, grouping columns and totals
+        ordered by date and groups
+    """
+
+    stmt, group_columns = select_aggregates(group_by, bucket, start_date)
+    stmt = stmt.filter(
+        daily_aggregate_model.date <= end_date,
+        daily_aggregate_model.date >= start_date,
+    )
+    stmt = filter_trade_results(
+        stmt, oil_id, delivery_type_id, delivery_basis_id, daily_aggregate_model
+    )
+    stmt = (
+        stmt.group_by(*group_columns).order_by(*group_columns).offset(skip).limit(limit)
+    )
+
+    db_results = await session.execute(stmt)
+
+    return db_results.all()
@@ -1,30 +1,101 @@
 import datetime
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from fastapi_cache.decorator import cache
-from sqlalchemy.ext.asyncio import AsyncSession
-from utils import calculate_cache_expiration
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from utils import (
+    COLUMNAR_FORMATS,
+    EXPORT_MEDIA_TYPES,
+    ColumnarEncoder,
+    PreEncodedJSONResponse,
+    decode_cursor,
+    encode_csv,
+    encode_cursor,
+    encode_ndjson,
+    encode_rows,
+    negotiate_format,
+)
 
 from api.api_v1.crud import (
+    read_aggregates,
     read_all_trade_results,
+    read_daily_aggregates,
+    read_delivery_bases,
+    read_delivery_types,
     read_dynamics,
     read_last_trading_dates,
+    read_oils,
+    stream_dynamics,
 )
 from core.config import settings
-from core.models import db_connector
-from core.redis import request_key_builder
-from core.schemas import DynamicsFilterParams, TradeResultOut, TradingFilterParams
+from core.models import SpimexTradeResult, db_connector
+from core.redis import cache, get_coder, request_key_builder
+from core.schemas import (
+    AggregateFilterParams,
+    DailyAggregateFilterParams,
+    DailyAggregateOut,
+    DeliveryBasisOut,
+    DeliveryTypeOut,
+    DynamicsFilterParams,
+    ExportFilterParams,
+    OilOut,
+    TradeResultAggregateOut,
+    TradeResultOut,
+    TradeResultsPage,
+    TradingFilterParams,
+)
 
 router = APIRouter(prefix=settings.api.v1.trade_results, tags=["Trade-results"])
+coder = get_coder(settings.cache.coder)
+
+
+def build_response(
+    trade_results: list[SpimexTradeResult] | list[Row], limit: int, keyset: bool
+) -> list[TradeResultOut] | TradeResultsPage | PreEncodedJSONResponse:
+    """Builds the trade results endpoint's response.
+
+    In cursor pagination mode results are wrapped into a page with the cursor of the
+    next page. If fast json responses are enabled, rows are encoded straight to JSON
+    bytes bypassing response model validation.
+
+    Args:
+        trade_results (list[SpimexTradeResult] | list[Row]): Fetched trade results
+        limit (int): Requested page size
+        keyset (bool): Cursor pagination mode
+
+    Returns:
+        list[TradeResultOut] | TradeResultsPage | PreEncodedJSONResponse: Endpoint's
+        response content
+    """
+
+    next_cursor = None
+    if keyset and trade_results and len(trade_results) == limit:
+        last_result = trade_results[-1]
+        next_cursor = encode_cursor(last_result.date, last_result.id)
 
+    if settings.response.fast_json:
+        extra = {"next_cursor": next_cursor} if keyset else {}
+        return PreEncodedJSONResponse(encode_rows(trade_results, **extra))
 
-@router.get("/", response_model=list[TradeResultOut])
-@cache(expire=calculate_cache_expiration(), key_builder=request_key_builder)
+    if keyset:
+        return TradeResultsPage(
+            results=[TradeResultOut.model_validate(item) for item in trade_results],
+            next_cursor=next_cursor,
+        )
+
+    return trade_results
+
+
+@router.get("/", response_model=list[TradeResultOut] | TradeResultsPage)
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
 async def get_trading_results(
     filter_query: Annotated[TradingFilterParams, Query()],
-    session: AsyncSession = Depends(db_connector.get_session),
-) -> list[TradeResultOut]:
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[TradeResultOut] | TradeResultsPage:
+    keyset = filter_query.cursor is not None
     trade_results = await read_all_trade_results(
         oil_id=filter_query.oil_id,
         delivery_type_id=filter_query.delivery_type_id,
@@ -32,28 +103,62 @@ async def get_trading_results(
         limit=filter_query.limit,
         skip=filter_query.skip,
         session=session,
+        keyset=keyset,
+        after=decode_cursor(filter_query.cursor) if keyset else None,
+        as_rows=settings.response.fast_json,
     )
 
-    return trade_results
+    return build_response(trade_results, filter_query.limit, keyset)
 
 
 @router.get("/last-dates")
-@cache(expire=calculate_cache_expiration(), key_builder=request_key_builder)
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
 async def get_last_trading_dates(
     days: int = Query(1, gt=0, description="The number of days to get dates for"),
-    session: AsyncSession = Depends(db_connector.get_session),
+    session: AsyncSession = Depends(db_connector.get_read_session),
 ) -> list[datetime.date]:
     trade_dates = await read_last_trading_dates(days, session)
 
     return trade_dates
 
 
-@router.get("/dynamics", response_model=list[TradeResultOut])
-@cache(expire=calculate_cache_expiration(), key_builder=request_key_builder)
+@router.get("/oils", response_model=list[OilOut])
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
+async def get_oils(
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[OilOut]:
+    oils = await read_oils(session)
+
+    return oils
+
+
+@router.get("/delivery-bases", response_model=list[DeliveryBasisOut])
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
+async def get_delivery_bases(
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[DeliveryBasisOut]:
+    delivery_bases = await read_delivery_bases(session)
+
+    return delivery_bases
+
+
+@router.get("/delivery-types", response_model=list[DeliveryTypeOut])
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
+async def get_delivery_types(
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[DeliveryTypeOut]:
+    delivery_types = await read_delivery_types(session)
+
+    return delivery_types
+
+
+@router.get("/dynamics", response_model=list[TradeResultOut] | TradeResultsPage)
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
 async def get_dynamics(
     filter_query: Annotated[DynamicsFilterParams, Query()],
-    session: AsyncSession = Depends(db_connector.get_session),
-) -> list[TradeResultOut]:
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[TradeResultOut] | TradeResultsPage:
+    keyset = filter_query.cursor is not None
     trade_results = await read_dynamics(
         start_date=filter_query.start_date,
         end_date=filter_query.end_date,
@@ -63,6 +168,122 @@ async def get_dynamics(
         limit=filter_query.limit,
         skip=filter_query.skip,
         session=session,
+        keyset=keyset,
+        after=decode_cursor(filter_query.cursor) if keyset else None,
+        as_rows=settings.response.fast_json,
     )
 
-    return trade_results
+    return build_response(trade_results, filter_query.limit, keyset)
+
+
+@router.get("/dynamics/daily", response_model=list[DailyAggregateOut])
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
+async def get_daily_dynamics(
+    filter_query: Annotated[DailyAggregateFilterParams, Query()],
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[DailyAggregateOut]:
+    daily_aggregates = await read_daily_aggregates(
+        start_date=filter_query.start_date,
+        end_date=filter_query.end_date,
+        oil_id=filter_query.oil_id,
+        delivery_type_id=filter_query.delivery_type_id,
+        delivery_basis_id=filter_query.delivery_basis_id,
+        limit=filter_query.limit,
+        skip=filter_query.skip,
+        session=session,
+    )
+
+    return daily_aggregates
+
+
+@router.get("/aggregate", response_model=list[TradeResultAggregateOut])
+@cache(namespace="trade-results", key_builder=request_key_builder, coder=coder)
+async def get_aggregates(
+    filter_query: Annotated[AggregateFilterParams, Query()],
+    session: AsyncSession = Depends(db_connector.get_read_session),
+) -> list[TradeResultAggregateOut]:
+    aggregates = await read_aggregates(
+        start_date=filter_query.start_date,
+        end_date=filter_query.end_date,
+        oil_id=filter_query.oil_id,
+        delivery_type_id=filter_query.delivery_type_id,
+        delivery_basis_id=filter_query.delivery_basis_id,
+        group_by=filter_query.group_by,
+        bucket=filter_query.bucket,
+        limit=filter_query.limit,
+        skip=filter_query.skip,
+        session=session,
+    )
+
+    return [TradeResultAggregateOut.model_validate(row) for row in aggregates]
+
+
+async def export_chunks(
+    filter_query: ExportFilterParams,
+    format: str,
+    encoder: ColumnarEncoder | None,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[bytes]:
+    """Encodes streamed trade results chunk by chunk in the requested format.
+
+    Dependencies with yield are finalized before a streaming response is sent, so
+    the session is opened here and closed once the stream is exhausted. In columnar
+    formats every chunk is written as a record batch or a Parquet row group.
+
+    Args:
+        filter_query (ExportFilterParams): Export query params
+        format (str): Export format
+        encoder (ColumnarEncoder | None): Encoder of columnar formats
+        session_factory (async_sessionmaker[AsyncSession]): Read-only session
+        factory of a replica or of the primary
+
+    Yields:
+        bytes: Encoded chunk of trade results
+    """
+
+    header = True
+    async with session_factory() as session:
+        async for chunk in stream_dynamics(
+            start_date=filter_query.start_date,
+            end_date=filter_query.end_date,
+            oil_id=filter_query.oil_id,
+            delivery_type_id=filter_query.delivery_type_id,
+            delivery_basis_id=filter_query.delivery_basis_id,
+            session=session,
+        ):
+            if encoder is not None:
+                yield encoder.encode(chunk)
+            elif format == "csv":
+                yield encode_csv(chunk, header=header)
+                header = False
+            else:
+                yield encode_ndjson(chunk)
+    if encoder is not None:
+        yield encoder.close()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_trade_results(
+    filter_query: Annotated[ExportFilterParams, Query()],
+    accept: Annotated[str | None, Header()] = None,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(
+        db_connector.get_read_session_factory
+    ),
+) -> StreamingResponse:
+    format = filter_query.format or negotiate_format(accept)
+    encoder = None
+    if format in COLUMNAR_FORMATS:
+        try:
+            encoder = ColumnarEncoder(SpimexTradeResult.__table__, format)
+        except RuntimeError as error:
+            raise HTTPException(status.HTTP_406_NOT_ACCEPTABLE, str(error)) from error
+
+    filename = (
+        f"trade-results_{filter_query.start_date}_{filter_query.end_date}.{format}"
+    )
+
+    return StreamingResponse(
+        export_chunks(filter_query, format, encoder, session_factory),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
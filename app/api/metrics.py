@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from core.metrics import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,104 @@
+"""Compares cache coders on encode and decode time and stored bytes.
+
+Encodes generated "/dynamics" pages, as ORM-like trade results and as pre-encoded
+JSON bodies of the fast JSON path, with "JsonCoder" and "CompactCoder" with and
+without compression.
+
+Usage:
+    python -m benchmarks.cache_coders --limit 1000 --repeat 200
+"""
+
+import argparse
+import datetime
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+from fastapi_cache.coder import Coder, JsonCoder
+from utils import PreEncodedJSONResponse
+
+from core.config import settings
+from core.redis import CompactCoder
+from core.schemas import TradeResultOut
+
+CODERS: dict[str, tuple[type[Coder], int]] = {
+    "json": (JsonCoder, 0),
+    "msgpack": (CompactCoder, 2**63),
+    "msgpack+zstd": (CompactCoder, 0),
+}
+
+
+def generate_page(limit: int) -> list[TradeResultOut]:
+    """Generates a page of trade results like the benchmark database seed."""
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    return [
+        TradeResultOut(
+            id=g,
+            exchange_product_id=f"A{g % 50}B{g % 200}F{g}",
+            exchange_product_name=f"exchange product {g % 50}",
+            oil_id=f"A{g % 50}",
+            delivery_basis_id=f"B{g % 200}",
+            delivery_basis_name=f"delivery basis {g % 200}",
+            delivery_type_id="F" if g % 2 == 0 else "A",
+            volume=g % 1000 + 1,
+            total=(g % 1000 + 1) * 50000,
+            count=g % 10 + 1,
+            date=datetime.date.today() - datetime.timedelta(days=g // 300),
+            created_on=now,
+            updated_on=now,
+        )
+        for g in range(1, limit + 1)
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Measures the average duration of the call in milliseconds."""
+
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def run(limit: int, repeat: int) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        limit (int): Page size
+        repeat (int): The number of measurements
+    """
+
+    page = generate_page(limit)
+    values = {
+        "models": page,
+        "fast-json": PreEncodedJSONResponse(JsonCoder.encode(page)),
+    }
+
+    print(
+        f"{'value':>10} {'coder':>14} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}"
+    )
+    for value_name, value in values.items():
+        for coder_name, (coder, threshold) in CODERS.items():
+            with patch.object(settings.cache, "compression_threshold", threshold):
+                encoded = coder.encode(value)
+                encode_ms = measure(partial(coder.encode, value), repeat)
+                decode_ms = measure(partial(coder.decode, encoded), repeat)
+            print(
+                f"{value_name:>10} {coder_name:>14} {len(encoded):>10} "
+                f"{encode_ms:>10.3f} {decode_ms:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    run(args.limit, args.repeat)
@@ -0,0 +1,89 @@
+"""Compares the legacy query string cache keys with normalized hashed keys.
+
+Generates a mix of requests to the '/dynamics' endpoint where clients pass the same
+filters in different order and with or without default values, and reports the
+number of distinct cache entries, the expected hit rate and the total size of keys.
+
+Usage:
+    python -m benchmarks.cache_keys --requests 100000
+"""
+
+import argparse
+import random
+from urllib.parse import parse_qsl, urlencode
+
+from core.redis import request_key_builder
+from core.schemas import DynamicsFilterParams
+
+NAMESPACE = "main-cache:"
+PATH = "/api/v1/trade-results/dynamics"
+
+
+async def get_dynamics(): ...
+
+
+def legacy_key(query: str) -> str:
+    """Builds the cache key the way the previous key builder did."""
+
+    return ":".join([NAMESPACE, "get", PATH, repr(sorted(parse_qsl(query)))])
+
+
+def normalized_key(query: str) -> str:
+    """Builds the cache key from validated query params."""
+
+    filter_query = DynamicsFilterParams(**dict(parse_qsl(query)))
+
+    return request_key_builder(
+        get_dynamics, NAMESPACE, kwargs={"filter_query": filter_query}
+    )
+
+
+def random_query(rng: random.Random) -> str:
+    """Generates a query string for one of a few popular filter combinations."""
+
+    params = [
+        ("start_date", rng.choice(["2024-01-01", "2024-06-01"])),
+        ("oil_id", rng.choice(["A100", "A592"])),
+    ]
+    if rng.random() < 0.5:
+        params.append(("limit", "10"))
+    if rng.random() < 0.5:
+        params.append(("skip", "0"))
+    rng.shuffle(params)
+
+    return urlencode(params)
+
+
+def report(name: str, keys: list[str]) -> None:
+    """Prints statistics of the cache keys."""
+
+    distinct = set(keys)
+    hit_rate = 1 - len(distinct) / len(keys)
+    key_bytes = sum(len(key.encode()) for key in distinct)
+
+    print(f"{name:>10} {len(distinct):>10} {hit_rate:>10.2%} {key_bytes:>12}")
+
+
+def run(requests: int, seed: int) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        requests (int): The number of generated requests
+        seed (int): Random seed
+    """
+
+    rng = random.Random(seed)
+    queries = [random_query(rng) for _ in range(requests)]
+
+    print(f"{'builder':>10} {'entries':>10} {'hit rate':>10} {'key bytes':>12}")
+    report("legacy", [legacy_key(query) for query in queries])
+    report("hashed", [normalized_key(query) for query in queries])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    run(args.requests, args.seed)
@@ -0,0 +1,107 @@
+"""Compares summing raw trade results with reading daily aggregates for long periods.
+
+Fills the testing database with generated trade results and measures the average
+time of getting daily totals of one oil by streaming raw rows with
+"stream_dynamics" and summing them, and by reading "read_daily_aggregates".
+
+Usage:
+    python -m benchmarks.daily_dynamics --rows 3000000 --days 30 365 1825
+"""
+
+import argparse
+import asyncio
+import datetime
+from collections import Counter
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.api_v1.crud import read_daily_aggregates, stream_dynamics
+from benchmarks.utils import measure, seed_trade_results, test_db_connector
+
+OIL_ID = "A1"
+
+
+async def sum_raw_rows(session: AsyncSession, start_date: datetime.date) -> Counter:
+    """Sums volumes of raw trade results by day and group on the client side.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+        start_date (datetime.date): The start date of the period
+
+    Returns:
+        Counter: Volumes by day and group
+    """
+
+    volumes = Counter()
+    async for chunk in stream_dynamics(
+        start_date=start_date,
+        end_date=datetime.date.today(),
+        oil_id=OIL_ID,
+        delivery_type_id=None,
+        delivery_basis_id=None,
+        session=session,
+    ):
+        for row in chunk:
+            key = (row["date"], row["delivery_basis_id"], row["delivery_type_id"])
+            volumes[key] += row["volume"]
+
+    return volumes
+
+
+async def read_aggregates(session: AsyncSession, start_date: datetime.date) -> None:
+    """Reads daily aggregates of the oil for the period.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+        start_date (datetime.date): The start date of the period
+    """
+
+    await read_daily_aggregates(
+        start_date=start_date,
+        end_date=datetime.date.today(),
+        oil_id=OIL_ID,
+        delivery_type_id=None,
+        delivery_basis_id=None,
+        limit=1_000_000,
+        skip=0,
+        session=session,
+    )
+    session.expunge_all()
+
+
+async def run(rows: int, repeat: int, periods: list[int]) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        rows (int): The number of trade results to generate
+        repeat (int): The number of measurements for each period
+        periods (list[int]): Period lengths in days to measure
+    """
+
+    await seed_trade_results(rows)
+
+    print(f"{'days':>10} {'raw rows, ms':>14} {'aggregates, ms':>16}")
+
+    async with test_db_connector.session_factory() as session:
+        for days in periods:
+            start_date = datetime.date.today() - datetime.timedelta(days=days)
+
+            raw_ms = await measure(partial(sum_raw_rows, session, start_date), repeat)
+            aggregates_ms = await measure(
+                partial(read_aggregates, session, start_date), repeat
+            )
+
+            print(f"{days:>10} {raw_ms:>14.2f} {aggregates_ms:>16.2f}")
+
+    await test_db_connector.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 365, 1825])
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeat, args.days))
@@ -0,0 +1,115 @@
+"""Measures the overhead of recording request metrics.
+
+Sends requests straight to the ASGI application, without a server and a database,
+to a trivial endpoint with and without "MetricsMiddleware", and reports the time
+and memory blocks allocated per request.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import tracemalloc
+from functools import partial
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from benchmarks.utils import measure
+from core.metrics import MetricsMiddleware
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/items/1",
+    "raw_path": b"/items/1",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"test")],
+    "client": ("127.0.0.1", 10000),
+    "server": ("test", 80),
+}
+
+
+def create_app(with_metrics: bool) -> FastAPI:
+    """Creates an application with a trivial endpoint."""
+
+    app = FastAPI()
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware, server_timing=True)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    return app
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None: ...
+
+
+async def call(app: ASGIApp) -> None:
+    """Sends a single request to the application."""
+
+    await app(dict(SCOPE), receive, send)
+
+
+async def send_requests(app: ASGIApp, requests: int) -> None:
+    """Sends requests to the application one by one."""
+
+    for _ in range(requests):
+        await call(app)
+
+
+async def allocated_blocks(app: ASGIApp, requests: int) -> float:
+    """Counts memory blocks left allocated per request after a warm-up."""
+
+    await send_requests(app, requests)
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    await send_requests(app, requests)
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    growth = snapshot_after.compare_to(snapshot_before, "filename")
+
+    return sum(stat.count_diff for stat in growth) / requests
+
+
+async def run(requests: int) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        requests (int): The number of requests per measurement
+    """
+
+    print(f"{'metrics':>8} {'us/request':>12} {'blocks/request':>16}")
+
+    baseline = None
+    for with_metrics in (False, True):
+        app = create_app(with_metrics)
+        batch_ms = await measure(partial(send_requests, app, requests), 3)
+        request_us = batch_ms / requests * 1000
+        blocks = await allocated_blocks(app, requests)
+        overhead = "" if baseline is None else f" (+{request_us - baseline:.1f} us)"
+        baseline = request_us if baseline is None else baseline
+        print(
+            f"{'on' if with_metrics else 'off':>8} {request_us:>12.1f} "
+            f"{blocks:>16.3f}{overhead}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests))
@@ -0,0 +1,104 @@
+"""Compares offset and keyset pagination of trade results at different page depths.
+
+Fills the testing database with generated trade results and measures the average
+time of fetching one page with "read_dynamics" in both pagination modes.
+
+Usage:
+    python -m benchmarks.pagination --rows 3000000 --limit 100
+"""
+
+import argparse
+import asyncio
+import datetime
+from functools import partial
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils import TradeResultCursor
+
+from api.api_v1.crud import read_dynamics
+from benchmarks.utils import measure, seed_trade_results, test_db_connector
+
+
+async def cursor_at_depth(session: AsyncSession, depth: int) -> TradeResultCursor:
+    """Finds the keyset cursor pointing to the record at the given depth.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+        depth (int): The number of records before the page
+
+    Returns:
+        TradeResultCursor: Cursor of the last record before the page
+    """
+
+    row = (
+        await session.execute(
+            text(
+                "SELECT date, id FROM spimex_trading_results "
+                "ORDER BY date DESC, id DESC OFFSET :depth LIMIT 1"
+            ),
+            {"depth": max(depth - 1, 0)},
+        )
+    ).one()
+
+    return TradeResultCursor(row.date, row.id)
+
+
+async def run(rows: int, limit: int, repeat: int, depths: list[int]) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        rows (int): The number of trade results to generate
+        limit (int): Page size
+        repeat (int): The number of measurements for each depth
+        depths (list[int]): Page depths to measure
+    """
+
+    await seed_trade_results(rows)
+
+    print(f"{'depth':>10} {'offset, ms':>12} {'keyset, ms':>12}")
+
+    async with test_db_connector.session_factory() as session:
+        for depth in depths:
+            if depth >= rows:
+                continue
+
+            after = await cursor_at_depth(session, depth) if depth else None
+            page_kwargs = {
+                "start_date": datetime.date.min,
+                "end_date": datetime.date.max,
+                "oil_id": None,
+                "delivery_type_id": None,
+                "delivery_basis_id": None,
+                "limit": limit,
+                "session": session,
+            }
+
+            offset_ms = await measure(
+                partial(read_dynamics, skip=depth, **page_kwargs), repeat
+            )
+            keyset_ms = await measure(
+                partial(read_dynamics, skip=0, keyset=True, after=after, **page_kwargs),
+                repeat,
+            )
+            session.expunge_all()
+
+            print(f"{depth:>10} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+    await test_db_connector.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--depths",
+        type=int,
+        nargs="+",
+        default=[0, 10_000, 100_000, 1_000_000, 2_900_000],
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.limit, args.repeat, args.depths))
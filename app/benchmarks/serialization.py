@@ -0,0 +1,109 @@
+"""Compares throughput of trade results serialization paths.
+
+Fetches pages with "read_dynamics" and encodes them to JSON bytes the way the
+endpoints do: through ORM entities and "TradeResultOut" response model validation,
+or through plain rows encoded straight to JSON.
+
+Usage:
+    python -m benchmarks.serialization --rows 1000000 --limit 1000
+"""
+
+import argparse
+import asyncio
+import datetime
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils import encode_rows
+
+from api.api_v1.crud import read_dynamics
+from benchmarks.utils import measure, seed_trade_results, test_db_connector
+from core.schemas import TradeResultOut
+
+response_adapter = TypeAdapter(list[TradeResultOut])
+
+
+async def orm_path(session: AsyncSession, limit: int) -> bytes:
+    """Fetches ORM entities and serializes them through the response model.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+        limit (int): Page size
+
+    Returns:
+        bytes: Encoded response body
+    """
+
+    trade_results = await read_dynamics(
+        start_date=datetime.date.min,
+        end_date=datetime.date.max,
+        oil_id=None,
+        delivery_type_id=None,
+        delivery_basis_id=None,
+        limit=limit,
+        skip=0,
+        session=session,
+    )
+    validated = response_adapter.validate_python(trade_results, from_attributes=True)
+    body = JSONResponse(response_adapter.dump_python(validated, mode="json")).body
+    session.expunge_all()
+
+    return body
+
+
+async def rows_path(session: AsyncSession, limit: int) -> bytes:
+    """Fetches plain rows and encodes them straight to JSON bytes.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+        limit (int): Page size
+
+    Returns:
+        bytes: Encoded response body
+    """
+
+    trade_results = await read_dynamics(
+        start_date=datetime.date.min,
+        end_date=datetime.date.max,
+        oil_id=None,
+        delivery_type_id=None,
+        delivery_basis_id=None,
+        limit=limit,
+        skip=0,
+        session=session,
+        as_rows=True,
+    )
+
+    return encode_rows(trade_results)
+
+
+async def run(rows: int, limit: int, repeat: int) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        rows (int): The number of trade results to generate
+        limit (int): Page size
+        repeat (int): The number of measurements
+    """
+
+    await seed_trade_results(rows)
+
+    print(f"{'path':>6} {'ms/page':>10} {'rows/sec':>12}")
+
+    async with test_db_connector.session_factory() as session:
+        for name, path in (("orm", orm_path), ("rows", rows_path)):
+            page_ms = await measure(lambda path=path: path(session, limit), repeat)
+            print(f"{name:>6} {page_ms:>10.2f} {limit / page_ms * 1000:>12.0f}")
+
+    await test_db_connector.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.limit, args.repeat))
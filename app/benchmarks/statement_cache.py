@@ -0,0 +1,112 @@
+"""Compares latency of the hot trade results queries with and without prepared
+statements caching.
+
+Runs "read_all_trade_results", "read_last_trading_dates" and "read_dynamics" against
+the testing database directly, without PgBouncer, through connectors in the pooling
+modes the application supports:
+
+    session       statements are cached by asyncpg and Sqlalchemy
+    no-cache      caching is off, what PgBouncer in transaction mode without
+                  prepared statements support requires
+    transaction   unique statement names cached by Sqlalchemy, for PgBouncer with
+                  "max_prepared_statements"
+
+Usage:
+    python -m benchmarks.statement_cache --rows 1000000 --repeat 500
+"""
+
+import argparse
+import asyncio
+import datetime
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.api_v1.crud import (
+    read_all_trade_results,
+    read_dynamics,
+    read_last_trading_dates,
+)
+from benchmarks.utils import measure, seed_trade_results
+from core.config import settings
+from core.models.db_connector import DataBaseConnector
+
+MODES = {
+    "session": {"pool_mode": "session", "statement_cache_size": 100},
+    "no-cache": {"pool_mode": "session", "statement_cache_size": 0},
+    "transaction": {"pool_mode": "transaction", "statement_cache_size": 100},
+}
+
+
+def hot_queries(
+    session: AsyncSession,
+) -> dict[str, Callable[[], Awaitable[Any]]]:
+    """Builds the hot queries with filters the endpoints get most often.
+
+    Args:
+        session (AsyncSession): The async database session's instance
+
+    Returns:
+        dict[str, Callable[[], Awaitable[Any]]]: Queries by name
+    """
+
+    filters = {"oil_id": "A1", "delivery_type_id": None, "delivery_basis_id": None}
+
+    return {
+        "trade-results": partial(
+            read_all_trade_results,
+            **filters,
+            limit=100,
+            skip=0,
+            session=session,
+            as_rows=True,
+        ),
+        "last-dates": partial(read_last_trading_dates, 10, session),
+        "dynamics": partial(
+            read_dynamics,
+            start_date=datetime.date.today() - datetime.timedelta(days=30),
+            end_date=datetime.date.today(),
+            **filters,
+            limit=100,
+            skip=0,
+            session=session,
+            as_rows=True,
+        ),
+    }
+
+
+async def run(rows: int, repeat: int) -> None:
+    """Runs the benchmark and prints results.
+
+    Args:
+        rows (int): The number of trade results to generate
+        repeat (int): The number of measurements
+    """
+
+    await seed_trade_results(rows)
+
+    print(f"{'mode':>12} {'query':>14} {'ms/query':>10}")
+
+    for mode, options in MODES.items():
+        connector = DataBaseConnector(
+            url=settings.test_pg_db.postgres_url.unicode_string(),
+            pool_size=1,
+            max_overflow=0,
+            **options,
+        )
+        async with connector.session_factory() as session:
+            for name, query in hot_queries(session).items():
+                query_ms = await measure(query, repeat)
+                print(f"{mode:>12} {name:>14} {query_ms:>10.3f}")
+        await connector.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeat))
@@ -0,0 +1,93 @@
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import text
+
+from core.config import settings
+from core.models import Base
+from core.models.db_connector import DataBaseConnector
+
+test_db_connector = DataBaseConnector(
+    url=settings.test_pg_db.postgres_url.unicode_string(),
+    pool_size=settings.test_pg_db.pool_size,
+    max_overflow=settings.test_pg_db.max_overflow,
+)
+
+SEED_STATEMENT = text(
+    """
+    INSERT INTO spimex_trading_results (
+        exchange_product_id, exchange_product_name, oil_id, delivery_basis_id,
+        delivery_basis_name, delivery_type_id, volume, total, count, date
+    )
+    SELECT
+        'A' || (g % 50) || 'B' || (g % 200) || 'F' || g,
+        'exchange product ' || (g % 50),
+        'A' || (g % 50),
+        'B' || (g % 200),
+        'delivery basis ' || (g % 200),
+        CASE WHEN g % 2 = 0 THEN 'F' ELSE 'A' END,
+        g % 1000 + 1,
+        (g % 1000 + 1) * 50000,
+        g % 10 + 1,
+        current_date - (g / :rows_per_day)::int
+    FROM generate_series(1, :rows) AS g
+    """
+)
+
+SEED_AGGREGATES_STATEMENT = text(
+    """
+    INSERT INTO spimex_daily_aggregates (
+        date, oil_id, delivery_basis_id, delivery_type_id, volume, total, count
+    )
+    SELECT
+        date, oil_id, delivery_basis_id, delivery_type_id,
+        sum(volume), sum(total), sum(count)
+    FROM spimex_trading_results
+    GROUP BY date, oil_id, delivery_basis_id, delivery_type_id
+    """
+)
+
+
+async def seed_trade_results(rows: int, rows_per_day: int = 300) -> None:
+    """Recreates tables in the testing database and fills them with generated trade
+    results and their daily aggregates.
+
+    Args:
+        rows (int): The number of trade results to generate
+        rows_per_day (int): The number of trade results for each trading day. 300 by
+        default
+    """
+
+    started = time.perf_counter()
+
+    async with test_db_connector.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(SEED_STATEMENT, {"rows": rows, "rows_per_day": rows_per_day})
+        await conn.execute(SEED_AGGREGATES_STATEMENT)
+        await conn.execute(text("ANALYZE spimex_trading_results"))
+        await conn.execute(text("ANALYZE spimex_daily_aggregates"))
+
+    print(f"Seeded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+
+async def measure(func: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Measures the average duration of the coroutine function call after a warm-up
+    call.
+
+    Args:
+        func (Callable[[], Awaitable[Any]]): Coroutine function to measure
+        repeat (int): The number of measurements
+
+    Returns:
+        float: Average duration in milliseconds
+    """
+
+    await func()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await func()
+
+    return (time.perf_counter() - started) / repeat * 1000
@@ -1,4 +1,5 @@
 import datetime
+from typing import Literal
 
 from pydantic import (
     BaseModel,
@@ -56,9 +57,132 @@ class CacheConfig(BaseModel):
 
     Attributes:
         time_cache_expire_to (datetime.time): datetime.time object for cache expiration
+        local_max_entries (int): The maximum number of entries in the in-process cache
+        tier. 1024 by default
+        local_max_bytes (int): The maximum total size of entries in the in-process
+        cache tier in bytes. 32 MiB by default
+        local_max_ttl (int): The maximum time to live of entries in the in-process
+        cache tier in seconds. 60 by default
+        invalidation_channel (str): Redis pub/sub channel to invalidate in-process
+        cache tiers of all workers. "cache-invalidation" by default
+        lock_timeout (float): Expiration of the lock held by the worker loading a
+        missed cache entry and the maximum time other workers wait for it in
+        seconds. 10.0 by default
+        lock_wait_interval (float): Interval of polling cache while waiting for the
+        worker holding the lock in seconds. 0.05 by default
+        stale_ttl (int): Time in seconds expired cache entries are still served while
+        being refreshed in background. 600 by default
+        warm_up_urls (list[str]): Request paths with query string pre-warmed after
+        every cache reset. Empty by default
+        warm_up_top (int): The number of the most requested paths of the previous
+        trading day pre-warmed after the cache reset. 20 by default
+        warm_up_delay (int): Delay of pre-warming after the cache reset in seconds.
+        5 by default
+        warm_up_flush_interval (int): Interval of flushing request counts of a
+        worker to Redis in seconds. 10 by default
+        coder (Literal["json", "compact"]): Coder of trade results entries, "compact"
+        stores msgpack and needs the "compact-cache" extra. "json" by default
+        compression_threshold (int): Size in bytes of "compact" entries compressed
+        with zstd. 1024 by default
+        data_version_key (str): Redis key of the trade results version bumped by
+        ingestion. "main-cache:data-version" by default
+        data_version_refresh_interval (int): Interval of refreshing the trade
+        results version of a worker in seconds. 5 by default
     """
 
     time_cache_expire_to: datetime.time = Field(default="14:11", validate_default=True)
+    local_max_entries: int = 1024
+    local_max_bytes: int = 32 * 1024 * 1024
+    local_max_ttl: int = 60
+    invalidation_channel: str = "cache-invalidation"
+    lock_timeout: float = 10.0
+    lock_wait_interval: float = 0.05
+    stale_ttl: int = 600
+    warm_up_urls: list[str] = []
+    warm_up_top: int = 20
+    warm_up_delay: int = 5
+    warm_up_flush_interval: int = 10
+    coder: Literal["json", "compact"] = "json"
+    compression_threshold: int = 1024
+    data_version_key: str = "main-cache:data-version"
+    data_version_refresh_interval: int = 5
+
+
+class ResponseConfig(BaseModel):
+    """A class for api responses settings.
+
+    Attributes:
+        fast_json (bool): Serve trade results from plain rows encoded straight to
+        JSON bytes, skipping ORM hydration and response model validation. "False"
+        by default
+        compression (list[Literal["br", "gzip"]]): Content codings of cached
+        responses in order of preference, compressed once when a response is cached.
+        ["br", "gzip"] by default, empty to disable
+        compression_minimum_size (int): The minimum size of compressed response bodies
+        in bytes. 500 by default
+    """
+
+    fast_json: bool = False
+    compression: list[Literal["br", "gzip"]] = ["br", "gzip"]
+    compression_minimum_size: int = 500
+
+
+class PartitionConfig(BaseModel):
+    """A class for trade results partitions maintenance settings.
+
+    Attributes:
+        months_ahead (int): The number of monthly partitions created ahead of the
+        current month. 3 by default
+        retention_months (int | None): The number of past months to keep attached,
+        older partitions are detached and renamed to "<name>_detached". None to
+        keep all partitions
+        maintenance_time (datetime.time): Daily time of partitions maintenance in UTC.
+        "00:30" by default
+    """
+
+    months_ahead: int = 3
+    retention_months: int | None = None
+    maintenance_time: datetime.time = Field(default="00:30", validate_default=True)
+
+
+class MetricsConfig(BaseModel):
+    """A class for metrics and sql profiling settings.
+
+    Attributes:
+        enabled (bool): Recording requests metrics and exposing them on "/metrics".
+        True by default
+        server_timing (bool): Adding database time of the request to "Server-Timing"
+        and "X-DB-Time" response headers. True by default
+        slow_query_threshold (float | None): Duration in seconds of queries logged
+        with their parameters and request id. 0.5 by default, None to disable
+        query_sample_rate (float): Share of all queries logged with their duration.
+        0.0 by default
+    """
+
+    enabled: bool = True
+    server_timing: bool = True
+    slow_query_threshold: float | None = 0.5
+    query_sample_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+
+
+class IngestionConfig(BaseModel):
+    """A class for bulletins ingestion settings.
+
+    Attributes:
+        batch_size (int): The number of trade results copied to the staging table and
+        upserted at once. 5000 by default
+        writers (int): The number of concurrent database writers of backfill. Every
+        writer holds a connection of the pool. 4 by default
+        processes (int | None): The number of processes parsing bulletins during
+        backfill. None to use the number of CPUs
+        queue_size (int): The maximum number of parsed bulletins waiting for
+        writers during backfill. 8 by default
+    """
+
+    batch_size: int = 5000
+    writers: int = 4
+    processes: int | None = None
+    queue_size: int = 8
 
 
 class PostgresDBConfig(BaseModel):
@@ -71,16 +195,38 @@ class PostgresDBConfig(BaseModel):
         db_host (str): Host to connect to database
         db_port (int): Port to connect to database
         db_name (str): Database's name to connect
-        echo_sql (bool): Logging sql statesments. "True" by default
-        echo_pool (bool): Logging connection pool information. "True" by default
+        echo_sql (bool): Logging sql statesments. "False" by default, slow queries
+        are logged by the profiling hook instead
+        echo_pool (bool): Logging connection pool information. "False" by default
         pool_size (int): The number of connections to keep open inside the connection
         pool. 40 by default
 
         max_overflow (int): The number of connections to allow in connection pool
         overflow. 10 by default
 
+        replica_hosts (list[str]): Read replicas as "host:port" or "host" to connect
+        with the db port. Empty to read from the primary
+        max_replica_lag (float): The maximum replication lag in seconds to read from a
+        replica. 10.0 by default
+        replica_check_interval (float): Interval of checking replicas health in
+        seconds. 5.0 by default
+
+        pool_mode (Literal["session", "transaction"]): "transaction" when connecting
+        through PgBouncer in transaction pooling mode. "session" by default
+        statement_cache_size (int | None): The number of prepared statements cached
+        per connection. In transaction mode it needs PgBouncer's
+        "max_prepared_statements", 0 disables caching. None for 100 in session mode
+        and 0 in transaction mode
+        direct_host (str | None): The database server as "host:port" or "host" to
+        connect with the db port bypassing PgBouncer. Ingestion keeps its staging
+        table in the connection's session, so in transaction mode it connects only
+        to the direct host. None to connect to the db host
+
     Properties:
         postgres_url (PostgresDsn): Postgres url built from db settings.
+        replica_urls (list[PostgresDsn]): Postgres urls of read replicas.
+        direct_url (PostgresDsn): Postgres url of the direct host, or of the db host
+        if it's not set.
     """
 
     scheme: str = "postgresql+asyncpg"
@@ -89,10 +235,16 @@ class PostgresDBConfig(BaseModel):
     db_host: str
     db_port: int
     db_name: str
-    echo_sql: bool = True
-    echo_pool: bool = True
+    echo_sql: bool = False
+    echo_pool: bool = False
     pool_size: int = 14
     max_overflow: int = 11
+    replica_hosts: list[str] = []
+    max_replica_lag: float = 10.0
+    replica_check_interval: float = 5.0
+    pool_mode: Literal["session", "transaction"] = "session"
+    statement_cache_size: int | None = None
+    direct_host: str | None = None
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_name)s",
@@ -101,6 +253,10 @@ class PostgresDBConfig(BaseModel):
         "pk": "pk_%(table_name)s",
     }
     spimex_trade_result_tablename: str = "spimex_trading_results"
+    spimex_daily_aggregate_tablename: str = "spimex_daily_aggregates"
+    spimex_oil_tablename: str = "spimex_oils"
+    spimex_delivery_basis_tablename: str = "spimex_delivery_bases"
+    spimex_delivery_type_tablename: str = "spimex_delivery_types"
 
     @computed_field
     @property
@@ -114,6 +270,43 @@ class PostgresDBConfig(BaseModel):
             path=self.db_name,
         )
 
+    def build_host_url(self, host_port: str) -> PostgresDsn:
+        """Builds the Postgres url of another server of the database.
+
+        Args:
+            host_port (str): Server as "host:port" or "host" to connect with the db
+            port
+
+        Returns:
+            PostgresDsn: Postgres url of the server
+        """
+
+        host, _, port = host_port.partition(":")
+
+        return MultiHostUrl.build(
+            scheme=self.scheme,
+            username=self.db_user,
+            password=self.db_password,
+            host=host,
+            port=int(port) if port else self.db_port,
+            path=self.db_name,
+        )
+
+    @computed_field
+    @property
+    def replica_urls(self) -> list[PostgresDsn]:
+        return [
+            self.build_host_url(replica_host) for replica_host in self.replica_hosts
+        ]
+
+    @computed_field
+    @property
+    def direct_url(self) -> PostgresDsn:
+        if self.direct_host is None:
+            return self.postgres_url
+
+        return self.build_host_url(self.direct_host)
+
 
 class PostgresTestDBConfig(BaseModel):
     """A class for testing database connection settings.
@@ -240,6 +433,14 @@ class Settings(BaseSettings):
         configuration
 
         cache (CacheConfig): CacheConfig class's instance with settings for cache
+        response (ResponseConfig): ResponseConfig class's instance with settings for
+        api responses
+        ingestion (IngestionConfig): IngestionConfig class's instance with settings
+        for bulletins ingestion
+        partitions (PartitionConfig): PartitionConfig class's instance with settings
+        for trade results partitions maintenance
+        metrics (MetricsConfig): MetricsConfig class's instance with settings for
+        metrics
     """
 
     run: RunConfig
@@ -249,6 +450,10 @@ class Settings(BaseSettings):
     test_pg_db: PostgresTestDBConfig
     redis_cache: RedisConfig
     cache: CacheConfig = CacheConfig()
+    response: ResponseConfig = ResponseConfig()
+    ingestion: IngestionConfig = IngestionConfig()
+    partitions: PartitionConfig = PartitionConfig()
+    metrics: MetricsConfig = MetricsConfig()
 
     model_config = SettingsConfigDict(
         case_sensitive=False,
@@ -5,8 +5,16 @@ from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 
-from core.models import db_connector
-from core.redis import redis_client
+from core.config import settings
+from core.metrics import mark_process_dead
+from core.models import db_connector, partition_maintainer
+from core.redis import (
+    LayeredBackend,
+    cache_warmer,
+    data_version,
+    redis_client,
+    single_flight,
+)
 
 
 @asynccontextmanager
@@ -14,9 +22,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manages the fastapi application's lifespan handling startup and shutdown events.
 
     on startup:
-        1) inits redis for FastAPICache with redis backend
+        1) inits FastAPICache with in-process cache tier in front of redis backend
+        2) starts listening to cache invalidation messages
+        3) enables cross-process locks for cache misses
+        4) reads trade results version and schedules refreshing it
+        5) schedules cache pre-warming after the daily cache reset
+        6) creates upcoming trade results partitions and schedules it daily
+        7) starts checking database read replicas
     on shutdown:
-        1) closes database connection
+        1) stops partitions maintenance, cache pre-warming and data version
+        schedulers
+        2) stops listening to cache invalidation messages
+        3) stops checking read replicas and closes database connections
+        4) removes the worker's gauges from metrics shared by workers
 
     Args:
         app (FastAPI): The FastAPI application instance
@@ -26,8 +44,50 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
 
     redis = redis_client.get_client()
-    FastAPICache.init(RedisBackend(redis), prefix="main-cache")
+    backend = LayeredBackend(
+        RedisBackend(redis),
+        local_max_entries=settings.cache.local_max_entries,
+        local_max_bytes=settings.cache.local_max_bytes,
+        local_max_ttl=settings.cache.local_max_ttl,
+        redis=redis,
+        invalidation_channel=settings.cache.invalidation_channel,
+    )
+    FastAPICache.init(backend, prefix="main-cache")
+    await backend.start()
+    single_flight.init(
+        redis,
+        lock_timeout=settings.cache.lock_timeout,
+        wait_interval=settings.cache.lock_wait_interval,
+    )
+    data_version.init(redis, key=settings.cache.data_version_key)
+    await data_version.refresh()
+    data_version.start(settings.cache.data_version_refresh_interval)
+    cache_warmer.init(
+        app,
+        redis,
+        urls=settings.cache.warm_up_urls,
+        top=settings.cache.warm_up_top,
+    )
+    cache_warmer.start(
+        settings.cache.time_cache_expire_to,
+        delay=settings.cache.warm_up_delay,
+        flush_interval=settings.cache.warm_up_flush_interval,
+    )
+
+    partition_maintainer.start(
+        db_connector.engine,
+        settings.partitions.maintenance_time,
+        months_ahead=settings.partitions.months_ahead,
+        retention_months=settings.partitions.retention_months,
+    )
+    await db_connector.start()
 
     yield
 
+    partition_maintainer.stop()
+    cache_warmer.stop()
+    await cache_warmer.flush()
+    data_version.stop()
+    await backend.stop()
     await db_connector.dispose()
+    mark_process_dead()
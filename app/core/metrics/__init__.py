@@ -0,0 +1,17 @@
+__all__ = (
+    "CONTENT_TYPE",
+    "render",
+    "mark_process_dead",
+    "InstrumentedQueuePool",
+    "instrument_pool",
+    "MetricsMiddleware",
+    "RequestStats",
+    "request_stats",
+    "get_request_id",
+    "instrument_queries",
+)
+
+from .exposition import CONTENT_TYPE, mark_process_dead, render
+from .http import MetricsMiddleware, RequestStats, get_request_id, request_stats
+from .pool import InstrumentedQueuePool, instrument_pool
+from .queries import instrument_queries
@@ -0,0 +1,56 @@
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    disable_created_metrics,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR_VARIABLE = "PROMETHEUS_MULTIPROC_DIR"
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+disable_created_metrics()
+
+
+def is_multiprocess() -> bool:
+    """Returns whether metrics are shared by worker processes.
+
+    Returns:
+        bool: True if "PROMETHEUS_MULTIPROC_DIR" environment variable is set
+    """
+
+    return MULTIPROC_DIR_VARIABLE in os.environ
+
+
+def render() -> bytes:
+    """Renders metrics in Prometheus text format.
+
+    With several workers "PROMETHEUS_MULTIPROC_DIR" must point to an empty directory
+    before workers start. Every worker writes its metrics to files in it, and the
+    scraped worker aggregates files of all workers, so any worker returns metrics
+    of the whole application. Without it metrics of the current process are
+    rendered.
+
+    Returns:
+        bytes: Metrics exposition
+    """
+
+    if not is_multiprocess():
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """Removes gauges of the current worker from aggregated metrics on its
+    shutdown, counters and histograms are kept in totals.
+    """
+
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,179 @@
+import os
+import time
+from contextvars import ContextVar
+
+from prometheus_client import Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+request_latency = Histogram(
+    "http_request_duration_seconds",
+    "Time to send the response",
+    ("method", "route", "status"),
+)
+response_size = Histogram(
+    "http_response_size_bytes",
+    "Size of the response body",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+request_db_time = Histogram(
+    "http_request_db_seconds",
+    "Time of database queries made for the response",
+    ("method", "route"),
+)
+requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "Requests being processed",
+    multiprocess_mode="livesum",
+)
+
+
+class RequestStats:
+    """Id, database time and queries of the current request."""
+
+    __slots__ = ("request_id", "db_time", "queries")
+
+    def __init__(self, request_id: str) -> None:
+        """Inits empty stats of the request.
+
+        Args:
+            request_id (str): Request id
+        """
+
+        self.request_id = request_id
+        self.db_time = 0.0
+        self.queries = 0
+
+
+def get_request_id(scope: Scope) -> str:
+    """Returns the request id passed by the client or a proxy, or a new one.
+
+    Args:
+        scope (Scope): ASGI connection scope
+
+    Returns:
+        str: Request id
+    """
+
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            return value.decode("latin-1")
+
+    return os.urandom(16).hex()
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, response size and database time of
+    requests per route.
+
+    Routes are labeled by their path template, so path parameters do not create new
+    series, and requests not matching any route share the "unmatched" label. Metric
+    children are resolved once per label values and kept by the middleware. Latency
+    and database time are taken when the response body is sent, so background tasks
+    run after the response do not count.
+
+    Every request gets the id from "X-Request-ID" header or a new one, which slow
+    query logs refer to and the response returns. With server timing enabled the
+    response also reports database time spent before it started.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False) -> None:
+        """Inits middleware wrapping the application.
+
+        Args:
+            app (ASGIApp): ASGI application
+            server_timing (bool): Adding "Server-Timing" and "X-DB-Time" headers with
+            database time. False by default
+        """
+
+        self.app = app
+        self.server_timing = server_timing
+        self.children: dict[
+            tuple[str, str, int],
+            tuple[Histogram, Histogram, Histogram],
+        ] = {}
+
+    def get_children(
+        self, method: str, route: str, status: int
+    ) -> tuple[Histogram, Histogram, Histogram]:
+        """Returns metric children of the label values.
+
+        Args:
+            method (str): Request method
+            route (str): Route path template
+            status (int): Response status code
+
+        Returns:
+            tuple[Histogram, Histogram, Histogram]: Latency, response
+            size and database time children
+        """
+
+        key = (method, route, status)
+        children = self.children.get(key)
+        if children is None:
+            children = self.children[key] = (
+                request_latency.labels(method, route, str(status)),
+                response_size.labels(method, route),
+                request_db_time.labels(method, route),
+            )
+
+        return children
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = RequestStats(get_request_id(scope))
+        token = request_stats.set(stats)
+        status = 500
+        size = 0
+        elapsed = None
+        db_time = None
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size, elapsed, db_time
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = message["headers"] = list(message.get("headers", ()))
+                headers.append((b"x-request-id", stats.request_id.encode("latin-1")))
+                if self.server_timing:
+                    db_ms = f"{stats.db_time * 1000:.1f}"
+                    queries = f'desc="{stats.queries} queries"'
+                    headers.append((b"x-db-time", db_ms.encode()))
+                    headers.append(
+                        (b"server-timing", f"db;dur={db_ms};{queries}".encode())
+                    )
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    elapsed = time.perf_counter() - started
+                    db_time = stats.db_time
+            await send(message)
+
+        requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            requests_in_flight.dec()
+            request_stats.reset(token)
+
+            if elapsed is None:
+                elapsed, db_time = time.perf_counter() - started, stats.db_time
+
+            route = scope.get("route")
+            latency, body_size, db = self.get_children(
+                scope["method"], getattr(route, "path", "unmatched"), status
+            )
+            latency.observe(elapsed)
+            body_size.observe(size)
+            db.observe(db_time)
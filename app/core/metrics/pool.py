@@ -0,0 +1,159 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+POOL_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+LIFETIME_BUCKETS = (1.0, 10.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 14400.0, 86400.0)
+
+checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time waiting for a connection from the pool",
+    ("pool",),
+    buckets=POOL_BUCKETS,
+)
+checkout_hold = Histogram(
+    "db_pool_checkout_hold_seconds",
+    "Time a connection is checked out of the pool",
+    ("pool",),
+    buckets=POOL_BUCKETS,
+)
+checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts failed after waiting pool timeout",
+    ("pool",),
+)
+connection_lifetime = Histogram(
+    "db_pool_connection_lifetime_seconds",
+    "Lifetime of closed database connections",
+    ("pool",),
+    buckets=LIFETIME_BUCKETS,
+)
+connections_opened = Counter(
+    "db_pool_connections_opened_total", "Database connections opened", ("pool",)
+)
+connections_invalidated = Counter(
+    "db_pool_connections_invalidated_total",
+    "Database connections invalidated after errors",
+    ("pool",),
+)
+# Gauges of live workers are summed, so they show totals of all workers' pools
+in_use = Gauge(
+    "db_pool_connections_in_use",
+    "Connections checked out of the pool",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+idle = Gauge(
+    "db_pool_connections_idle",
+    "Connections idle in the pool",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+overflow = Gauge(
+    "db_pool_overflow",
+    "Connections over pool size, negative while the pool is not filled",
+    ("pool",),
+    multiprocess_mode="livesum",
+)
+size = Gauge(
+    "db_pool_size", "Configured pool size", ("pool",), multiprocess_mode="livesum"
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool timing checkout waits.
+
+    Pool events fire after a connection is got, so the wait for a free connection is
+    measured around getting it from the queue. Metrics are set by instrument_pool and
+    kept when the pool is recreated by disposing the engine.
+    """
+
+    metrics_wait: Histogram | None = None
+    metrics_timeouts: Counter | None = None
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics_wait = self.metrics_wait
+        pool.metrics_timeouts = self.metrics_timeouts
+
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if self.metrics_wait is None:
+            return super()._do_get()
+
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics_timeouts.inc()
+            raise
+        finally:
+            self.metrics_wait.observe(time.perf_counter() - started)
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> None:
+    """Records metrics of the engine's connection pool.
+
+    Metrics are updated by pool events, gauges are set to the current pool's state
+    on every event, as gauges reading the pool on scraping can't be shared by
+    worker processes. Children of metrics are resolved once here, so events do not
+    look up labels.
+
+    Args:
+        engine (AsyncEngine): Sqlalchemy async engine created with
+        InstrumentedQueuePool
+        name (str): Pool label value
+    """
+
+    pool = engine.pool
+    pool.metrics_wait = checkout_wait.labels(name)
+    pool.metrics_timeouts = checkout_timeouts.labels(name)
+    hold = checkout_hold.labels(name)
+    lifetime = connection_lifetime.labels(name)
+    opened = connections_opened.labels(name)
+    invalidated = connections_invalidated.labels(name)
+    pool_in_use = in_use.labels(name)
+    pool_idle = idle.labels(name)
+    pool_overflow = overflow.labels(name)
+
+    def set_gauges() -> None:
+        pool_in_use.set(engine.pool.checkedout())
+        pool_idle.set(engine.pool.checkedin())
+        pool_overflow.set(engine.pool.overflow())
+
+    size.labels(name).set(pool.size())
+    set_gauges()
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        connection_record.info["connected_at"] = time.perf_counter()
+        opened.inc()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        set_gauges()
+
+    def on_checkin(dbapi_connection, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            hold.observe(time.perf_counter() - checked_out_at)
+        set_gauges()
+
+    def on_close(dbapi_connection, connection_record) -> None:
+        connected_at = connection_record.info.get("connected_at")
+        if connected_at is not None:
+            lifetime.observe(time.perf_counter() - connected_at)
+        set_gauges()
+
+    def on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        invalidated.inc()
+        set_gauges()
+
+    event.listen(pool, "connect", on_connect)
+    event.listen(pool, "checkout", on_checkout)
+    event.listen(pool, "checkin", on_checkin)
+    event.listen(pool, "close", on_close)
+    event.listen(pool, "invalidate", on_invalidate)
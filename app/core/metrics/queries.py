@@ -0,0 +1,82 @@
+import logging
+import random
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .http import request_stats
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_LENGTH = 1000
+
+
+def shorten(value: object) -> str:
+    """Returns the value's repr cut to the logged length.
+
+    Args:
+        value (object): Statement or its parameters
+
+    Returns:
+        str: Shortened repr
+    """
+
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) > MAX_LOGGED_LENGTH:
+        return f"{text[:MAX_LOGGED_LENGTH]}... ({len(text)} chars)"
+
+    return text
+
+
+def instrument_queries(
+    engine: AsyncEngine,
+    slow_query_threshold: float | None = None,
+    sample_rate: float = 0.0,
+) -> None:
+    """Profiles the engine's queries.
+
+    Query time is added to stats of the current request. Queries slower than the
+    threshold are logged as warnings with their parameters and the request id, and
+    a sampled share of all queries is logged with their duration. Statements are
+    formatted only when logged.
+
+    Args:
+        engine (AsyncEngine): Sqlalchemy async engine
+        slow_query_threshold (float | None): Duration of logged slow queries in
+        seconds. None to not log slow queries
+        sample_rate (float): Share of logged queries. 0.0 by default
+    """
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        context.query_started = time.perf_counter()
+
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        elapsed = time.perf_counter() - context.query_started
+        stats = request_stats.get()
+        if stats is not None:
+            stats.db_time += elapsed
+            stats.queries += 1
+
+        if slow_query_threshold is not None and elapsed >= slow_query_threshold:
+            logger.warning(
+                "Slow query took %.1f ms, request %s: %s parameters %s",
+                elapsed * 1000,
+                stats.request_id if stats is not None else None,
+                shorten(statement),
+                shorten(parameters),
+            )
+        elif sample_rate and random.random() < sample_rate:
+            logger.info(
+                "Query took %.1f ms, request %s: %s",
+                elapsed * 1000,
+                stats.request_id if stats is not None else None,
+                shorten(statement),
+            )
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
@@ -1,5 +1,19 @@
-__all__ = ("db_connector", "Base", "SpimexTradeResult")
+__all__ = (
+    "db_connector",
+    "Base",
+    "TimestampedBase",
+    "SpimexTradeResult",
+    "SpimexDailyAggregate",
+    "SpimexOil",
+    "SpimexDeliveryBasis",
+    "SpimexDeliveryType",
+    "maintain_partitions",
+    "partition_maintainer",
+)
 
-from .base import Base
+from .base import Base, TimestampedBase
+from .daily_aggregate import SpimexDailyAggregate
 from .db_connector import db_connector
+from .dictionaries import SpimexDeliveryBasis, SpimexDeliveryType, SpimexOil
+from .partitions import maintain_partitions, partition_maintainer
 from .trade_result import SpimexTradeResult
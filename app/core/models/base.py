@@ -7,11 +7,10 @@ from sqlalchemy.sql.expression import text
 from core.config import settings
 
 
-class Base(DeclarativeBase):
-    """Base abstract class for for SQLAlchemy ORM models.
+class TimestampedBase(DeclarativeBase):
+    """Base abstract class for SQLAlchemy ORM models keyed by natural keys.
 
     Attributes:
-        id (int): Primary key
         created_at (datetime): Timestamp indicating when the record was created
         updated_at (datetime): Timestamp indicating when the record was last updated
     """
@@ -22,10 +21,23 @@ class Base(DeclarativeBase):
         naming_convention=settings.main_pg_db.naming_convention,
     )
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     created_on: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("now()")
     )
     updated_on: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("now()"), onupdate=text("now()")
     )
+
+
+class Base(TimestampedBase):
+    """Base abstract class for for SQLAlchemy ORM models.
+
+    Attributes:
+        id (int): Primary key
+        created_at (datetime): Timestamp indicating when the record was created
+        updated_at (datetime): Timestamp indicating when the record was last updated
+    """
+
+    __abstract__ = True
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
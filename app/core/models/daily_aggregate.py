@@ -0,0 +1,41 @@
+import datetime
+
+from sqlalchemy import BigInteger, Date, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.config import settings
+
+from .base import Base
+
+
+class SpimexDailyAggregate(Base):
+    """A class to represent daily totals of SPIMEX trade results by oil, delivery
+    basis and delivery type.
+
+    The table is a rollup of "SpimexTradeResult" refreshed for the trading days of
+    every ingested batch, so dynamics over long periods are read from one row per
+    day and group instead of raw trade results.
+
+    Attributes:
+        date (datetime.date): The date of the trades
+        oil_id (str): The identifier for the type of oil traded
+        delivery_basis_id (str): The identifier for the delivery basis
+        delivery_type_id (str): The identifier for the type of delivery
+        volume (int): Total volume of the trades
+        total (int): Total value of the trades in monetary units
+        count (int): Total number of transactions
+    """
+
+    __tablename__ = settings.main_pg_db.spimex_daily_aggregate_tablename
+    __table_args__ = (
+        UniqueConstraint("date", "oil_id", "delivery_basis_id", "delivery_type_id"),
+        Index(f"ix_{__tablename__}_oil_id_date", "oil_id", "date"),
+    )
+
+    date: Mapped[datetime.date] = mapped_column(Date)
+    oil_id: Mapped[str]
+    delivery_basis_id: Mapped[str]
+    delivery_type_id: Mapped[str]
+    volume: Mapped[int] = mapped_column(BigInteger)
+    total: Mapped[int] = mapped_column(BigInteger)
+    count: Mapped[int] = mapped_column(BigInteger)
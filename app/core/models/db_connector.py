@@ -1,5 +1,11 @@
+import asyncio
+import itertools
+import logging
+import uuid
 from collections.abc import AsyncGenerator
+from typing import Any, Literal
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,10 +14,137 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from core.config import settings
+from core.metrics import InstrumentedQueuePool, instrument_pool, instrument_queries
+
+logger = logging.getLogger(__name__)
+
+# Replay lag is zero while the replica has replayed all received WAL, otherwise an
+# idle primary would make the replica look lagging
+REPLICA_LAG_STATEMENT = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+def get_pool_name(engine: AsyncEngine) -> str:
+    """Returns the pool label of the engine.
+
+    Args:
+        engine (AsyncEngine): Sqlalchemy async engine
+
+    Returns:
+        str: Database host and port
+    """
+
+    return f"{engine.url.host}:{engine.url.port}"
+
+
+def get_statement_name() -> str:
+    """Returns a unique prepared statement name.
+
+    PgBouncer in transaction mode passes connections' statements to different
+    server connections, so names of asyncpg's counter collide there.
+
+    Returns:
+        str: Prepared statement name
+    """
+
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def get_connect_args(
+    pool_mode: Literal["session", "transaction"], statement_cache_size: int | None
+) -> dict[str, Any]:
+    """Returns asyncpg connect arguments for the pooling mode.
+
+    In session mode asyncpg and Sqlalchemy cache prepared statements as usual. In
+    transaction mode asyncpg's own cache is off and statements prepared by
+    Sqlalchemy get unique names, they are reused only with PgBouncer tracking
+    prepared statements ("max_prepared_statements" > 0), so the cache is off unless
+    its size is set explicitly.
+
+    Args:
+        pool_mode (Literal["session", "transaction"]): Pooling mode of the server
+        statement_cache_size (int | None): The number of prepared statements cached
+        per connection. None for 100 in session mode and 0 in transaction mode
+
+    Returns:
+        dict[str, Any]: Connect arguments
+    """
+
+    if pool_mode == "transaction":
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": statement_cache_size or 0,
+            "prepared_statement_name_func": get_statement_name,
+        }
+
+    if statement_cache_size is None:
+        statement_cache_size = 100
+
+    return {
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+
+
+async def read_replica_lag(engine: AsyncEngine) -> Any:
+    """Reads the replication lag of the replica.
+
+    Args:
+        engine (AsyncEngine): Engine of the replica
+
+    Returns:
+        Any: Replication lag in seconds or None if the replica is not replaying
+    """
+
+    async with engine.connect() as conn:
+        return await conn.scalar(REPLICA_LAG_STATEMENT)
+
+
+class Replica:
+    """A class to hold read replica's engine and its health."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Inits replica as healthy until the first check.
+
+        Args:
+            engine (AsyncEngine): Sqlalchemy async engine of the replica
+        """
+
+        self.engine = engine
+        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
+        self.healthy = True
+        self.lag: float | None = None
+
+    @property
+    def load(self) -> int:
+        """The number of connections checked out of the replica's pool."""
+
+        return self.engine.pool.checkedout()
 
 
 class DataBaseConnector:
-    """A class to manage connection to database using SQLAlchemy async engine."""
+    """A class to manage connection to database using SQLAlchemy async engine.
+
+    Connection pools of all engines are instrumented, their metrics are labeled by
+    database host and port. Queries of all engines count to the current request's
+    database time, slow ones are logged.
+
+    Writes go to the primary engine. Read sessions go to the least loaded healthy
+    replica, replicas equally loaded take turns. Replicas are checked in the
+    background and those unreachable or lagging behind more than the allowed lag are
+    skipped, reads fall back to the primary when no replica is healthy.
+    """
 
     def __init__(
         self,
@@ -20,6 +153,13 @@ class DataBaseConnector:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        replica_urls: list[str] | None = None,
+        max_replica_lag: float = 10.0,
+        check_interval: float = 5.0,
+        slow_query_threshold: float | None = None,
+        query_sample_rate: float = 0.0,
+        pool_mode: Literal["session", "transaction"] = "session",
+        statement_cache_size: int | None = None,
     ) -> None:
         """Inits the database connector with given parameters.
 
@@ -31,26 +171,140 @@ class DataBaseConnector:
             connection pool. 5 by default
             max_overflow (int): The number of connections to allow in connection pool
             overflow. 10 by default
+            replica_urls (list[str] | None): Urls to connect read replicas. None to
+            read from the primary
+            max_replica_lag (float): The maximum replication lag of a healthy replica
+            in seconds. 10.0 by default
+            check_interval (float): Interval of checking replicas in seconds. 5.0 by
+            default
+            slow_query_threshold (float | None): Duration of logged slow queries in
+            seconds. None to not log slow queries
+            query_sample_rate (float): Share of logged queries. 0.0 by default
+            pool_mode (Literal["session", "transaction"]): "transaction" when
+            connecting through PgBouncer in transaction pooling mode. "session" by
+            default
+            statement_cache_size (int | None): The number of prepared statements
+            cached per connection. None for 100 in session mode and 0 in transaction
+            mode
         """
 
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-        )
+        engine_options = {
+            "echo": echo,
+            "echo_pool": echo_pool,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "poolclass": InstrumentedQueuePool,
+            "connect_args": get_connect_args(pool_mode, statement_cache_size),
+        }
+        self.engine: AsyncEngine = create_async_engine(url=url, **engine_options)
+        instrument_pool(self.engine, get_pool_name(self.engine))
+        instrument_queries(self.engine, slow_query_threshold, query_sample_rate)
         self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             bind=self.engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
+        self.read_session_factory: async_sessionmaker[AsyncSession] = (
+            async_sessionmaker(
+                bind=self.engine.execution_options(postgresql_readonly=True),
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+            )
+        )
+        self.replicas = []
+        for replica_url in replica_urls or []:
+            replica_engine = create_async_engine(url=replica_url, **engine_options)
+            instrument_pool(replica_engine, get_pool_name(replica_engine))
+            instrument_queries(replica_engine, slow_query_threshold, query_sample_rate)
+            self.replicas.append(
+                Replica(replica_engine.execution_options(postgresql_readonly=True))
+            )
+        self.max_replica_lag = max_replica_lag
+        self.check_interval = check_interval
+        self.turns = itertools.count()
+        self.checker: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Starts checking replicas if any."""
+
+        if self.replicas and self.checker is None:
+            self.checker = asyncio.create_task(self.check_replicas())
+
+    async def stop(self) -> None:
+        """Stops checking replicas."""
+
+        if self.checker is not None:
+            self.checker.cancel()
+            try:
+                await self.checker
+            except asyncio.CancelledError:
+                pass
+            self.checker = None
 
     async def dispose(self) -> None:
-        """Closes engine connection to the database."""
+        """Stops checking replicas and closes engines connections to the databases."""
 
+        await self.stop()
         await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def check_replica(self, replica: Replica) -> None:
+        """Updates the replica's health by its replication lag.
+
+        Connecting and the lag query share one timeout, so a replica that is not
+        accepting connections is marked unhealthy within the check interval.
+
+        Args:
+            replica (Replica): Replica to check
+        """
+
+        try:
+            lag = await asyncio.wait_for(
+                read_replica_lag(replica.engine), timeout=self.check_interval
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if replica.healthy:
+                logger.warning("Replica '%s' is unreachable", replica.engine.url)
+            replica.healthy = False
+            replica.lag = None
+            return
+
+        replica.lag = float(lag) if lag is not None else None
+        healthy = replica.lag is not None and replica.lag <= self.max_replica_lag
+        if replica.healthy and not healthy:
+            logger.warning(
+                "Replica '%s' is lagging by %s seconds", replica.engine.url, replica.lag
+            )
+        replica.healthy = healthy
+
+    async def check_replicas(self) -> None:
+        """Checks replicas every check interval."""
+
+        while True:
+            await asyncio.gather(
+                *(self.check_replica(replica) for replica in self.replicas)
+            )
+            await asyncio.sleep(self.check_interval)
+
+    def get_replica(self) -> Replica | None:
+        """Picks the least loaded healthy replica.
+
+        Returns:
+            Replica | None: Replica to read from. None if no replica is healthy
+        """
+
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+
+        turn = next(self.turns) % len(healthy)
+
+        return min(healthy[turn:] + healthy[:turn], key=lambda replica: replica.load)
 
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Provides an async database session.
@@ -62,6 +316,33 @@ class DataBaseConnector:
         async with self.session_factory() as session:
             yield session
 
+    def get_read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Picks the read-only session factory of the least loaded healthy replica.
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Session factory of a healthy replica or
+            of the primary
+        """
+
+        replica = self.get_replica()
+
+        return (
+            replica.session_factory
+            if replica is not None
+            else self.read_session_factory
+        )
+
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Provides a read-only async database session routed to a replica.
+
+        Yields:
+            AsyncSession: An active read-only async database session of a healthy
+            replica or of the primary
+        """
+
+        async with self.get_read_session_factory()() as session:
+            yield session
+
 
 db_connector = DataBaseConnector(
     url=settings.main_pg_db.postgres_url.unicode_string(),
@@ -69,4 +350,11 @@ db_connector = DataBaseConnector(
     echo_pool=settings.main_pg_db.echo_pool,
     pool_size=settings.main_pg_db.pool_size,
     max_overflow=settings.main_pg_db.max_overflow,
+    replica_urls=[url.unicode_string() for url in settings.main_pg_db.replica_urls],
+    max_replica_lag=settings.main_pg_db.max_replica_lag,
+    check_interval=settings.main_pg_db.replica_check_interval,
+    slow_query_threshold=settings.metrics.slow_query_threshold,
+    query_sample_rate=settings.metrics.query_sample_rate,
+    pool_mode=settings.main_pg_db.pool_mode,
+    statement_cache_size=settings.main_pg_db.statement_cache_size,
 )
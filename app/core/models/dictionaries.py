@@ -0,0 +1,53 @@
+import datetime
+
+from sqlalchemy import Date
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.config import settings
+
+from .base import TimestampedBase
+
+
+class SpimexOil(TimestampedBase):
+    """A class to represent the dictionary of traded oil types.
+
+    Dictionaries are keyed by the identifiers trade results carry, they only list
+    values for lookups.
+
+    Attributes:
+        oil_id (str): The identifier for the type of oil traded
+    """
+
+    __tablename__ = settings.main_pg_db.spimex_oil_tablename
+
+    oil_id: Mapped[str] = mapped_column(primary_key=True)
+
+
+class SpimexDeliveryBasis(TimestampedBase):
+    """A class to represent the dictionary of delivery bases.
+
+    Attributes:
+        delivery_basis_id (str): The identifier for the delivery basis
+        delivery_basis_name (str): The name of the delivery basis from the latest
+        trading day
+        last_seen_date (datetime.date): The latest trading day of the delivery basis,
+        older bulletins ingested later don't change its name
+    """
+
+    __tablename__ = settings.main_pg_db.spimex_delivery_basis_tablename
+
+    delivery_basis_id: Mapped[str] = mapped_column(primary_key=True)
+    delivery_basis_name: Mapped[str]
+    last_seen_date: Mapped[datetime.date] = mapped_column(Date)
+
+
+class SpimexDeliveryType(TimestampedBase):
+    """A class to represent the dictionary of delivery types.
+
+    Attributes:
+        delivery_type_id (str): The identifier for the type of delivery
+    """
+
+    __tablename__ = settings.main_pg_db.spimex_delivery_type_tablename
+
+    delivery_type_id: Mapped[str] = mapped_column(primary_key=True)
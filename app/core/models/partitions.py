@@ -0,0 +1,235 @@
+import datetime
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from .trade_result import SpimexTradeResult
+
+logger = logging.getLogger(__name__)
+
+TABLE = SpimexTradeResult.__tablename__
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+LOCK_STATEMENT = text("SELECT pg_try_advisory_xact_lock(hashtext(:table))")
+PARTITIONS_STATEMENT = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = :table
+    """
+)
+DEFAULT_MONTHS_STATEMENT = text(
+    f"SELECT DISTINCT date_trunc('month', date)::date FROM {DEFAULT_PARTITION}"
+)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    """Shifts the first day of the month by the number of months.
+
+    Args:
+        month (datetime.date): The first day of the month
+        months (int): The number of months to shift by, negative to shift back
+
+    Returns:
+        datetime.date: The first day of the shifted month
+    """
+
+    index = month.year * 12 + month.month - 1 + months
+
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def detached_name(name: str) -> str:
+    """Returns the name a partition is renamed to when it is detached, so a new
+    partition of the same month can be created again.
+
+    Args:
+        name (str): Partition name
+
+    Returns:
+        str: Detached partition name like "spimex_trading_results_y2024m11_detached"
+    """
+
+    return f"{name}_detached"
+
+
+def partition_name(month: datetime.date) -> str:
+    """Returns the name of the monthly partition of trade results.
+
+    Args:
+        month (datetime.date): The first day of the month
+
+    Returns:
+        str: Partition name like "spimex_trading_results_y2024m11"
+    """
+
+    return f"{TABLE}_y{month.year}m{month.month:02d}"
+
+
+async def create_partition(conn: AsyncConnection, month: datetime.date) -> None:
+    """Creates the monthly partition moving its rows out of the default partition.
+
+    Args:
+        conn (AsyncConnection): Sqlalchemy async connection within a transaction
+        month (datetime.date): The first day of the month
+    """
+
+    name = partition_name(month)
+    bounds = {"start": month, "end": add_months(month, 1)}
+
+    await conn.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE date >= :start AND date < :end RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    await conn.execute(
+        text(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+        )
+    )
+
+
+async def maintain_partitions(
+    engine: AsyncEngine,
+    months_ahead: int = 3,
+    retention_months: int | None = None,
+) -> list[str]:
+    """Creates monthly partitions of trade results ahead of time and detaches
+    expired ones.
+
+    Partitions are created from the current month to "months_ahead" months ahead,
+    and for months of rows that fell to the default partition, e.g. loaded by a
+    backfill. Partitions older than "retention_months" are detached and renamed
+    to "<name>_detached", rows of such months stay in the default partition.
+
+    Every worker runs maintenance, but only the one holding the advisory lock
+    changes partitions, others skip it until the next run.
+
+    Args:
+        engine (AsyncEngine): Sqlalchemy async engine
+        months_ahead (int): The number of months to create partitions ahead. 3 by
+        default
+        retention_months (int | None): The number of months to keep attached. None
+        to keep all partitions
+
+    Returns:
+        list[str]: Names of created partitions
+    """
+
+    current_month = datetime.date.today().replace(day=1)
+    oldest_kept_month = (
+        add_months(current_month, -retention_months)
+        if retention_months is not None
+        else None
+    )
+    created = []
+
+    async with engine.begin() as conn:
+        if not await conn.scalar(LOCK_STATEMENT, {"table": TABLE}):
+            logger.info("Partitions are maintained by another worker, skipping")
+            return created
+
+        partitions = set(await conn.scalars(PARTITIONS_STATEMENT, {"table": TABLE}))
+        months = {
+            add_months(current_month, months) for months in range(months_ahead + 1)
+        }
+        for month in await conn.scalars(DEFAULT_MONTHS_STATEMENT):
+            if oldest_kept_month is None or month >= oldest_kept_month:
+                months.add(month)
+            else:
+                logger.warning(
+                    "Rows of expired month %s are kept in the default partition",
+                    month.strftime("%Y-%m"),
+                )
+
+        for month in sorted(months):
+            if partition_name(month) not in partitions:
+                await create_partition(conn, month)
+                created.append(partition_name(month))
+
+        if oldest_kept_month is not None:
+            oldest_kept = partition_name(oldest_kept_month)
+            for name in sorted(partitions):
+                if name != DEFAULT_PARTITION and name < oldest_kept:
+                    await conn.execute(
+                        text(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+                    )
+                    await conn.execute(
+                        text(f"ALTER TABLE {name} RENAME TO {detached_name(name)}")
+                    )
+                    logger.info("Detached partition '%s'", name)
+
+    if created:
+        logger.info("Created partitions %s", ", ".join(created))
+
+    return created
+
+
+class PartitionMaintainer:
+    """A class to maintain trade results partitions on schedule."""
+
+    def __init__(self) -> None:
+        """Inits partition maintainer without scheduler."""
+
+        self.scheduler: AsyncIOScheduler | None = None
+
+    def start(
+        self,
+        engine: AsyncEngine,
+        run_time: datetime.time,
+        months_ahead: int = 3,
+        retention_months: int | None = None,
+    ) -> None:
+        """Maintains partitions right away and schedules it daily.
+
+        Args:
+            engine (AsyncEngine): Sqlalchemy async engine
+            run_time (datetime.time): Daily maintenance time in UTC
+            months_ahead (int): The number of months to create partitions ahead. 3 by
+            default
+            retention_months (int | None): The number of months to keep attached. None
+            to keep all partitions
+        """
+
+        self.scheduler = AsyncIOScheduler(timezone=datetime.timezone.utc)
+        self.scheduler.add_job(
+            maintain_partitions,
+            CronTrigger(
+                hour=run_time.hour,
+                minute=run_time.minute,
+                second=run_time.second,
+                timezone=datetime.timezone.utc,
+            ),
+            args=(engine,),
+            kwargs={"months_ahead": months_ahead, "retention_months": retention_months},
+            id="partitions-maintenance",
+            next_run_time=datetime.datetime.now(datetime.timezone.utc),
+            misfire_grace_time=None,
+            coalesce=True,
+        )
+        self.scheduler.start()
+
+    def stop(self) -> None:
+        """Stops the scheduler."""
+
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+
+partition_maintainer = PartitionMaintainer()
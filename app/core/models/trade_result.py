@@ -1,6 +1,6 @@
 import datetime
 
-from sqlalchemy import Date
+from sqlalchemy import DDL, Date, Index, UniqueConstraint, event
 from sqlalchemy.orm import Mapped, mapped_column
 
 from core.config import settings
@@ -22,9 +22,53 @@ class SpimexTradeResult(Base):
         total (int): The total value of the trade in monetary units
         count (int): The number of transactions in the trade
         date (datetime.date): The date of the trade
+
+    Indexes match filter combinations of trade results queries: equality filters go
+    first and (date, id) last, so date ranges and pagination are served by the same
+    index. The (date, id) index covers columns summed into daily aggregates, so they
+    are refreshed by index-only scans. An exchange product is traded once a day, so
+    (exchange_product_id, date) is the natural key bulletins are upserted by.
+
+    The table is partitioned by month on date, so date ranges are pruned to their
+    partitions. The primary key includes date as partition keys must be part of
+    unique constraints. Rows outside of created partitions fall to the default
+    partition.
     """
 
     __tablename__ = settings.main_pg_db.spimex_trade_result_tablename
+    __table_args__ = (
+        UniqueConstraint("exchange_product_id", "date"),
+        Index(
+            f"ix_{__tablename__}_date_id",
+            "date",
+            "id",
+            postgresql_include=[
+                "oil_id",
+                "delivery_basis_id",
+                "delivery_type_id",
+                "volume",
+                "total",
+                "count",
+            ],
+        ),
+        Index(
+            f"ix_{__tablename__}_oil_id_basis_id_type_id_date_id",
+            "oil_id",
+            "delivery_basis_id",
+            "delivery_type_id",
+            "date",
+            "id",
+        ),
+        Index(
+            f"ix_{__tablename__}_basis_id_type_id_date_id",
+            "delivery_basis_id",
+            "delivery_type_id",
+            "date",
+            "id",
+        ),
+        Index(f"ix_{__tablename__}_type_id_date_id", "delivery_type_id", "date", "id"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
 
     exchange_product_id: Mapped[str]
     exchange_product_name: Mapped[str]
@@ -35,4 +79,14 @@ class SpimexTradeResult(Base):
     volume: Mapped[int]
     total: Mapped[int]
     count: Mapped[int]
-    date: Mapped[datetime.date] = mapped_column(Date)
+    date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+
+
+event.listen(
+    SpimexTradeResult.__table__,
+    "after_create",
+    DDL(
+        f"CREATE TABLE {SpimexTradeResult.__tablename__}_default "
+        f"PARTITION OF {SpimexTradeResult.__tablename__} DEFAULT"
+    ),
+)
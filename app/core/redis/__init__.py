@@ -1,4 +1,20 @@
-__all__ = ("request_key_builder", "redis_client")
+__all__ = (
+    "cache",
+    "request_key_builder",
+    "redis_client",
+    "single_flight",
+    "cache_warmer",
+    "data_version",
+    "LayeredBackend",
+    "CompactCoder",
+    "get_coder",
+)
 
+from .cache_decorator import cache
+from .cache_warmer import cache_warmer
+from .coders import CompactCoder, get_coder
+from .data_version import data_version
+from .layered_backend import LayeredBackend
 from .redis_cache import redis_client
 from .request_key_builder import request_key_builder
+from .single_flight import single_flight
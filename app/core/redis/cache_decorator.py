@@ -0,0 +1,575 @@
+import asyncio
+import datetime
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import partial, wraps
+from inspect import Parameter, isawaitable, signature
+from typing import Any
+
+from fastapi import BackgroundTasks, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi_cache import FastAPICache
+from fastapi_cache.coder import Coder
+from fastapi_cache.types import Backend, KeyBuilder
+from prometheus_client import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_304_NOT_MODIFIED
+from utils import (
+    calculate_cache_expiration,
+    compress,
+    get_cache_generation,
+    negotiate_encoding,
+)
+
+from core.config import settings
+from core.models import db_connector
+
+from .cache_warmer import cache_warmer
+from .data_version import data_version
+from .single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+cache_requests = Counter(
+    "cache_requests_total",
+    "Cached endpoints' requests by cache status",
+    ("namespace", "status"),
+)
+
+MARKER_DELIMITER = b"\n"
+
+INJECTED_REQUEST = Parameter(
+    "cache_request", kind=Parameter.KEYWORD_ONLY, annotation=Request
+)
+INJECTED_RESPONSE = Parameter(
+    "cache_response", kind=Parameter.KEYWORD_ONLY, annotation=Response
+)
+INJECTED_BACKGROUND_TASKS = Parameter(
+    "cache_background_tasks", kind=Parameter.KEYWORD_ONLY, annotation=BackgroundTasks
+)
+
+
+def is_cacheable(request: Request) -> bool:
+    """Checks whether the response to the request can be taken from and stored to
+    cache.
+
+    Args:
+        request (Request): Fastapi request object
+
+    Returns:
+        bool: True if cache is enabled, it is a GET request and the client doesn't
+        forbid storing it
+    """
+
+    return (
+        FastAPICache.get_enable()
+        and request.method == "GET"
+        and request.headers.get("Cache-Control") != "no-store"
+    )
+
+
+def get_etag(cache_key: str, version: int, encoding: str | None = None) -> str:
+    """Returns the strong ETag of the response cached by the key.
+
+    Cache keys carry the trading day generation and the digest of endpoint's params,
+    along with the version of the data the ETag is known before the entry is read
+    and changes with either of them. Compressed responses are other representations
+    and get their content coding appended.
+
+    Args:
+        cache_key (str): Cache key
+        version (int): Data version of the response
+        encoding (str | None): Content coding of the response. None by default
+
+    Returns:
+        str: Quoted ETag
+    """
+
+    digest = hashlib.blake2b(
+        f"{cache_key}:{version}".encode(), digest_size=16
+    ).hexdigest()
+
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def get_last_modified(
+    generation: str, modified: datetime.datetime | None = None
+) -> datetime.datetime:
+    """Returns the moment data of the cache generation were published: its cache
+    reset time or the last load of trade results if it is later.
+
+    Args:
+        generation (str): Cache generation
+        modified (datetime.datetime | None): Moment of the last load of trade
+        results. None if unknown
+
+    Returns:
+        datetime.datetime: Last modification moment in UTC
+    """
+
+    published = datetime.datetime.combine(
+        datetime.date.fromisoformat(generation),
+        settings.cache.time_cache_expire_to,
+        tzinfo=datetime.timezone.utc,
+    )
+
+    return max(published, modified) if modified is not None else published
+
+
+def match_validators(
+    request: Request, etags: Sequence[str], last_modified: datetime.datetime
+) -> str | None:
+    """Evaluates conditional request headers against the current data version.
+
+    "If-None-Match" takes precedence over "If-Modified-Since" and is compared weakly
+    as it should be for GET requests.
+
+    Args:
+        request (Request): Fastapi request object
+        etags (Sequence[str]): ETags of current representations of the response, the
+        uncompressed one first
+        last_modified (datetime.datetime): Last modification moment of the current
+        response
+
+    Returns:
+        str | None: ETag of the client's copy if it is still valid, otherwise None
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/")
+            if tag == "*":
+                return etags[0]
+            if tag in etags:
+                return tag
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return None
+    try:
+        modified_since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return None
+    if modified_since.tzinfo is None:
+        return None
+
+    return etags[0] if modified_since >= last_modified.replace(microsecond=0) else None
+
+
+async def render_body(request: Request, result: Any) -> bytes:
+    """Renders the endpoint's result to the JSON body sent to clients.
+
+    The result is serialized by the route's response model with its options, as
+    FastAPI does for the response.
+
+    Args:
+        request (Request): Fastapi request object
+        result (Any): The endpoint's result
+
+    Returns:
+        bytes: Response body
+    """
+
+    if isinstance(result, Response):
+        return result.body
+
+    route = request.scope.get("route")
+    content = await serialize_response(
+        field=getattr(route, "response_field", None),
+        response_content=result,
+        include=getattr(route, "response_model_include", None),
+        exclude=getattr(route, "response_model_exclude", None),
+        by_alias=getattr(route, "response_model_by_alias", True),
+        exclude_unset=getattr(route, "response_model_exclude_unset", False),
+        exclude_defaults=getattr(route, "response_model_exclude_defaults", False),
+        exclude_none=getattr(route, "response_model_exclude_none", False),
+    )
+
+    return JSONResponse(content).body
+
+
+async def read_entry(backend: Backend, key: str) -> tuple[int, bytes | None]:
+    """Reads the cache entry with its remaining time to live, treating backend errors
+    as a miss.
+
+    Args:
+        backend (Backend): FastAPICache backend
+        key (str): Cache key
+
+    Returns:
+        tuple[int, bytes | None]: Remaining ttl in seconds and the cached value or
+        None
+    """
+
+    try:
+        return await backend.get_with_ttl(key)
+    except Exception:
+        logger.warning(
+            "Error retrieving cache key '%s' from backend", key, exc_info=True
+        )
+        return 0, None
+
+
+async def set_entry(backend: Backend, key: str, value: bytes, expire: int) -> bool:
+    """Sets the cache entry, treating backend errors as a skipped write.
+
+    Args:
+        backend (Backend): FastAPICache backend
+        key (str): Cache key
+        value (bytes): Entry value
+        expire (int): Time to live in seconds
+
+    Returns:
+        bool: True if the entry is set
+    """
+
+    try:
+        await backend.set(key, value, expire)
+    except Exception:
+        logger.warning("Error setting cache key '%s' in backend", key, exc_info=True)
+        return False
+
+    return True
+
+
+def mark_entry(value: bytes, version: int, encodings: Sequence[str]) -> bytes:
+    """Prepends the data version and the content codings of the response's stored
+    compressed bodies to its cache entry.
+
+    Args:
+        value (bytes): Encoded cache entry
+        version (int): Data version of the response
+        encodings (Sequence[str]): Content codings of stored compressed bodies
+
+    Returns:
+        bytes: Marked cache entry
+    """
+
+    return f"{version}:{','.join(encodings)}".encode() + MARKER_DELIMITER + value
+
+
+def unmark_entry(cached: bytes) -> tuple[int, tuple[str, ...], bytes]:
+    """Splits the marked cache entry to the data version, the content codings of the
+    response's stored compressed bodies and the encoded entry.
+
+    Args:
+        cached (bytes): Marked cache entry
+
+    Returns:
+        tuple[int, tuple[str, ...], bytes]: Data version, content codings and the
+        encoded entry
+    """
+
+    marker, _, value = cached.partition(MARKER_DELIMITER)
+    version, _, encodings = marker.decode().partition(":")
+
+    return int(version), tuple(encodings.split(",")) if encodings else (), value
+
+
+@asynccontextmanager
+async def open_sessions(kwargs: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """Replaces database sessions passed to the endpoint with new read-only ones.
+
+    Background refresh runs after request's dependencies are finalized and their
+    sessions are closed, so it opens sessions of its own routed to a healthy replica,
+    and closes them when the refresh is done.
+
+    Args:
+        kwargs (dict[str, Any]): Keyword arguments of the endpoint
+
+    Yields:
+        dict[str, Any]: Keyword arguments of the endpoint with new sessions
+    """
+
+    async with AsyncExitStack() as stack:
+        refresh_kwargs = {}
+        for name, value in kwargs.items():
+            if isinstance(value, AsyncSession):
+                value = await stack.enter_async_context(
+                    db_connector.get_read_session_factory()()
+                )
+            refresh_kwargs[name] = value
+
+        yield refresh_kwargs
+
+
+def cache(
+    namespace: str = "",
+    expire: Callable[[], int] = calculate_cache_expiration,
+    key_builder: KeyBuilder | None = None,
+    coder: type[Coder] | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Caches endpoint's responses in the FastAPICache backend.
+
+    Unlike "fastapi_cache.decorator.cache", expiration is calculated on every write
+    and the namespace carries the trading day generation, so entries of the previous
+    trading day are never read as fresh after the cache reset time. Concurrent misses
+    for the same key are coalesced by single flight: only one of them calls the
+    endpoint and the others decode its cached value.
+
+    Entries are kept for "stale_ttl" seconds after they expire. A stale entry, or the
+    entry of the previous generation, is served at once while the endpoint refreshes
+    it in a background task. Read requests are counted to pre-warm the most requested
+    ones after the cache reset. Hits, stale hits and misses are counted per namespace.
+
+    Entries record the data version bumped by ingestion. An entry of a previous
+    version is served stale and refreshed, as is the entry of the previous
+    generation. Responses carry a strong ETag of their cache key and data version,
+    and the generation's reset time or the last load as Last-Modified. Conditional
+    requests matching the current generation and version get 304 before the cache
+    backend or the database is touched.
+
+    When a response is cached, its body is also compressed with every configured
+    content coding and stored under the entry's key with the coding appended. The
+    entry lists the stored codings, so a compressed body is read only when it
+    exists. Clients accepting a coding get these bytes as is on hits, with no
+    decoding, serialization or compression per request.
+
+    Args:
+        namespace (str): Namespace of the endpoint's cache keys. Defaults to "".
+        expire (Callable[[], int]): Function returning expiration in seconds for a
+        new entry. Defaults to "calculate_cache_expiration".
+        key_builder (KeyBuilder | None): Cache key builder. Defaults to the
+        FastAPICache's one.
+        coder (type[Coder] | None): Coder of cache entries. Defaults to the
+        FastAPICache's one.
+
+    Returns:
+        Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+        Endpoint decorator
+    """
+
+    def wrapper(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        func_signature = signature(func)
+        hits, stale_hits, misses, not_modified = (
+            cache_requests.labels(namespace, status)
+            for status in ("hit", "stale", "miss", "not_modified")
+        )
+
+        @wraps(func)
+        async def inner(
+            *args: Any,
+            cache_request: Request,
+            cache_response: Response,
+            cache_background_tasks: BackgroundTasks,
+            **kwargs: Any,
+        ) -> Any:
+            if not is_cacheable(cache_request):
+                return await func(*args, **kwargs)
+
+            backend = FastAPICache.get_backend()
+            entry_coder = coder or FastAPICache.get_coder()
+            status_header = FastAPICache.get_cache_status_header()
+            build_key = key_builder or FastAPICache.get_key_builder()
+            stale_ttl = settings.cache.stale_ttl
+            version, modified = data_version.version, data_version.modified
+            encodings = settings.response.compression
+            encoding = negotiate_encoding(
+                cache_request.headers.get("Accept-Encoding"), encodings
+            )
+
+            async def get_key(generation: str) -> str:
+                cache_key = build_key(
+                    func,
+                    f"{FastAPICache.get_prefix()}:{namespace}:{generation}",
+                    request=cache_request,
+                    response=cache_response,
+                    args=args,
+                    kwargs=kwargs,
+                )
+                if isawaitable(cache_key):
+                    cache_key = await cache_key
+
+                return cache_key
+
+            generation = get_cache_generation()
+            cache_key = await get_key(generation)
+            loaded: list[tuple[Any, int, dict[str, bytes]]] = []
+
+            async def load(endpoint_kwargs: dict[str, Any]) -> bytes:
+                result = await func(*args, **endpoint_kwargs)
+                expire_seconds = expire()
+                to_cache = entry_coder.encode(result)
+                compressed = {}
+                if encodings:
+                    body = await render_body(cache_request, result)
+                    if len(body) >= settings.response.compression_minimum_size:
+                        for name in encodings:
+                            compressed[name] = await asyncio.to_thread(
+                                compress, body, name
+                            )
+                loaded.append((result, expire_seconds, compressed))
+
+                # Compressed bodies are set first to be found along with the entry
+                entry_ttl = expire_seconds + stale_ttl
+                written = [
+                    name
+                    for name, value in compressed.items()
+                    if await set_entry(backend, f"{cache_key}:{name}", value, entry_ttl)
+                ]
+                await set_entry(
+                    backend,
+                    cache_key,
+                    mark_entry(to_cache, version, written),
+                    entry_ttl,
+                )
+
+                return to_cache
+
+            async def poll() -> bytes | None:
+                ttl, cached = await read_entry(backend, cache_key)
+                if cached is None or ttl <= stale_ttl:
+                    return None
+
+                entry_version, _, value = unmark_entry(cached)
+
+                return value if entry_version == version else None
+
+            async def refresh() -> None:
+                try:
+                    async with open_sessions(kwargs) as refresh_kwargs:
+                        await single_flight.do(
+                            cache_key, partial(load, refresh_kwargs), poll
+                        )
+                except Exception:
+                    logger.warning(
+                        "Error refreshing cache key '%s'", cache_key, exc_info=True
+                    )
+
+            async def read(key: str) -> tuple[int, bytes | None, str | None, int]:
+                ttl, cached = await read_entry(backend, key)
+                if cached is None:
+                    return ttl, None, None, version
+
+                entry_version, written, cached = unmark_entry(cached)
+                if encoding in written:
+                    variant_ttl, variant = await read_entry(
+                        backend, f"{key}:{encoding}"
+                    )
+                    if variant is not None:
+                        return variant_ttl, variant, encoding, entry_version
+
+                return ttl, cached, None, entry_version
+
+            def get_headers(
+                etag: str,
+                last_modified: datetime.datetime,
+                max_age: int,
+                status: str | None,
+            ) -> dict[str, str]:
+                headers = {
+                    "Cache-Control": f"max-age={max_age}",
+                    "ETag": etag,
+                    "Last-Modified": format_datetime(last_modified, True),
+                }
+                if encodings:
+                    headers["Vary"] = "Accept-Encoding"
+                if status is not None:
+                    headers[status_header] = status
+
+                return headers
+
+            ttl, cached, served, served_version = 0, None, None, version
+            served_key, served_generation = cache_key, generation
+            last_modified = get_last_modified(generation, modified)
+            if cache_request.headers.get("Cache-Control") != "no-cache":
+                cache_warmer.record(cache_request)
+                etags = [
+                    get_etag(cache_key, version, name) for name in (None, *encodings)
+                ]
+                matched_etag = match_validators(cache_request, etags, last_modified)
+                if matched_etag is not None:
+                    not_modified.inc()
+                    cache_response.status_code = HTTP_304_NOT_MODIFIED
+                    cache_response.headers.update(
+                        get_headers(matched_etag, last_modified, expire(), None)
+                    )
+                    return cache_response
+
+                ttl, cached, served, served_version = await read(cache_key)
+                if cached is not None and served_version != version:
+                    # Entries of the previous data version are only served stale
+                    if stale_ttl:
+                        ttl = min(ttl, stale_ttl)
+                    else:
+                        cached = None
+                if cached is None and stale_ttl:
+                    # Entries of the previous trading day are only served stale
+                    served_generation = get_cache_generation(previous=True)
+                    served_key = await get_key(served_generation)
+                    _, cached, served, served_version = await read(served_key)
+
+            if cached is not None:
+                fresh_ttl = ttl - stale_ttl
+                if fresh_ttl <= 0 and cache_key not in single_flight.calls:
+                    cache_background_tasks.add_task(refresh)
+
+                (hits if fresh_ttl > 0 else stale_hits).inc()
+                headers = get_headers(
+                    get_etag(served_key, served_version, served),
+                    get_last_modified(
+                        served_generation,
+                        modified if served_version == version else None,
+                    ),
+                    max(fresh_ttl, 0),
+                    "HIT" if fresh_ttl > 0 else "STALE",
+                )
+                if served is not None:
+                    return Response(
+                        cached,
+                        media_type="application/json",
+                        headers={**headers, "Content-Encoding": served},
+                    )
+
+                cache_response.headers.update(headers)
+
+                return entry_coder.decode(cached)
+
+            misses.inc()
+            to_cache = await single_flight.do(cache_key, partial(load, kwargs), poll)
+            compressed = {}
+            if loaded:
+                result, expire_seconds, compressed = loaded[0]
+            else:
+                result, expire_seconds = entry_coder.decode(to_cache), expire()
+
+            served = encoding if encoding in compressed else None
+            headers = get_headers(
+                get_etag(cache_key, version, served),
+                last_modified,
+                expire_seconds,
+                "MISS",
+            )
+            if served is not None:
+                return Response(
+                    compressed[served],
+                    media_type="application/json",
+                    headers={**headers, "Content-Encoding": served},
+                )
+            if isinstance(result, Response):
+                result.headers.update(headers)
+            else:
+                cache_response.headers.update(headers)
+
+            return result
+
+        inner.__signature__ = func_signature.replace(
+            parameters=[
+                *func_signature.parameters.values(),
+                INJECTED_REQUEST,
+                INJECTED_RESPONSE,
+                INJECTED_BACKGROUND_TASKS,
+            ]
+        )
+
+        return inner
+
+    return wrapper
@@ -0,0 +1,229 @@
+import datetime
+import logging
+from collections import Counter
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi import FastAPI, Request
+from fastapi_cache import FastAPICache
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import Redis
+from utils import get_cache_generation
+
+logger = logging.getLogger(__name__)
+
+HITS_TTL = 2 * 24 * 60 * 60
+
+
+class CacheWarmer:
+    """A class to pre-warm cache after the daily cache reset.
+
+    Cached requests are counted in process and periodically flushed to a Redis sorted
+    set per cache generation, so serving a request does no I/O. After the reset a
+    scheduled job flushes the counts and replays the configured requests and the
+    most requested ones of the previous generation through the application, so the
+    first users after the reset get cache hits. A Redis lock lets only one worker
+    warm each generation.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        urls: list[str] | None = None,
+        top: int = 20,
+    ) -> None:
+        """Inits cache warmer with given parameters.
+
+        Args:
+            redis (Redis | None): Redis client to count requests and hold the lock.
+            None to disable warming
+            urls (list[str] | None): Request paths with query string warmed after
+            every reset. None by default
+            top (int): The number of the most requested paths to warm. 20 by default
+        """
+
+        self.redis = redis
+        self.urls = urls or []
+        self.top = top
+        self.app: FastAPI | None = None
+        self.hits: Counter[tuple[str, str]] = Counter()
+        self.scheduler: AsyncIOScheduler | None = None
+
+    def init(
+        self,
+        app: FastAPI,
+        redis: Redis,
+        urls: list[str] | None = None,
+        top: int = 20,
+    ) -> None:
+        """Enables counting requests and warming the given application.
+
+        Args:
+            app (FastAPI): The FastAPI application to replay requests through
+            redis (Redis): Redis client to count requests and hold the lock
+            urls (list[str] | None): Request paths with query string warmed after
+            every reset. None by default
+            top (int): The number of the most requested paths to warm. 20 by default
+        """
+
+        self.app = app
+        self.redis = redis
+        self.urls = urls or []
+        self.top = top
+
+    def get_hits_key(self, generation: str) -> str:
+        """Returns the key of the sorted set counting requests of the generation.
+
+        Args:
+            generation (str): Cache generation
+
+        Returns:
+            str: Redis key
+        """
+
+        return f"{FastAPICache.get_prefix()}:hits:{generation}"
+
+    def record(self, request: Request) -> None:
+        """Counts the cached request for the current generation in process.
+
+        Args:
+            request (Request): Fastapi request object
+        """
+
+        if self.redis is None:
+            return
+
+        url = request.url.path
+        if request.url.query:
+            url = f"{url}?{request.url.query}"
+        self.hits[(get_cache_generation(), url)] += 1
+
+    async def flush(self) -> None:
+        """Adds requests counted since the previous flush to Redis in one round trip.
+
+        Counts are dropped if Redis fails, they only rank requests to warm.
+        """
+
+        if self.redis is None or not self.hits:
+            return
+
+        hits, self.hits = self.hits, Counter()
+        keys = set()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for (generation, url), amount in hits.items():
+                    key = self.get_hits_key(generation)
+                    pipe.zincrby(key, amount, url)
+                    keys.add(key)
+                for key in keys:
+                    pipe.expire(key, HITS_TTL)
+                await pipe.execute()
+        except Exception:
+            logger.warning("Error flushing %s request counts", len(hits), exc_info=True)
+
+    async def get_urls(self) -> list[str]:
+        """Returns configured paths followed by the most requested paths of the
+        previous generation.
+
+        Returns:
+            list[str]: Request paths with query string to warm
+        """
+
+        hits_key = self.get_hits_key(get_cache_generation(previous=True))
+        popular = await self.redis.zrevrange(hits_key, 0, self.top - 1)
+        urls = [*self.urls, *(url.decode() for url in popular)]
+
+        return list(dict.fromkeys(urls))
+
+    async def warm_up(self) -> int:
+        """Replays requests to store their responses in the current generation.
+
+        Requests are sent with "Cache-Control: no-cache", so responses are computed
+        and stored even if the cache already holds them.
+
+        Returns:
+            int: The number of warmed paths, 0 if another worker warms this
+            generation
+        """
+
+        if self.app is None or self.redis is None:
+            return 0
+
+        lock_key = f"{FastAPICache.get_prefix()}:warm-up:{get_cache_generation()}"
+        await self.flush()
+        try:
+            if not await self.redis.set(lock_key, 1, nx=True, ex=HITS_TTL):
+                return 0
+            urls = await self.get_urls()
+        except Exception:
+            logger.warning("Error starting cache warm up", exc_info=True)
+            return 0
+
+        warmed = 0
+        async with AsyncClient(
+            transport=ASGITransport(app=self.app), base_url="http://cache-warmer"
+        ) as client:
+            for url in urls:
+                try:
+                    response = await client.get(
+                        url, headers={"Cache-Control": "no-cache"}
+                    )
+                    response.raise_for_status()
+                except Exception:
+                    logger.warning("Error warming up '%s'", url, exc_info=True)
+                else:
+                    warmed += 1
+
+        logger.info("Cache warmed up for %s of %s paths", warmed, len(urls))
+
+        return warmed
+
+    def start(
+        self, reset_time: datetime.time, delay: int = 5, flush_interval: int = 10
+    ) -> None:
+        """Schedules warming up daily after the cache reset and flushing request
+        counts.
+
+        Args:
+            reset_time (datetime.time): Daily cache reset time in UTC
+            delay (int): Delay after the reset in seconds. 5 by default
+            flush_interval (int): Interval of flushing request counts to Redis in
+            seconds. 10 by default
+        """
+
+        run_at = datetime.datetime.combine(
+            datetime.date.today(), reset_time
+        ) + datetime.timedelta(seconds=delay)
+
+        self.scheduler = AsyncIOScheduler(timezone=datetime.timezone.utc)
+        self.scheduler.add_job(
+            self.warm_up,
+            CronTrigger(
+                hour=run_at.hour,
+                minute=run_at.minute,
+                second=run_at.second,
+                timezone=datetime.timezone.utc,
+            ),
+            id="cache-warm-up",
+            misfire_grace_time=None,
+            coalesce=True,
+        )
+        self.scheduler.add_job(
+            self.flush,
+            IntervalTrigger(seconds=flush_interval),
+            id="cache-hits-flush",
+            coalesce=True,
+            max_instances=1,
+        )
+        self.scheduler.start()
+
+    def stop(self) -> None:
+        """Stops the scheduler."""
+
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+
+cache_warmer = CacheWarmer()
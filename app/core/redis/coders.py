@@ -0,0 +1,136 @@
+from typing import Any, Literal
+
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder, JsonCoder
+from pydantic_core import from_json, to_jsonable_python
+from starlette.responses import JSONResponse
+
+from core.config import settings
+
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = zstandard = None
+
+PLAIN = b"\x00"
+COMPRESSED = b"\x01"
+TABLE_EXT_CODE = 1
+ZSTD_LEVEL = 3
+
+
+def to_tables(value: Any) -> Any:
+    """Replaces lists of objects with the same keys by tables of rows.
+
+    Keys of such lists are stored once instead of in every object. Lists are looked
+    for at the top level and in values of the top level object, where endpoints put
+    them.
+
+    Args:
+        value (Any): JSON compatible value
+
+    Returns:
+        Any: Value with tables packed to msgpack extension types
+    """
+
+    if isinstance(value, dict):
+        return {key: to_table(item) for key, item in value.items()}
+
+    return to_table(value)
+
+
+def to_table(value: Any) -> Any:
+    """Packs the list of objects with the same keys to a table.
+
+    Args:
+        value (Any): JSON compatible value
+
+    Returns:
+        Any: Table as msgpack extension type or the value as is
+    """
+
+    if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+        return value
+
+    columns = list(value[0])
+    if any(not isinstance(item, dict) or list(item) != columns for item in value):
+        return value
+
+    rows = [list(item.values()) for item in value]
+
+    return msgpack.ExtType(TABLE_EXT_CODE, msgpack.packb([columns, rows]))
+
+
+def from_table(code: int, data: bytes) -> Any:
+    """Unpacks the table back to the list of objects.
+
+    Args:
+        code (int): Msgpack extension type code
+        data (bytes): Packed table
+
+    Returns:
+        Any: List of objects
+    """
+
+    if code != TABLE_EXT_CODE:
+        return msgpack.ExtType(code, data)
+
+    columns, rows = msgpack.unpackb(data)
+
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+class CompactCoder(Coder):
+    """A coder storing responses as msgpack compressed with zstd above a threshold.
+
+    Values are converted to JSON compatible data, pydantic models by pydantic-core
+    and other objects like ORM entities by "jsonable_encoder", so decoded responses
+    are validated by the response model like those of "JsonCoder". Lists of
+    objects are stored as tables with keys kept once. Payloads of at least
+    "compression_threshold" bytes are compressed. Entries written by "JsonCoder" are
+    still decoded, so the coder can be switched without flushing the cache.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, JSONResponse):
+            content = from_json(value.body)
+        else:
+            content = to_jsonable_python(value, fallback=jsonable_encoder)
+
+        packed = msgpack.packb(to_tables(content))
+        if len(packed) >= settings.cache.compression_threshold:
+            return COMPRESSED + zstandard.compress(packed, ZSTD_LEVEL)
+
+        return PLAIN + packed
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        header, payload = value[:1], value[1:]
+        if header == COMPRESSED:
+            payload = zstandard.decompress(payload)
+        elif header != PLAIN:
+            return JsonCoder.decode(value)
+
+        return msgpack.unpackb(payload, ext_hook=from_table)
+
+
+def get_coder(name: Literal["json", "compact"]) -> type[Coder]:
+    """Returns the cache coder by its name.
+
+    Args:
+        name (Literal["json", "compact"]): Coder name
+
+    Raises:
+        RuntimeError: If "compact" coder dependencies are not installed
+
+    Returns:
+        type[Coder]: Coder class
+    """
+
+    if name == "compact":
+        if msgpack is None:
+            raise RuntimeError('"compact" cache coder needs "compact-cache" extra')
+        return CompactCoder
+
+    return JsonCoder
@@ -0,0 +1,109 @@
+import datetime
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersion:
+    """A class to track the version of trade results in the database.
+
+    Ingestion bumps the version in Redis after loading trade results. Workers keep
+    the version in process and refresh it periodically, so cache entries and
+    validators follow the data without a Redis round trip per request.
+    """
+
+    def __init__(
+        self, redis: Redis | None = None, key: str = "main-cache:data-version"
+    ) -> None:
+        """Inits data version with given parameters.
+
+        Args:
+            redis (Redis | None): Redis client holding the version. None to keep the
+            initial version
+            key (str): Redis key of the version. "main-cache:data-version" by default
+        """
+
+        self.redis = redis
+        self.key = key
+        self.version = 0
+        self.modified: datetime.datetime | None = None
+        self.scheduler: AsyncIOScheduler | None = None
+
+    def init(self, redis: Redis, key: str = "main-cache:data-version") -> None:
+        """Enables reading and bumping the version in Redis.
+
+        Args:
+            redis (Redis): Redis client holding the version
+            key (str): Redis key of the version. "main-cache:data-version" by default
+        """
+
+        self.redis = redis
+        self.key = key
+
+    async def bump(self) -> int:
+        """Increments the version and records the modification moment after trade
+        results are loaded.
+
+        Returns:
+            int: New version
+        """
+
+        modified = datetime.datetime.now(datetime.timezone.utc)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(self.key, "version", 1)
+            pipe.hset(self.key, "modified", modified.isoformat())
+            version, _ = await pipe.execute()
+
+        self.version, self.modified = version, modified
+
+        return version
+
+    async def refresh(self) -> None:
+        """Reads the current version, the known one is kept if Redis fails."""
+
+        if self.redis is None:
+            return
+
+        try:
+            values = await self.redis.hgetall(self.key)
+        except Exception:
+            logger.warning("Error refreshing data version", exc_info=True)
+            return
+
+        modified = values.get(b"modified")
+        self.version = int(values.get(b"version", 0))
+        self.modified = (
+            datetime.datetime.fromisoformat(modified.decode()) if modified else None
+        )
+
+    def start(self, interval: int = 5) -> None:
+        """Schedules refreshing the version.
+
+        Args:
+            interval (int): Interval of refreshing the version in seconds. 5 by
+            default
+        """
+
+        self.scheduler = AsyncIOScheduler(timezone=datetime.timezone.utc)
+        self.scheduler.add_job(
+            self.refresh,
+            IntervalTrigger(seconds=interval),
+            id="data-version-refresh",
+            coalesce=True,
+            max_instances=1,
+        )
+        self.scheduler.start()
+
+    def stop(self) -> None:
+        """Stops the scheduler."""
+
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+
+data_version = DataVersion()
@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from fastapi_cache.types import Backend
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+tier_requests = Counter(
+    "cache_tier_requests_total",
+    "Cache backend reads by tier and result",
+    ("tier", "result"),
+)
+
+
+class LocalCache:
+    """An in-process LRU cache with per-entry expiration bounded by the number of
+    entries and their total size.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Inits the local cache with given limits.
+
+        Args:
+            max_entries (int): The maximum number of entries
+            max_bytes (int): The maximum total size of values in bytes
+        """
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[str, tuple[float, float, bytes]] = OrderedDict()
+
+    def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        """Returns the value and its remaining time to live, marking it as recently
+        used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            tuple[int, bytes | None]: Remaining reported ttl in seconds and the value
+            or None if the key is missing or expired
+        """
+
+        entry = self.entries.get(key)
+        if entry is None:
+            return 0, None
+
+        now = time.monotonic()
+        expires_at, reported_expires_at, value = entry
+        if expires_at <= now:
+            self.delete(key)
+            return 0, None
+
+        self.entries.move_to_end(key)
+
+        return int(reported_expires_at - now), value
+
+    def set(self, key: str, value: bytes, expire: int, ttl: int | None = None) -> None:
+        """Stores the value evicting least recently used entries over the limits.
+
+        Args:
+            key (str): Cache key
+            value (bytes): Value to store
+            expire (int): Time to keep the value in seconds
+            ttl (int | None): Time to live to report for the value in seconds, e.g.
+            the ttl of the remote entry. Equals "expire" by default
+        """
+
+        if len(value) > self.max_bytes or expire <= 0:
+            return
+
+        now = time.monotonic()
+        self.delete(key)
+        self.entries[key] = (now + expire, now + (ttl or expire), value)
+        self.size += len(value)
+
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            _, (_, _, evicted) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def delete(self, key: str) -> int:
+        """Deletes the entry by key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            int: The number of deleted entries
+        """
+
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return 0
+
+        self.size -= len(entry[-1])
+
+        return 1
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Deletes all entries or entries within the namespace.
+
+        Args:
+            namespace (str | None): Key prefix of entries to delete. None to delete
+            all entries
+
+        Returns:
+            int: The number of deleted entries
+        """
+
+        if namespace is None:
+            count = len(self.entries)
+            self.entries.clear()
+            self.size = 0
+            return count
+
+        keys = [key for key in self.entries if key.startswith(namespace)]
+
+        return sum(self.delete(key) for key in keys)
+
+
+class LayeredBackend(Backend):
+    """A FastAPICache backend serving entries from an in-process LRU tier in front of
+    a remote backend.
+
+    Local entries live no longer than the remote entry and "local_max_ttl", and
+    report the remaining ttl of the remote entry. Clearing the cache publishes an
+    invalidation message, and every worker listening to the channel drops its local
+    tier. Hits and misses of both tiers are counted in "cache_tier_requests_total".
+    """
+
+    def __init__(
+        self,
+        remote: Backend,
+        local_max_entries: int = 1024,
+        local_max_bytes: int = 32 * 1024 * 1024,
+        local_max_ttl: int = 60,
+        redis: Redis | None = None,
+        invalidation_channel: str = "cache-invalidation",
+    ) -> None:
+        """Inits the layered backend.
+
+        Args:
+            remote (Backend): Backend of the remote tier
+            local_max_entries (int): The maximum number of local entries. 1024 by
+            default
+            local_max_bytes (int): The maximum total size of local entries in bytes.
+            32 MiB by default
+            local_max_ttl (int): The maximum time to live of local entries in seconds.
+            60 by default
+            redis (Redis | None): Redis client for invalidation messages. None to keep
+            invalidation local to the process
+            invalidation_channel (str): Redis pub/sub channel for invalidation
+            messages. "cache-invalidation" by default
+        """
+
+        self.remote = remote
+        self.local = LocalCache(local_max_entries, local_max_bytes)
+        self.local_max_ttl = local_max_ttl
+        self.redis = redis
+        self.invalidation_channel = invalidation_channel
+        self.local_hits, self.local_misses, self.remote_hits, self.remote_misses = (
+            tier_requests.labels(tier, result)
+            for tier in ("local", "remote")
+            for result in ("hit", "miss")
+        )
+        self.listener: asyncio.Task | None = None
+
+    async def get_with_ttl(self, key: str) -> tuple[int, bytes | None]:
+        ttl, value = self.local.get_with_ttl(key)
+        if value is not None:
+            self.local_hits.inc()
+            return ttl, value
+        self.local_misses.inc()
+
+        ttl, value = await self.remote.get_with_ttl(key)
+        if value is None:
+            self.remote_misses.inc()
+            return ttl, value
+        self.remote_hits.inc()
+
+        self.local.set(key, value, min(ttl, self.local_max_ttl), ttl)
+
+        return ttl, value
+
+    async def get(self, key: str) -> bytes | None:
+        _, value = await self.get_with_ttl(key)
+
+        return value
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        await self.remote.set(key, value, expire)
+
+        self.local.set(
+            key, value, min(expire or self.local_max_ttl, self.local_max_ttl), expire
+        )
+
+    async def clear(self, namespace: str | None = None, key: str | None = None) -> int:
+        count = await self.remote.clear(namespace, key)
+
+        self.clear_local(namespace, key)
+        if self.redis is not None:
+            await self.redis.publish(self.invalidation_channel, namespace or key or "")
+
+        return count
+
+    def clear_local(self, namespace: str | None = None, key: str | None = None) -> None:
+        """Drops local entries by namespace or key, or all entries if neither is
+        given.
+
+        Args:
+            namespace (str | None): Key prefix of entries to drop
+            key (str | None): Key of the entry to drop
+        """
+
+        if namespace:
+            self.local.clear(namespace)
+        elif key:
+            self.local.delete(key)
+        else:
+            self.local.clear()
+
+    async def start(self) -> None:
+        """Starts listening to invalidation messages if a redis client is set."""
+
+        if self.redis is not None and self.listener is None:
+            self.listener = asyncio.create_task(self.listen())
+
+    async def stop(self) -> None:
+        """Stops listening to invalidation messages."""
+
+        if self.listener is not None:
+            self.listener.cancel()
+            try:
+                await self.listener
+            except asyncio.CancelledError:
+                pass
+            self.listener = None
+
+    async def listen(self) -> None:
+        """Drops local entries on invalidation messages from other workers.
+
+        The whole local tier is dropped after reconnecting, since messages published
+        while disconnected are lost.
+        """
+
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.invalidation_channel)
+                    self.local.clear()
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            target = message["data"].decode()
+                            self.clear_local(namespace=target)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cache invalidation listener failed", exc_info=True)
+                await asyncio.sleep(1)
@@ -1,6 +1,12 @@
+import datetime
+import hashlib
+import json
 from typing import Any, Callable
 
 from fastapi import Request, Response
+from pydantic import BaseModel
+
+KEY_PARAM_TYPES = (BaseModel, str, int, float, bool, datetime.date, type(None))
 
 
 def request_key_builder(
@@ -9,25 +15,40 @@ def request_key_builder(
     *,
     request: Request | None = None,
     response: Response | None = None,
-    **kwargs: Any,
+    args: tuple[Any, ...] = (),
+    kwargs: dict[str, Any] | None = None,
 ) -> str:
-    """Builds a unique key for cache using requests details.
+    """Builds a unique key for cache from validated endpoint's params.
+
+    Query params models are dumped with defaults applied, so requests differing only
+    in params order or in explicitly passed default values share a cache entry.
+    Dependencies like database sessions are skipped. Params are hashed to a
+    fixed-length digest to keep keys compact.
 
     Args:
         func (Callable[..., Any]): The function to decorate.
         namespace (str): A string prefix for key. Defaults to "".
         request (Request | None): Fastapi request object. Defaults to None.
         response (Response | None): Fastapi response object. Defaults to None.
+        args (tuple[Any, ...]): Positional arguments of the endpoint. Defaults to ().
+        kwargs (dict[str, Any] | None): Keyword arguments of the endpoint. Defaults to
+        None.
 
     Returns:
         str: A string using to generate cache key.
     """
 
-    return ":".join(
-        [
-            namespace,
-            request.method.lower(),
-            request.url.path,
-            repr(sorted(request.query_params.items())),
-        ]
+    params = {
+        name: value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+        for name, value in (kwargs or {}).items()
+        if isinstance(value, KEY_PARAM_TYPES)
+    }
+    raw_key = json.dumps(
+        [func.__module__, func.__qualname__, params],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
     )
+    digest = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+
+    return ":".join([namespace, func.__name__, digest])
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """A class to coalesce concurrent cache misses for the same key.
+
+    Within a process concurrent callers await a single in-flight load. Across
+    processes a short Redis lock lets only one worker load the value while the others
+    poll the cache for it.
+    """
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        lock_timeout: float = 10.0,
+        wait_interval: float = 0.05,
+    ) -> None:
+        """Inits single flight with given parameters.
+
+        Args:
+            redis (Redis | None): Redis client for cross-process locks. None to
+            coalesce loads within the process only
+            lock_timeout (float): Lock expiration and the maximum time to wait for
+            another worker in seconds. 10.0 by default
+            wait_interval (float): Interval of polling the cache while another worker
+            holds the lock in seconds. 0.05 by default
+        """
+
+        self.redis = redis
+        self.lock_timeout = lock_timeout
+        self.wait_interval = wait_interval
+        self.calls: dict[str, asyncio.Future[bytes]] = {}
+
+    def init(
+        self, redis: Redis, lock_timeout: float = 10.0, wait_interval: float = 0.05
+    ) -> None:
+        """Enables cross-process locks with the given redis client.
+
+        Args:
+            redis (Redis): Redis client for cross-process locks
+            lock_timeout (float): Lock expiration and the maximum time to wait for
+            another worker in seconds. 10.0 by default
+            wait_interval (float): Interval of polling the cache while another worker
+            holds the lock in seconds. 0.05 by default
+        """
+
+        self.redis = redis
+        self.lock_timeout = lock_timeout
+        self.wait_interval = wait_interval
+
+    async def do(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[bytes]],
+        poll: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes:
+        """Returns the value loaded once for all concurrent callers with the same key.
+
+        If the caller loading the value is cancelled, one of the waiting callers takes
+        over the load.
+
+        Args:
+            key (str): Cache key
+            load (Callable[[], Awaitable[bytes]]): Loads the value and stores it to
+            cache
+            poll (Callable[[], Awaitable[bytes | None]]): Reads the value from cache
+
+        Returns:
+            bytes: Loaded value
+        """
+
+        in_flight = self.calls.get(key)
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The caller loading the value was cancelled, take over the load
+                return await self.do(key, load, poll)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.calls[key] = future
+
+        try:
+            value = await self.load_locked(key, load, poll)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self.calls[key]
+
+    async def load_locked(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[bytes]],
+        poll: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes:
+        """Loads the value holding the cross-process lock, or waits for the worker
+        holding it.
+
+        If the lock is not released in time or redis is unavailable, the value is
+        loaded without the lock.
+
+        Args:
+            key (str): Cache key
+            load (Callable[[], Awaitable[bytes]]): Loads the value and stores it to
+            cache
+            poll (Callable[[], Awaitable[bytes | None]]): Reads the value from cache
+
+        Returns:
+            bytes: Loaded value
+        """
+
+        if self.redis is None:
+            return await load()
+
+        lock_key = f"{key}:lock"
+        token = uuid4().hex
+
+        try:
+            acquired = await self.redis.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+        except Exception:
+            logger.warning("Error acquiring lock '%s'", lock_key, exc_info=True)
+            return await load()
+
+        if acquired:
+            try:
+                return await load()
+            finally:
+                await self.release(lock_key, token)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.wait_interval)
+            value = await poll()
+            if value is not None:
+                return value
+
+        return await load()
+
+    async def release(self, lock_key: str, token: str) -> None:
+        """Releases the lock if it is still held with the given token.
+
+        Args:
+            lock_key (str): Lock key
+            token (str): Token the lock was acquired with
+        """
+
+        try:
+            await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception:
+            logger.warning("Error releasing lock '%s'", lock_key, exc_info=True)
+
+
+single_flight = SingleFlight()
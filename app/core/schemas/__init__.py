@@ -1,3 +1,29 @@
-__all__ = ("TradeResultOut", "TradingFilterParams", "DynamicsFilterParams")
+__all__ = (
+    "AggregateFilterParams",
+    "DailyAggregateFilterParams",
+    "DailyAggregateOut",
+    "DeliveryBasisOut",
+    "DeliveryTypeOut",
+    "ExportFilterParams",
+    "OilOut",
+    "TradeResultAggregateOut",
+    "TradeResultOut",
+    "TradeResultsPage",
+    "TradingFilterParams",
+    "DynamicsFilterParams",
+)
 
-from .trade_results import DynamicsFilterParams, TradeResultOut, TradingFilterParams
+from .trade_results import (
+    AggregateFilterParams,
+    DailyAggregateFilterParams,
+    DailyAggregateOut,
+    DeliveryBasisOut,
+    DeliveryTypeOut,
+    DynamicsFilterParams,
+    ExportFilterParams,
+    OilOut,
+    TradeResultAggregateOut,
+    TradeResultOut,
+    TradeResultsPage,
+    TradingFilterParams,
+)
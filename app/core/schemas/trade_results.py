@@ -1,34 +1,107 @@
 import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from utils import decode_cursor
 
 
-class FilterParamsBase(BaseModel):
+class PaginationParamsBase(BaseModel):
+    """A base pydantic model for query params using to paginate results by offset."""
+
+    limit: int = Field(10, ge=0, description="Limit to returning results")
+    skip: int = Field(0, ge=0, description="Offset to skip in returning results")
+
+
+class FilterParamsBase(PaginationParamsBase):
     """A base scheme using pydantic model for query params using to filter database
     query.
+
+    Passing "cursor" switches pagination from offset mode to cursor mode: results
+    are ordered by date and id in descending order, "skip" is ignored and the
+    response contains a cursor of the next page. An empty cursor requests the first
+    page.
     """
 
-    limit: int = Field(10, ge=0, description="Limit to returning results")
-    skip: int = Field(0, ge=0, description="Offset to skip in returning results")
+    cursor: str | None = Field(
+        None, description="Cursor of the page to return. Empty for the first page"
+    )
 
+    @field_validator("cursor")
+    @classmethod
+    def validate_cursor(cls, value: str | None) -> str | None:
+        if value is not None:
+            decode_cursor(value)
 
-class TradingFilterParams(FilterParamsBase):
-    """A pydantic model for query params using to filter spimex trade results."""
+        return value
+
+
+class TradeFilterParamsBase(BaseModel):
+    """A base pydantic model for query params using to filter trade results by oil,
+    delivery type and delivery basis.
+    """
 
     oil_id: str | None = Field(None, description="Oil id")
     delivery_type_id: str | None = Field(None, description="Id of delivery type")
     delivery_basis_id: str | None = Field(None, description="Id of delivery bases")
 
 
-class DynamicsFilterParams(TradingFilterParams):
-    """A pydantic model for query params using to get trade results for the period"""
+class PeriodFilterParamsBase(TradeFilterParamsBase):
+    """A base pydantic model for query params using to filter trade results for the
+    period.
+    """
 
     start_date: datetime.date = Field(description="The start date for period")
     end_date: datetime.date = Field(
-        datetime.date.today(), description="The end date for period"
+        default_factory=datetime.date.today, description="The end date for period"
     )
 
 
+class TradingFilterParams(TradeFilterParamsBase, FilterParamsBase):
+    """A pydantic model for query params using to filter spimex trade results."""
+
+
+class DynamicsFilterParams(PeriodFilterParamsBase, TradingFilterParams):
+    """A pydantic model for query params using to get trade results for the period"""
+
+
+class ExportFilterParams(PeriodFilterParamsBase):
+    """A pydantic model for query params using to export trade results for the
+    period.
+    """
+
+    format: Literal["ndjson", "csv", "arrow", "parquet"] | None = Field(
+        None,
+        description="Format of exported rows. Negotiated by the Accept header if "
+        "not set",
+    )
+
+
+class DailyAggregateFilterParams(PeriodFilterParamsBase, PaginationParamsBase):
+    """A pydantic model for query params using to get daily totals of trade results
+    for the period.
+    """
+
+    limit: int = Field(1000, ge=0, description="Limit to returning results")
+
+
+class AggregateFilterParams(DailyAggregateFilterParams):
+    """A pydantic model for query params using to get totals of trade results for the
+    period by time bucket and groups.
+    """
+
+    group_by: list[Literal["oil_id", "delivery_basis_id", "delivery_type_id"]] = Field(
+        [], description="Columns to group totals by besides the time bucket"
+    )
+    bucket: Literal["day", "week", "month"] = Field(
+        "day", description="Time bucket to sum totals by"
+    )
+
+    @field_validator("group_by")
+    @classmethod
+    def validate_group_by(cls, value: list[str]) -> list[str]:
+        return list(dict.fromkeys(value))
+
+
 class SpimexTradeResultBase(BaseModel):
     """A base scheme using pydantic model representing trade results. Attributes matches
     sqlalchemy model of trade results.
@@ -56,3 +129,64 @@ class TradeResultOut(SpimexTradeResultBase):
 
     created_on: datetime.datetime
     updated_on: datetime.datetime
+
+
+class TradeResultsPage(BaseModel):
+    """A class to represent a page of trade results returned in cursor pagination
+    mode.
+    """
+
+    results: list[TradeResultOut]
+    next_cursor: str | None = Field(
+        description="Cursor of the next page. None if there are no more results"
+    )
+
+
+class DailyAggregateOut(SpimexTradeResultBase):
+    """A class to represent daily totals of trade results by oil, delivery basis and
+    delivery type.
+    """
+
+    date: datetime.date
+    oil_id: str
+    delivery_basis_id: str
+    delivery_type_id: str
+    volume: int
+    total: int
+    count: int
+
+
+class TradeResultAggregateOut(SpimexTradeResultBase):
+    """A class to represent totals of trade results for a time bucket and group.
+    Columns the totals are not grouped by are None.
+    """
+
+    date: datetime.date = Field(
+        description="The start date of the time bucket, not before the period's start"
+    )
+    oil_id: str | None = None
+    delivery_basis_id: str | None = None
+    delivery_type_id: str | None = None
+    volume: int
+    total: int
+    count: int
+    vwap: float | None = Field(description="Volume weighted average price")
+
+
+class OilOut(SpimexTradeResultBase):
+    """A class to represent traded oil type from the dictionary."""
+
+    oil_id: str
+
+
+class DeliveryBasisOut(SpimexTradeResultBase):
+    """A class to represent delivery basis with its name from the dictionary."""
+
+    delivery_basis_id: str
+    delivery_basis_name: str
+
+
+class DeliveryTypeOut(SpimexTradeResultBase):
+    """A class to represent delivery type from the dictionary."""
+
+    delivery_type_id: str
@@ -0,0 +1,14 @@
+__all__ = (
+    "TradeResultRecord",
+    "find_bulletins",
+    "parse_bulletin",
+    "load_batch",
+    "IngestionReport",
+    "ingest_bulletins",
+    "backfill_bulletins",
+)
+
+from .backfill import backfill_bulletins
+from .bulletin import TradeResultRecord, find_bulletins, parse_bulletin
+from .loader import load_batch
+from .runner import IngestionReport, ingest_bulletins
@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import logging
+from collections.abc import Awaitable
+from pathlib import Path
+
+from core.config import settings
+from core.models.db_connector import DataBaseConnector
+from core.redis import data_version, redis_client
+
+from .backfill import backfill_bulletins
+from .runner import IngestionReport, ingest_bulletins
+
+logger = logging.getLogger(__name__)
+
+
+def get_db_connector() -> DataBaseConnector:
+    """Connects ingestion to the main database server bypassing PgBouncer.
+
+    The loader's staging table is a temporary table living in the connection's
+    session, which PgBouncer in transaction pooling mode doesn't keep between
+    transactions. So ingestion connects to the direct host in session mode, and
+    refuses to run in transaction mode without it.
+
+    Returns:
+        DataBaseConnector: Database connector of ingestion
+    """
+
+    db_settings = settings.main_pg_db
+    if db_settings.pool_mode == "transaction" and db_settings.direct_host is None:
+        parser.error(
+            "ingestion needs a session kept by the connection, set "
+            "CONFIG__MAIN_PG_DB__DIRECT_HOST to the database server behind PgBouncer "
+            "in transaction pooling mode"
+        )
+
+    return DataBaseConnector(
+        url=db_settings.direct_url.unicode_string(),
+        echo=db_settings.echo_sql,
+        echo_pool=db_settings.echo_pool,
+        pool_size=db_settings.pool_size,
+        max_overflow=db_settings.max_overflow,
+    )
+
+
+async def main(
+    ingestion: Awaitable[IngestionReport], db_connector: DataBaseConnector
+) -> None:
+    """Runs the ingestion against the main database, bumps the data version if any
+    trade results are loaded and prints throughput.
+
+    Args:
+        ingestion (Awaitable[IngestionReport]): Ingestion to run
+        db_connector (DataBaseConnector): Database connector the ingestion runs with
+    """
+
+    try:
+        report = await ingestion
+    finally:
+        await db_connector.dispose()
+
+    if report.rows:
+        redis = redis_client.get_client()
+        data_version.init(redis, key=settings.cache.data_version_key)
+        try:
+            await data_version.bump()
+        except Exception:
+            logger.warning(
+                "Error bumping data version, cached responses are kept until the "
+                "cache reset",
+                exc_info=True,
+            )
+        finally:
+            await redis.aclose()
+
+    print(report)
+
+
+parser = argparse.ArgumentParser(
+    prog="python -m ingestion",
+    description="Loads SPIMEX trade results bulletins to the database.",
+)
+commands = parser.add_subparsers(dest="command", required=True)
+
+load_parser = commands.add_parser("load", help="load bulletins sequentially")
+backfill_parser = commands.add_parser(
+    "backfill", help="load bulletins parsing them in parallel"
+)
+for command_parser in (load_parser, backfill_parser):
+    command_parser.add_argument(
+        "paths", nargs="+", type=Path, help="bulletin files or folders"
+    )
+    command_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.ingestion.batch_size,
+        help="trade results loaded at once",
+    )
+
+backfill_parser.add_argument(
+    "--writers",
+    type=int,
+    default=settings.ingestion.writers,
+    help="concurrent database writers",
+)
+backfill_parser.add_argument(
+    "--processes",
+    type=int,
+    default=settings.ingestion.processes,
+    help="processes parsing bulletins, the number of CPUs by default",
+)
+backfill_parser.add_argument(
+    "--queue-size",
+    type=int,
+    default=settings.ingestion.queue_size,
+    help="parsed bulletins waiting for writers",
+)
+backfill_parser.add_argument(
+    "--checkpoint", type=Path, help="file of loaded bulletins to resume from"
+)
+
+args = parser.parse_args()
+logging.basicConfig(level=logging.INFO)
+db_connector = get_db_connector()
+
+if args.command == "load":
+    ingestion = ingest_bulletins(args.paths, db_connector.engine, args.batch_size)
+else:
+    ingestion = backfill_bulletins(
+        args.paths,
+        db_connector.engine,
+        batch_size=args.batch_size,
+        writers=args.writers,
+        processes=args.processes,
+        queue_size=args.queue_size,
+        checkpoint_path=args.checkpoint,
+    )
+
+asyncio.run(main(ingestion, db_connector))
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .bulletin import TradeResultRecord, find_bulletins, parse_bulletin
+from .loader import load_batch
+from .runner import IngestionReport
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """A file listing bulletins already loaded, to resume an interrupted backfill.
+
+    A bulletin is appended once all its trade results are committed, so bulletins
+    loaded partially are loaded again on resume and upserted by the natural key.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        """Inits checkpoint reading bulletins loaded by previous runs.
+
+        Args:
+            path (Path | None): Path to the checkpoint file. None to disable resuming
+        """
+
+        self.path = path
+        self.loaded: set[str] = set()
+        if path is not None and path.exists():
+            self.loaded = set(path.read_text(encoding="utf-8").splitlines())
+
+    def is_loaded(self, bulletin: Path) -> bool:
+        """Checks whether the bulletin was loaded by a previous run.
+
+        Args:
+            bulletin (Path): Path to the bulletin
+
+        Returns:
+            bool: True if the bulletin was loaded
+        """
+
+        return str(bulletin) in self.loaded
+
+    def mark_loaded(self, bulletin: Path) -> None:
+        """Appends the loaded bulletin to the checkpoint file.
+
+        Args:
+            bulletin (Path): Path to the bulletin
+        """
+
+        self.loaded.add(str(bulletin))
+        if self.path is not None:
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(f"{bulletin}\n")
+
+
+async def parse_bulletins(
+    bulletins: list[Path],
+    queue: asyncio.Queue[tuple[Path, list[TradeResultRecord]] | None],
+    pool: ProcessPoolExecutor,
+    processes: int,
+) -> None:
+    """Parses bulletins in the process pool and puts their trade results to the
+    queue in order.
+
+    At most "processes" bulletins are parsed ahead of the queue, so parsing stalls
+    while writers are behind.
+
+    Args:
+        bulletins (list[Path]): Bulletins to parse
+        queue (asyncio.Queue): Bounded queue of parsed bulletins
+        pool (ProcessPoolExecutor): Process pool to parse in
+        processes (int): The number of bulletins parsed at once
+    """
+
+    loop = asyncio.get_running_loop()
+    parsing: deque[tuple[Path, asyncio.Future[list[TradeResultRecord]]]] = deque()
+
+    for bulletin in bulletins:
+        parsing.append((bulletin, loop.run_in_executor(pool, parse_bulletin, bulletin)))
+        if len(parsing) >= processes:
+            path, records = parsing.popleft()
+            await queue.put((path, await records))
+
+    for path, records in parsing:
+        await queue.put((path, await records))
+
+
+async def write_bulletins(
+    queue: asyncio.Queue[tuple[Path, list[TradeResultRecord]] | None],
+    engine: AsyncEngine,
+    batch_size: int,
+    checkpoint: Checkpoint,
+) -> int:
+    """Loads parsed bulletins from the queue until it yields None.
+
+    Args:
+        queue (asyncio.Queue): Bounded queue of parsed bulletins
+        engine (AsyncEngine): Sqlalchemy async engine to take a connection from
+        batch_size (int): The number of trade results loaded at once
+        checkpoint (Checkpoint): Checkpoint to mark loaded bulletins
+
+    Returns:
+        int: The number of inserted or updated rows
+    """
+
+    rows = 0
+
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        connection = raw_connection.driver_connection
+
+        while (item := await queue.get()) is not None:
+            path, records = item
+            for start in range(0, len(records), batch_size):
+                rows += await load_batch(
+                    connection, records[start : start + batch_size]
+                )
+            checkpoint.mark_loaded(path)
+            logger.info("Loaded %s rows from '%s'", len(records), path)
+
+    return rows
+
+
+async def backfill_bulletins(
+    paths: Iterable[Path],
+    engine: AsyncEngine,
+    batch_size: int = 5000,
+    writers: int = 4,
+    processes: int | None = None,
+    queue_size: int = 8,
+    checkpoint_path: Path | None = None,
+) -> IngestionReport:
+    """Loads bulletins parsing them in a process pool and writing them with
+    concurrent writers.
+
+    Parsed bulletins are passed to writers through a bounded queue, so memory stays
+    flat when the database is slower than parsing. Every writer holds a connection of
+    the engine's pool. Bulletins listed in the checkpoint are skipped.
+
+    Args:
+        paths (Iterable[Path]): Bulletin files and directories with them
+        engine (AsyncEngine): Sqlalchemy async engine shared by writers
+        batch_size (int): The number of trade results loaded at once. 5000 by default
+        writers (int): The number of concurrent writers. 4 by default
+        processes (int | None): The number of parsing processes. None to use the
+        number of CPUs
+        queue_size (int): The maximum number of parsed bulletins waiting for writers.
+        8 by default
+        checkpoint_path (Path | None): Path to the checkpoint file. None to load all
+        bulletins
+
+    Returns:
+        IngestionReport: The number of loaded files and rows and elapsed time
+    """
+
+    started = time.perf_counter()
+    checkpoint = Checkpoint(checkpoint_path)
+    bulletins = [
+        bulletin
+        for bulletin in find_bulletins(paths)
+        if not checkpoint.is_loaded(bulletin)
+    ]
+    logger.info(
+        "Backfilling %s bulletins, %s already loaded",
+        len(bulletins),
+        len(checkpoint.loaded),
+    )
+
+    queue: asyncio.Queue[tuple[Path, list[TradeResultRecord]] | None] = asyncio.Queue(
+        maxsize=queue_size
+    )
+
+    processes = processes or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=processes)
+    try:
+        async with asyncio.TaskGroup() as group:
+            writer_tasks = [
+                group.create_task(
+                    write_bulletins(queue, engine, batch_size, checkpoint)
+                )
+                for _ in range(writers)
+            ]
+            await parse_bulletins(bulletins, queue, pool, processes)
+            for _ in writer_tasks:
+                await queue.put(None)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    rows = sum(task.result() for task in writer_tasks)
+
+    return IngestionReport(len(bulletins), rows, time.perf_counter() - started)
@@ -0,0 +1,204 @@
+import csv
+import datetime
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import xlrd
+
+BULLETIN_SUFFIXES = (".xls", ".csv")
+TRADE_DATE_PREFIX = "Дата торгов:"
+METRIC_TON_SECTION = "Единица измерения: Метрическая тонна"
+TOTAL_ROW_PREFIX = "Итого"
+HEADER_COLUMNS = {
+    "exchange_product_id": "Код Инструмента",
+    "exchange_product_name": "Наименование Инструмента",
+    "delivery_basis_name": "Базис поставки",
+    "volume": "Объем Договоров в единицах измерения",
+    "total": "Обьем Договоров, руб.",
+    "count": "Количество Договоров, шт.",
+}
+
+
+class TradeResultRecord(NamedTuple):
+    """A trade result parsed from a bulletin in the column order of the
+    "spimex_trading_results" table."""
+
+    exchange_product_id: str
+    exchange_product_name: str
+    oil_id: str
+    delivery_basis_id: str
+    delivery_basis_name: str
+    delivery_type_id: str
+    volume: int
+    total: int
+    count: int
+    date: datetime.date
+
+
+def normalize_cell(value: Any) -> str:
+    """Converts a cell to a string collapsing line breaks and repeated spaces.
+
+    Args:
+        value (Any): Cell value
+
+    Returns:
+        str: Normalized cell text
+    """
+
+    return " ".join(str(value).split())
+
+
+def parse_number(value: Any) -> int | None:
+    """Parses a numeric cell.
+
+    Args:
+        value (Any): Cell value, a number or a string with digit group separators
+
+    Returns:
+        int | None: Parsed number or None if the cell is empty or a dash
+    """
+
+    text = normalize_cell(value).replace(" ", "").replace(",", ".")
+    if text in ("", "-"):
+        return None
+
+    return int(float(text))
+
+
+def parse_trade_date(cell: str) -> datetime.date:
+    """Parses the trading date from the bulletin's header cell.
+
+    Args:
+        cell (str): Normalized cell like "Дата торгов: 22.11.2024"
+
+    Returns:
+        datetime.date: Trading date
+    """
+
+    return datetime.datetime.strptime(
+        cell.removeprefix(TRADE_DATE_PREFIX).strip(), "%d.%m.%Y"
+    ).date()
+
+
+def parse_bulletin_rows(rows: Iterable[list[Any]]) -> Iterator[TradeResultRecord]:
+    """Parses trade results of the metric ton section of a bulletin.
+
+    Oil, delivery basis and delivery type ids are taken from the exchange product
+    code. Products without contracts are skipped.
+
+    Args:
+        rows (Iterable[list[Any]]): Rows of the bulletin's sheet
+
+    Yields:
+        TradeResultRecord: Parsed trade result
+    """
+
+    trade_date = None
+    in_section = False
+    columns: dict[str, int] = {}
+
+    for row in rows:
+        cells = [normalize_cell(value) for value in row]
+        filled = [cell for cell in cells if cell]
+        if not filled:
+            continue
+
+        if trade_date is None:
+            if filled[0].startswith(TRADE_DATE_PREFIX):
+                trade_date = parse_trade_date(filled[0])
+            continue
+
+        if not in_section:
+            in_section = filled[0] == METRIC_TON_SECTION
+            continue
+
+        if not columns:
+            if HEADER_COLUMNS["exchange_product_id"] in cells:
+                columns = {
+                    name: cells.index(header) for name, header in HEADER_COLUMNS.items()
+                }
+            continue
+
+        if filled[0].startswith(TOTAL_ROW_PREFIX):
+            return
+
+        count = parse_number(row[columns["count"]])
+        if not count:
+            continue
+
+        exchange_product_id = cells[columns["exchange_product_id"]]
+        yield TradeResultRecord(
+            exchange_product_id=exchange_product_id,
+            exchange_product_name=cells[columns["exchange_product_name"]],
+            oil_id=exchange_product_id[:4],
+            delivery_basis_id=exchange_product_id[4:7],
+            delivery_basis_name=cells[columns["delivery_basis_name"]],
+            delivery_type_id=exchange_product_id[-1],
+            volume=parse_number(row[columns["volume"]]) or 0,
+            total=parse_number(row[columns["total"]]) or 0,
+            count=count,
+            date=trade_date,
+        )
+
+
+def read_rows(path: Path) -> Iterator[list[Any]]:
+    """Reads rows of the bulletin's first sheet.
+
+    Bulletins are published as ".xls" spreadsheets. Their ".csv" exports, e.g. test
+    fixtures, are read without spreadsheet dependencies.
+
+    Args:
+        path (Path): Path to the bulletin file
+
+    Yields:
+        list[Any]: Row cells
+    """
+
+    if path.suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as file:
+            yield from csv.reader(file)
+        return
+
+    sheet = xlrd.open_workbook(path).sheet_by_index(0)
+    for index in range(sheet.nrows):
+        yield sheet.row_values(index)
+
+
+def parse_bulletin(path: Path) -> list[TradeResultRecord]:
+    """Parses trade results from a bulletin file.
+
+    Args:
+        path (Path): Path to ".xls" bulletin or its ".csv" export
+
+    Returns:
+        list[TradeResultRecord]: Parsed trade results
+    """
+
+    return list(parse_bulletin_rows(read_rows(path)))
+
+
+def find_bulletins(paths: Iterable[Path]) -> list[Path]:
+    """Expands directories to bulletin files they contain.
+
+    Args:
+        paths (Iterable[Path]): Bulletin files and directories
+
+    Returns:
+        list[Path]: Bulletin files sorted by name within each directory
+    """
+
+    bulletins = []
+    for path in paths:
+        if path.is_dir():
+            bulletins.extend(
+                sorted(
+                    child
+                    for child in path.rglob("*")
+                    if child.suffix in BULLETIN_SUFFIXES
+                )
+            )
+        else:
+            bulletins.append(path)
+
+    return bulletins
@@ -0,0 +1,122 @@
+from collections.abc import Sequence
+
+from asyncpg import Connection
+
+from core.models import (
+    SpimexDailyAggregate,
+    SpimexDeliveryBasis,
+    SpimexDeliveryType,
+    SpimexOil,
+    SpimexTradeResult,
+)
+
+from .bulletin import TradeResultRecord
+
+TABLE = SpimexTradeResult.__tablename__
+AGGREGATE_TABLE = SpimexDailyAggregate.__tablename__
+BASIS_TABLE = SpimexDeliveryBasis.__tablename__
+DICTIONARY_COLUMNS = {
+    SpimexOil.__tablename__: "oil_id",
+    SpimexDeliveryType.__tablename__: "delivery_type_id",
+}
+STAGING_TABLE = f"staging_{TABLE}"
+COLUMNS = TradeResultRecord._fields
+NATURAL_KEY = ("exchange_product_id", "date")
+AGGREGATE_KEY = ("date", "oil_id", "delivery_basis_id", "delivery_type_id")
+
+COLUMNS_LIST = ", ".join(COLUMNS)
+NATURAL_KEY_LIST = ", ".join(NATURAL_KEY)
+AGGREGATE_KEY_LIST = ", ".join(AGGREGATE_KEY)
+UPDATE_LIST = ", ".join(
+    f"{column} = EXCLUDED.{column}" for column in COLUMNS if column not in NATURAL_KEY
+)
+
+CREATE_STAGING_STATEMENT = f"""
+    CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DELETE ROWS AS
+    SELECT {COLUMNS_LIST} FROM {TABLE} WITH NO DATA
+"""
+UPSERT_STATEMENT = f"""
+    INSERT INTO {TABLE} ({COLUMNS_LIST})
+    SELECT DISTINCT ON ({NATURAL_KEY_LIST}) {COLUMNS_LIST}
+    FROM {STAGING_TABLE}
+    ORDER BY {NATURAL_KEY_LIST}
+    ON CONFLICT ({NATURAL_KEY_LIST}) DO UPDATE SET {UPDATE_LIST}, updated_on = now()
+"""
+DELETE_AGGREGATES_STATEMENT = f"""
+    DELETE FROM {AGGREGATE_TABLE}
+    WHERE date IN (SELECT DISTINCT date FROM {STAGING_TABLE})
+"""
+INSERT_AGGREGATES_STATEMENT = f"""
+    INSERT INTO {AGGREGATE_TABLE} ({AGGREGATE_KEY_LIST}, volume, total, count)
+    SELECT {AGGREGATE_KEY_LIST}, sum(volume), sum(total), sum(count)
+    FROM {TABLE}
+    WHERE date IN (SELECT DISTINCT date FROM {STAGING_TABLE})
+    GROUP BY {AGGREGATE_KEY_LIST}
+    ON CONFLICT ({AGGREGATE_KEY_LIST}) DO UPDATE SET
+        volume = EXCLUDED.volume,
+        total = EXCLUDED.total,
+        count = EXCLUDED.count,
+        updated_on = now()
+"""
+
+INSERT_DICTIONARY_STATEMENTS = [
+    f"""
+    INSERT INTO {table} ({column})
+    SELECT DISTINCT {column} FROM {STAGING_TABLE}
+    ON CONFLICT ({column}) DO NOTHING
+    """
+    for table, column in DICTIONARY_COLUMNS.items()
+]
+# Names of batches older than the last seen trading day of a basis are skipped
+UPSERT_BASIS_STATEMENT = f"""
+    INSERT INTO {BASIS_TABLE} AS basis
+        (delivery_basis_id, delivery_basis_name, last_seen_date)
+    SELECT DISTINCT ON (delivery_basis_id)
+        delivery_basis_id, delivery_basis_name, date
+    FROM {STAGING_TABLE}
+    ORDER BY delivery_basis_id, date DESC
+    ON CONFLICT (delivery_basis_id) DO UPDATE SET
+        delivery_basis_name = EXCLUDED.delivery_basis_name,
+        last_seen_date = EXCLUDED.last_seen_date,
+        updated_on = now()
+    WHERE EXCLUDED.last_seen_date >= basis.last_seen_date
+        AND (EXCLUDED.last_seen_date, EXCLUDED.delivery_basis_name)
+            IS DISTINCT FROM (basis.last_seen_date, basis.delivery_basis_name)
+"""
+
+
+async def load_batch(
+    connection: Connection, records: Sequence[TradeResultRecord]
+) -> int:
+    """Copies trade results to the staging table and upserts them by the natural key.
+
+    The staging table lives for the connection's session and is emptied on commit,
+    so a pooled connection reuses it for every batch. The connection must not go
+    through PgBouncer in transaction pooling mode, which shares server sessions
+    between clients. Duplicates within the batch are
+    collapsed before the upsert. Daily aggregates of the batch's trading days are
+    recalculated and new oils, delivery bases and types are added to dictionaries in
+    the same transaction, delivery bases taking names of the latest trading day seen
+    so far.
+
+    Args:
+        connection (Connection): Asyncpg connection
+        records (Sequence[TradeResultRecord]): Trade results to load
+
+    Returns:
+        int: The number of inserted or updated rows
+    """
+
+    async with connection.transaction():
+        await connection.execute(CREATE_STAGING_STATEMENT)
+        await connection.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=COLUMNS
+        )
+        status = await connection.execute(UPSERT_STATEMENT)
+        await connection.execute(DELETE_AGGREGATES_STATEMENT)
+        await connection.execute(INSERT_AGGREGATES_STATEMENT)
+        for statement in INSERT_DICTIONARY_STATEMENTS:
+            await connection.execute(statement)
+        await connection.execute(UPSERT_BASIS_STATEMENT)
+
+    return int(status.split()[-1])
@@ -0,0 +1,71 @@
+import logging
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .bulletin import TradeResultRecord, find_bulletins, parse_bulletin
+from .loader import load_batch
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionReport(NamedTuple):
+    """Totals of an ingestion run."""
+
+    files: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Loaded {self.rows} rows from {self.files} files in {self.seconds:.1f}s "
+            f"({self.rows_per_second:.0f} rows/sec)"
+        )
+
+
+async def ingest_bulletins(
+    paths: Iterable[Path], engine: AsyncEngine, batch_size: int = 5000
+) -> IngestionReport:
+    """Parses bulletins and loads their trade results in batches.
+
+    Trade results of consecutive bulletins are buffered and copied to the database
+    once the buffer holds "batch_size" rows, so small daily bulletins don't cost a
+    round trip each.
+
+    Args:
+        paths (Iterable[Path]): Bulletin files and directories with them
+        engine (AsyncEngine): Sqlalchemy async engine to take a connection from
+        batch_size (int): The number of trade results loaded at once. 5000 by default
+
+    Returns:
+        IngestionReport: The number of loaded files and rows and elapsed time
+    """
+
+    started = time.perf_counter()
+    files = rows = 0
+    buffer: list[TradeResultRecord] = []
+
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        connection = raw_connection.driver_connection
+
+        for path in find_bulletins(paths):
+            buffer.extend(parse_bulletin(path))
+            files += 1
+
+            while len(buffer) >= batch_size:
+                rows += await load_batch(connection, buffer[:batch_size])
+                del buffer[:batch_size]
+                logger.info("Loaded %s rows, last file '%s'", rows, path)
+
+        if buffer:
+            rows += await load_batch(connection, buffer)
+
+    return IngestionReport(files, rows, time.perf_counter() - started)
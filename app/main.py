@@ -1,9 +1,10 @@
 import uvicorn
 from fastapi import FastAPI
 
-from api import api_router
+from api import api_router, metrics_router
 from core.config import settings
 from core.lifespan import lifespan
+from core.metrics import MetricsMiddleware
 
 app = FastAPI(
     lifespan=lifespan,
@@ -12,6 +13,9 @@ app.include_router(
     api_router,
     prefix=settings.api.prefix,
 )
+if settings.metrics.enabled:
+    app.add_middleware(MetricsMiddleware, server_timing=settings.metrics.server_timing)
+    app.include_router(metrics_router)
 
 
 if __name__ == "__main__":
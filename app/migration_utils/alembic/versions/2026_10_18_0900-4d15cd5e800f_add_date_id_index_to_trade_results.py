@@ -0,0 +1,32 @@
+"""add date id index to trade results
+
+Revision ID: 4d15cd5e800f
+Revises: 48e69b77576f
+Create Date: 2026-10-18 09:00:12.417903+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d15cd5e800f"
+down_revision: Union[str, None] = "48e69b77576f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spimex_trading_results_date_id",
+        "spimex_trading_results",
+        ["date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_spimex_trading_results_date_id", table_name="spimex_trading_results"
+    )
@@ -0,0 +1,53 @@
+"""add filter indexes to trade results
+
+Revision ID: 35cac6410764
+Revises: 4d15cd5e800f
+Create Date: 2026-10-18 09:30:41.208316+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "35cac6410764"
+down_revision: Union[str, None] = "4d15cd5e800f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_spimex_trading_results_oil_id_basis_id_type_id_date_id",
+        "spimex_trading_results",
+        ["oil_id", "delivery_basis_id", "delivery_type_id", "date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spimex_trading_results_basis_id_type_id_date_id",
+        "spimex_trading_results",
+        ["delivery_basis_id", "delivery_type_id", "date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spimex_trading_results_type_id_date_id",
+        "spimex_trading_results",
+        ["delivery_type_id", "date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_spimex_trading_results_type_id_date_id",
+        table_name="spimex_trading_results",
+    )
+    op.drop_index(
+        "ix_spimex_trading_results_basis_id_type_id_date_id",
+        table_name="spimex_trading_results",
+    )
+    op.drop_index(
+        "ix_spimex_trading_results_oil_id_basis_id_type_id_date_id",
+        table_name="spimex_trading_results",
+    )
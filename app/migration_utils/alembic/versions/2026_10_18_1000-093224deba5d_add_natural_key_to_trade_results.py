@@ -0,0 +1,43 @@
+"""add natural key to trade results
+
+Revision ID: 093224deba5d
+Revises: 35cac6410764
+Create Date: 2026-10-18 10:00:12.540871+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "093224deba5d"
+down_revision: Union[str, None] = "35cac6410764"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the latest row of duplicates inserted by row-by-row loads
+    op.execute(
+        """
+        DELETE FROM spimex_trading_results AS duplicate
+        USING spimex_trading_results AS latest
+        WHERE duplicate.exchange_product_id = latest.exchange_product_id
+            AND duplicate.date = latest.date
+            AND duplicate.id < latest.id
+        """
+    )
+    op.create_unique_constraint(
+        op.f("uq_spimex_trading_results_exchange_product_id"),
+        "spimex_trading_results",
+        ["exchange_product_id", "date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        op.f("uq_spimex_trading_results_exchange_product_id"),
+        "spimex_trading_results",
+        type_="unique",
+    )
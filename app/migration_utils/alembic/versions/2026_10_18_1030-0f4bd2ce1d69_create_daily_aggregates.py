@@ -0,0 +1,78 @@
+"""create daily aggregates
+
+Revision ID: 0f4bd2ce1d69
+Revises: 093224deba5d
+Create Date: 2026-10-18 10:30:27.118403+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0f4bd2ce1d69"
+down_revision: Union[str, None] = "093224deba5d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "spimex_daily_aggregates",
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("oil_id", sa.String(), nullable=False),
+        sa.Column("delivery_basis_id", sa.String(), nullable=False),
+        sa.Column("delivery_type_id", sa.String(), nullable=False),
+        sa.Column("volume", sa.BigInteger(), nullable=False),
+        sa.Column("total", sa.BigInteger(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "created_on",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_on",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_spimex_daily_aggregates")),
+        sa.UniqueConstraint(
+            "date",
+            "oil_id",
+            "delivery_basis_id",
+            "delivery_type_id",
+            name=op.f("uq_spimex_daily_aggregates_date"),
+        ),
+    )
+    op.create_index(
+        "ix_spimex_daily_aggregates_oil_id_date",
+        "spimex_daily_aggregates",
+        ["oil_id", "date"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO spimex_daily_aggregates (
+            date, oil_id, delivery_basis_id, delivery_type_id, volume, total, count
+        )
+        SELECT
+            date, oil_id, delivery_basis_id, delivery_type_id,
+            sum(volume), sum(total), sum(count)
+        FROM spimex_trading_results
+        GROUP BY date, oil_id, delivery_basis_id, delivery_type_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_spimex_daily_aggregates_oil_id_date",
+        table_name="spimex_daily_aggregates",
+    )
+    op.drop_table("spimex_daily_aggregates")
@@ -0,0 +1,123 @@
+"""partition trade results
+
+Revision ID: 5b7e2a9c4d13
+Revises: 0f4bd2ce1d69
+Create Date: 2026-10-18 11:00:08.214530+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e2a9c4d13"
+down_revision: Union[str, None] = "0f4bd2ce1d69"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def create_keys(primary_key: list[str]) -> None:
+    op.create_primary_key(
+        op.f("pk_spimex_trading_results"), "spimex_trading_results", primary_key
+    )
+    op.create_unique_constraint(
+        op.f("uq_spimex_trading_results_exchange_product_id"),
+        "spimex_trading_results",
+        ["exchange_product_id", "date"],
+    )
+    op.create_index(
+        "ix_spimex_trading_results_date_id",
+        "spimex_trading_results",
+        ["date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spimex_trading_results_oil_id_basis_id_type_id_date_id",
+        "spimex_trading_results",
+        ["oil_id", "delivery_basis_id", "delivery_type_id", "date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spimex_trading_results_basis_id_type_id_date_id",
+        "spimex_trading_results",
+        ["delivery_basis_id", "delivery_type_id", "date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_spimex_trading_results_type_id_date_id",
+        "spimex_trading_results",
+        ["delivery_type_id", "date", "id"],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    op.rename_table("spimex_trading_results", "spimex_trading_results_old")
+    op.execute(
+        """
+        CREATE TABLE spimex_trading_results
+        (LIKE spimex_trading_results_old INCLUDING DEFAULTS)
+        PARTITION BY RANGE (date)
+        """
+    )
+    # Monthly partitions from the first trade date to 3 months ahead, the same as
+    # partitions maintenance creates
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month date := date_trunc(
+                'month', coalesce(
+                    (SELECT min(date) FROM spimex_trading_results_old), now()
+                )
+            );
+        BEGIN
+            WHILE month <= date_trunc('month', now()) + interval '3 months' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF spimex_trading_results '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'spimex_trading_results_' || to_char(month, '"y"YYYY"m"MM'),
+                    month,
+                    month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TABLE spimex_trading_results_default "
+        "PARTITION OF spimex_trading_results DEFAULT"
+    )
+    op.execute(
+        "INSERT INTO spimex_trading_results SELECT * FROM spimex_trading_results_old"
+    )
+    op.execute(
+        "ALTER SEQUENCE spimex_trading_results_id_seq "
+        "OWNED BY spimex_trading_results.id"
+    )
+    op.drop_table("spimex_trading_results_old")
+    # Keys are built after the copy, it is faster than maintaining them row by row
+    create_keys(["id", "date"])
+
+
+def downgrade() -> None:
+    op.rename_table("spimex_trading_results", "spimex_trading_results_partitioned")
+    op.execute(
+        """
+        CREATE TABLE spimex_trading_results
+        (LIKE spimex_trading_results_partitioned INCLUDING DEFAULTS)
+        """
+    )
+    op.execute(
+        "INSERT INTO spimex_trading_results "
+        "SELECT * FROM spimex_trading_results_partitioned"
+    )
+    op.execute(
+        "ALTER SEQUENCE spimex_trading_results_id_seq "
+        "OWNED BY spimex_trading_results.id"
+    )
+    op.drop_table("spimex_trading_results_partitioned")
+    create_keys(["id"])
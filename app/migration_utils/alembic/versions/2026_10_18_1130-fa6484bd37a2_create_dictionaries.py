@@ -0,0 +1,90 @@
+"""create dictionaries
+
+Revision ID: fa6484bd37a2
+Revises: 5b7e2a9c4d13
+Create Date: 2026-10-18 11:30:41.502817+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fa6484bd37a2"
+down_revision: Union[str, None] = "5b7e2a9c4d13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_on",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_on",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "spimex_oils",
+        sa.Column("oil_id", sa.String(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("oil_id", name=op.f("pk_spimex_oils")),
+    )
+    op.create_table(
+        "spimex_delivery_bases",
+        sa.Column("delivery_basis_id", sa.String(), nullable=False),
+        sa.Column("delivery_basis_name", sa.String(), nullable=False),
+        sa.Column("last_seen_date", sa.Date(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint(
+            "delivery_basis_id", name=op.f("pk_spimex_delivery_bases")
+        ),
+    )
+    op.create_table(
+        "spimex_delivery_types",
+        sa.Column("delivery_type_id", sa.String(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint(
+            "delivery_type_id", name=op.f("pk_spimex_delivery_types")
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO spimex_oils (oil_id)
+        SELECT DISTINCT oil_id FROM spimex_trading_results
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO spimex_delivery_bases
+            (delivery_basis_id, delivery_basis_name, last_seen_date)
+        SELECT DISTINCT ON (delivery_basis_id)
+            delivery_basis_id, delivery_basis_name, date
+        FROM spimex_trading_results
+        ORDER BY delivery_basis_id, date DESC
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO spimex_delivery_types (delivery_type_id)
+        SELECT DISTINCT delivery_type_id FROM spimex_trading_results
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("spimex_delivery_types")
+    op.drop_table("spimex_delivery_bases")
+    op.drop_table("spimex_oils")
@@ -0,0 +1,49 @@
+"""cover date index of trade results
+
+Revision ID: 7e1c9b3f5a28
+Revises: fa6484bd37a2
+Create Date: 2026-10-18 17:00:26.581947+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e1c9b3f5a28"
+down_revision: Union[str, None] = "fa6484bd37a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        "ix_spimex_trading_results_date_id", table_name="spimex_trading_results"
+    )
+    op.create_index(
+        "ix_spimex_trading_results_date_id",
+        "spimex_trading_results",
+        ["date", "id"],
+        unique=False,
+        postgresql_include=[
+            "oil_id",
+            "delivery_basis_id",
+            "delivery_type_id",
+            "volume",
+            "total",
+            "count",
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_spimex_trading_results_date_id", table_name="spimex_trading_results"
+    )
+    op.create_index(
+        "ix_spimex_trading_results_date_id",
+        "spimex_trading_results",
+        ["date", "id"],
+        unique=False,
+    )
@@ -3,7 +3,13 @@ from datetime import date, timedelta
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.models import SpimexTradeResult
+from core.models import (
+    SpimexDailyAggregate,
+    SpimexDeliveryBasis,
+    SpimexDeliveryType,
+    SpimexOil,
+    SpimexTradeResult,
+)
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -48,3 +54,73 @@ async def five_test_results(
     await test_session.commit()
 
     return models
+
+
+@pytest_asyncio.fixture(scope="function")
+async def daily_test_aggregates(
+    test_session: AsyncSession,
+) -> list[SpimexDailyAggregate]:
+    """Creates and adds to testing database daily aggregates of two oils for three
+    days starting from the previous day.
+
+    Args:
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+
+    Returns:
+        list[SpimexDailyAggregate]: A list of "SpimexDailyAggregate" model instances
+        ordered by date and oil id
+    """
+
+    current_date = date.today()
+    models = [
+        SpimexDailyAggregate(
+            date=current_date - timedelta(days=days),
+            oil_id=oil_id,
+            delivery_basis_id="delivery_basis_id_test",
+            delivery_type_id="delivery_type_id_test",
+            volume=100 * days,
+            total=10_000_000_000 * days,
+            count=days,
+        )
+        for days in range(3, 0, -1)
+        for oil_id in ("oil_id_test A", "oil_id_test B")
+    ]
+    test_session.add_all(models)
+    await test_session.commit()
+
+    return models
+
+
+@pytest_asyncio.fixture(scope="function")
+async def three_test_dictionaries(
+    test_session: AsyncSession,
+) -> tuple[list[SpimexOil], list[SpimexDeliveryBasis], list[SpimexDeliveryType]]:
+    """Creates and adds to testing database dictionaries of oils, delivery bases and
+    delivery types, three entries each added in reverse order of their ids.
+
+    Args:
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+
+    Returns:
+        tuple[list[SpimexOil], list[SpimexDeliveryBasis], list[SpimexDeliveryType]]:
+        Lists of dictionaries' model instances ordered by their ids
+    """
+
+    suffixes = ("C", "B", "A")
+    oils = [SpimexOil(oil_id=f"oil_id_test {suffix}") for suffix in suffixes]
+    delivery_bases = [
+        SpimexDeliveryBasis(
+            delivery_basis_id=f"delivery_basis_id_test {suffix}",
+            delivery_basis_name=f"delivery_basis_name_test {suffix}",
+            last_seen_date=date.today(),
+        )
+        for suffix in suffixes
+    ]
+    delivery_types = [
+        SpimexDeliveryType(delivery_type_id=f"delivery_type_id_test {suffix}")
+        for suffix in suffixes
+    ]
+    test_session.add_all([*oils, *delivery_bases, *delivery_types])
+    await test_session.commit()
+
+    return oils[::-1], delivery_bases[::-1], delivery_types[::-1]
@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from core.models import SpimexTradeResult
+from core.schemas import TradeResultOut
+
+from .fixtures import five_test_results
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+URL = "/export"
+
+
+async def test_export_ndjson(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests the '/export' endpoint in NDJSON format.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    params = {"start_date": str(five_test_results[-1].date)}
+
+    response = await client.get(URL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert len(lines) == len(five_test_results)
+
+    trade_results = [TradeResultOut(**json.loads(line)) for line in lines]
+    expected_ids = [result_model.id for result_model in reversed(five_test_results)]
+    assert [trade_result.id for trade_result in trade_results] == expected_ids
+
+
+async def test_export_csv(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests the '/export' endpoint in CSV format with filter params.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    result_model = five_test_results[0]
+    params = {
+        "start_date": str(five_test_results[-1].date),
+        "oil_id": result_model.oil_id,
+        "format": "csv",
+    }
+
+    response = await client.get(URL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+
+    trade_result = TradeResultOut(**rows[0])
+    assert trade_result.id == result_model.id
+    assert trade_result.oil_id == result_model.oil_id
+    assert trade_result.date == result_model.date
+
+
+async def test_export_arrow_negotiated(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests the '/export' endpoint in Arrow IPC format chosen by the Accept header.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    pa = pytest.importorskip("pyarrow")
+
+    params = {"start_date": str(five_test_results[-1].date)}
+    headers = {"Accept": "text/csv;q=0.5, application/vnd.apache.arrow.stream"}
+
+    response = await client.get(URL, params=params, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    trade_results = pa.ipc.open_stream(response.content).read_all().to_pylist()
+    expected_ids = [result_model.id for result_model in reversed(five_test_results)]
+    assert [trade_result["id"] for trade_result in trade_results] == expected_ids
@@ -0,0 +1,116 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from core.models import SpimexDailyAggregate
+from core.schemas import TradeResultAggregateOut
+
+from .fixtures import daily_test_aggregates
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+URL = "/aggregate"
+BUCKET_STARTS = {
+    "day": lambda day: day,
+    "week": lambda day: day - timedelta(days=day.weekday()),
+    "month": lambda day: day.replace(day=1),
+}
+
+
+async def test_totals_by_day(
+    client: AsyncClient, daily_test_aggregates: list[SpimexDailyAggregate]
+) -> None:
+    """Tests that the '/aggregate' endpoint sums totals of all groups by day.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        daily_test_aggregates (list[SpimexDailyAggregate]): A list of test daily
+        aggregates model objects
+    """
+
+    params = {"start_date": str(date.today() - timedelta(days=3))}
+
+    response = await client.get(URL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    aggregates = [TradeResultAggregateOut(**item) for item in response.json()]
+    assert [
+        (item.date, item.oil_id, item.volume, item.total, item.count, item.vwap)
+        for item in aggregates
+    ] == [
+        (
+            date.today() - timedelta(days=days),
+            None,
+            200 * days,
+            2e10 * days,
+            2 * days,
+            1e8,
+        )
+        for days in range(3, 0, -1)
+    ]
+
+
+@pytest.mark.parametrize("bucket", ["day", "week", "month"])
+async def test_group_by_and_bucket(
+    client: AsyncClient,
+    daily_test_aggregates: list[SpimexDailyAggregate],
+    bucket: str,
+) -> None:
+    """Tests the '/aggregate' endpoint grouping totals by oil within time buckets,
+    the first bucket starting on the period's start date.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        daily_test_aggregates (list[SpimexDailyAggregate]): A list of test daily
+        aggregates model objects
+        bucket (str): Time bucket
+    """
+
+    start_date = date.today() - timedelta(days=3)
+    expected = defaultdict(lambda: [0, 0, 0])
+    for model in daily_test_aggregates:
+        bucket_start = max(BUCKET_STARTS[bucket](model.date), start_date)
+        totals = expected[(bucket_start, model.oil_id)]
+        totals[0] += model.volume
+        totals[1] += model.total
+        totals[2] += model.count
+
+    params = {
+        "start_date": str(start_date),
+        "group_by": ["oil_id", "oil_id"],
+        "bucket": bucket,
+    }
+
+    response = await client.get(URL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    aggregates = [TradeResultAggregateOut(**item) for item in response.json()]
+    assert [
+        (item.date, item.oil_id, item.delivery_type_id, item.volume, item.total)
+        for item in aggregates
+    ] == [
+        (bucket_start, oil_id, None, volume, total)
+        for (bucket_start, oil_id), (volume, total, _) in sorted(expected.items())
+    ]
+
+
+async def test_invalid_params(client: AsyncClient) -> None:
+    """Tests that the '/aggregate' endpoint rejects unknown buckets and groups.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+    """
+
+    start_date = str(date.today())
+
+    response_bucket = await client.get(
+        URL, params={"start_date": start_date, "bucket": "year"}
+    )
+    response_group_by = await client.get(
+        URL, params={"start_date": start_date, "group_by": "exchange_product_id"}
+    )
+
+    assert response_bucket.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response_group_by.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from core.models import SpimexDailyAggregate
+from core.schemas import DailyAggregateOut
+
+from .fixtures import daily_test_aggregates
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+URL = "/dynamics/daily"
+
+
+async def test_period(
+    client: AsyncClient, daily_test_aggregates: list[SpimexDailyAggregate]
+) -> None:
+    """Tests that the '/dynamics/daily' endpoint returns daily totals within the
+    period ordered by date.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        daily_test_aggregates (list[SpimexDailyAggregate]): A list of test daily
+        aggregates model objects
+    """
+
+    start_date = date.today() - timedelta(days=2)
+
+    response = await client.get(URL, params={"start_date": str(start_date)})
+    assert response.status_code == status.HTTP_200_OK
+
+    aggregates = [DailyAggregateOut(**item) for item in response.json()]
+    assert aggregates == [
+        DailyAggregateOut.model_validate(model)
+        for model in daily_test_aggregates
+        if model.date >= start_date
+    ]
+    assert aggregates[0].total == 20_000_000_000
+
+
+async def test_filters_and_pagination(
+    client: AsyncClient, daily_test_aggregates: list[SpimexDailyAggregate]
+) -> None:
+    """Tests the '/dynamics/daily' endpoint with filters and pagination.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        daily_test_aggregates (list[SpimexDailyAggregate]): A list of test daily
+        aggregates model objects
+    """
+
+    params = {
+        "start_date": str(date.today() - timedelta(days=3)),
+        "oil_id": "oil_id_test B",
+        "limit": 2,
+        "skip": 1,
+    }
+
+    response = await client.get(URL, params=params)
+    assert response.status_code == status.HTTP_200_OK
+
+    aggregates = [DailyAggregateOut(**item) for item in response.json()]
+    assert [(item.oil_id, item.count) for item in aggregates] == [
+        ("oil_id_test B", 2),
+        ("oil_id_test B", 1),
+    ]
@@ -0,0 +1,81 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+
+from core.models import SpimexDeliveryBasis, SpimexDeliveryType, SpimexOil
+from core.schemas import DeliveryBasisOut, DeliveryTypeOut, OilOut
+
+from .fixtures import three_test_dictionaries
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
+
+async def test_get_oils(
+    client: AsyncClient,
+    three_test_dictionaries: tuple[
+        list[SpimexOil], list[SpimexDeliveryBasis], list[SpimexDeliveryType]
+    ],
+) -> None:
+    """Tests that the '/oils' endpoint returns oil types ordered by their ids.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        three_test_dictionaries (tuple[list[SpimexOil], list[SpimexDeliveryBasis],
+        list[SpimexDeliveryType]]): Test dictionaries model objects
+    """
+
+    oils, _, _ = three_test_dictionaries
+
+    response = await client.get("/oils")
+    assert response.status_code == status.HTTP_200_OK
+    assert [OilOut(**item) for item in response.json()] == [
+        OilOut.model_validate(model) for model in oils
+    ]
+
+
+async def test_get_delivery_bases(
+    client: AsyncClient,
+    three_test_dictionaries: tuple[
+        list[SpimexOil], list[SpimexDeliveryBasis], list[SpimexDeliveryType]
+    ],
+) -> None:
+    """Tests that the '/delivery-bases' endpoint returns delivery bases with their
+    names ordered by their ids.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        three_test_dictionaries (tuple[list[SpimexOil], list[SpimexDeliveryBasis],
+        list[SpimexDeliveryType]]): Test dictionaries model objects
+    """
+
+    _, delivery_bases, _ = three_test_dictionaries
+
+    response = await client.get("/delivery-bases")
+    assert response.status_code == status.HTTP_200_OK
+    assert [DeliveryBasisOut(**item) for item in response.json()] == [
+        DeliveryBasisOut.model_validate(model) for model in delivery_bases
+    ]
+
+
+async def test_get_delivery_types(
+    client: AsyncClient,
+    three_test_dictionaries: tuple[
+        list[SpimexOil], list[SpimexDeliveryBasis], list[SpimexDeliveryType]
+    ],
+) -> None:
+    """Tests that the '/delivery-types' endpoint returns delivery types ordered by
+    their ids.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        three_test_dictionaries (tuple[list[SpimexOil], list[SpimexDeliveryBasis],
+        list[SpimexDeliveryType]]): Test dictionaries model objects
+    """
+
+    _, _, delivery_types = three_test_dictionaries
+
+    response = await client.get("/delivery-types")
+    assert response.status_code == status.HTTP_200_OK
+    assert [DeliveryTypeOut(**item) for item in response.json()] == [
+        DeliveryTypeOut.model_validate(model) for model in delivery_types
+    ]
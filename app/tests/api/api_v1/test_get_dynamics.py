@@ -1,11 +1,13 @@
 from datetime import date
+from unittest.mock import patch
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from core.config import settings
 from core.models import SpimexTradeResult
-from core.schemas import DynamicsFilterParams, TradeResultOut
+from core.schemas import DynamicsFilterParams, TradeResultOut, TradeResultsPage
 
 from .fixtures import five_test_results
 
@@ -125,3 +127,60 @@ async def test_cache(client: AsyncClient) -> None:
     assert response_param_miss.status_code == status.HTTP_200_OK
 
     assert response_param_miss.headers.get("x-fastapi-cache") == "MISS"
+
+
+async def test_cursor_pagination(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests the '/dynamics' endpoint in cursor pagination mode.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    params = {
+        "start_date": str(five_test_results[-1].date),
+        "limit": 3,
+        "cursor": "",
+    }
+
+    response_first = await client.get(URL, params=params)
+    assert response_first.status_code == status.HTTP_200_OK
+
+    first_page = TradeResultsPage(**response_first.json())
+    assert [item.id for item in first_page.results] == [1, 2, 3]
+    assert first_page.next_cursor is not None
+
+    params["cursor"] = first_page.next_cursor
+    response_second = await client.get(URL, params=params)
+    assert response_second.status_code == status.HTTP_200_OK
+
+    second_page = TradeResultsPage(**response_second.json())
+    assert [item.id for item in second_page.results] == [4, 5]
+    assert second_page.next_cursor is None
+
+
+async def test_fast_json(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests that the '/dynamics' endpoint returns the same results with fast json
+    responses enabled.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    params = {"start_date": str(five_test_results[-1].date)}
+
+    response_default = await client.get(URL, params=params)
+    assert response_default.status_code == status.HTTP_200_OK
+
+    with patch.object(settings.response, "fast_json", True):
+        response_fast = await client.get(URL, params={**params, "limit": 9})
+
+    assert response_fast.status_code == status.HTTP_200_OK
+    assert response_fast.json() == response_default.json()
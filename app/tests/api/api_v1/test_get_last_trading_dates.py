@@ -58,8 +58,9 @@ async def test_with_days_params(
 async def test_cache(client: AsyncClient) -> None:
     """Tests cache for the '/last_dates' endpoint.
 
-    Sends tree requests to endpoint and checks cache headers in the responses.
-    The second request gets data from cache.
+    Sends four requests to endpoint and checks cache headers in the responses.
+    The second request and the request with explicitly passed default "days" value
+    get data from cache.
 
     Args:
         client (AsyncClient): Test client to make requests to the app
@@ -74,7 +75,12 @@ async def test_cache(client: AsyncClient) -> None:
     assert response_miss.headers.get("x-fastapi-cache") == "MISS"
     assert response_hit.headers.get("x-fastapi-cache") == "HIT"
 
-    response_param_miss = await client.get(URL, params={"days": 1})
+    response_default_hit = await client.get(URL, params={"days": 1})
+    assert response_default_hit.status_code == status.HTTP_200_OK
+
+    assert response_default_hit.headers.get("x-fastapi-cache") == "HIT"
+
+    response_param_miss = await client.get(URL, params={"days": 2})
     assert response_param_miss.status_code == status.HTTP_200_OK
 
     assert response_param_miss.headers.get("x-fastapi-cache") == "MISS"
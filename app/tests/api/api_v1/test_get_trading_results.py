@@ -1,9 +1,12 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from core.config import settings
 from core.models import SpimexTradeResult
-from core.schemas import TradeResultOut, TradingFilterParams
+from core.schemas import TradeResultOut, TradeResultsPage, TradingFilterParams
 
 from .fixtures import five_test_results
 
@@ -109,3 +112,74 @@ async def test_cache(client: AsyncClient) -> None:
     assert response_param_miss.status_code == status.HTTP_200_OK
 
     assert response_param_miss.headers.get("x-fastapi-cache") == "MISS"
+
+
+async def test_cursor_pagination(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests the '/' endpoint in cursor pagination mode.
+
+    Walks through all pages with limit 2 and checks that results are returned in
+    descending date order without gaps and duplicates.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    params = {"limit": 2, "cursor": ""}
+    result_ids = []
+
+    while True:
+        response = await client.get(URL, params=params)
+        assert response.status_code == status.HTTP_200_OK
+
+        page = TradeResultsPage(**response.json())
+        result_ids.extend(trade_result.id for trade_result in page.results)
+
+        if page.next_cursor is None:
+            break
+        params["cursor"] = page.next_cursor
+
+    assert result_ids == [result_model.id for result_model in five_test_results]
+
+
+async def test_invalid_cursor(client: AsyncClient) -> None:
+    """Tests the '/' endpoint with malformed cursor.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+    """
+
+    response = await client.get(URL, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_fast_json(
+    client: AsyncClient, five_test_results: list[SpimexTradeResult]
+) -> None:
+    """Tests that the '/' endpoint returns the same results with fast json responses
+    enabled.
+
+    Args:
+        client (AsyncClient): Test client to make requests
+        five_test_results (list[SpimexTradeResult]): A list of test trade results
+        model objects
+    """
+
+    response_default = await client.get(URL, params={"limit": 3})
+    assert response_default.status_code == status.HTTP_200_OK
+
+    with patch.object(settings.response, "fast_json", True):
+        response_fast = await client.get(URL, params={"limit": 4})
+        response_fast_page = await client.get(URL, params={"limit": 3, "cursor": ""})
+
+    assert response_fast.status_code == status.HTTP_200_OK
+    assert response_fast.json()[:3] == response_default.json()
+
+    assert response_fast_page.status_code == status.HTTP_200_OK
+    page = TradeResultsPage(**response_fast_page.json())
+    assert [item.id for item in page.results] == [1, 2, 3]
+    assert page.next_cursor is not None
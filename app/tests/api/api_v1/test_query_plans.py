@@ -0,0 +1,197 @@
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils import TradeResultCursor
+
+from api.api_v1.crud import (
+    read_all_trade_results,
+    read_dynamics,
+    read_last_trading_dates,
+)
+from core.models import SpimexTradeResult
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
+TABLE = SpimexTradeResult.__tablename__
+ROWS = 50_000
+ROWS_PER_DAY = 100
+# Filter values of FILTERS select from 0.5% (oil) to 20% (delivery type) of rows
+SEED_STATEMENT = f"""
+    INSERT INTO {TABLE} (
+        id, exchange_product_id, exchange_product_name, oil_id, delivery_basis_id,
+        delivery_basis_name, delivery_type_id, volume, total, count, date
+    )
+    SELECT
+        n,
+        'product ' || n,
+        'product name ' || n,
+        'A' || n % 200,
+        CASE n % 50 WHEN 0 THEN 'NVY' ELSE 'B' || n % 50 END,
+        'basis name ' || n % 50,
+        CASE n % 5 WHEN 0 THEN 'F' ELSE 'T' || n % 5 END,
+        n % 1000,
+        n % 1000 * 100,
+        n % 10 + 1,
+        CURRENT_DATE - n / {ROWS_PER_DAY}
+    FROM generate_series(1, {ROWS}) AS n
+"""
+
+FILTERS = [
+    {"oil_id": None, "delivery_type_id": None, "delivery_basis_id": None},
+    {"oil_id": "A100", "delivery_type_id": None, "delivery_basis_id": None},
+    {"oil_id": "A100", "delivery_type_id": "F", "delivery_basis_id": None},
+    {"oil_id": "A100", "delivery_type_id": "F", "delivery_basis_id": "NVY"},
+    {"oil_id": None, "delivery_type_id": None, "delivery_basis_id": "NVY"},
+    {"oil_id": None, "delivery_type_id": "F", "delivery_basis_id": "NVY"},
+    {"oil_id": None, "delivery_type_id": "F", "delivery_basis_id": None},
+]
+PAGINATION = [
+    {"limit": 10, "skip": 0},
+    {"limit": 10, "skip": 0, "keyset": True},
+    {
+        "limit": 10,
+        "skip": 0,
+        "keyset": True,
+        "after": TradeResultCursor(date.today(), 100),
+    },
+]
+DYNAMICS_PERIOD = {
+    "start_date": date.today() - timedelta(days=30),
+    "end_date": date.today(),
+}
+
+
+def find_seq_scans(plan: dict[str, Any]) -> list[str]:
+    """Collects relations scanned sequentially in the query plan.
+
+    Args:
+        plan (dict[str, Any]): A node of the plan in EXPLAIN JSON format
+
+    Returns:
+        list[str]: Names of sequentially scanned relations
+    """
+
+    seq_scans = []
+    if plan["Node Type"] == "Seq Scan":
+        seq_scans.append(plan["Relation Name"])
+
+    for subplan in plan.get("Plans", []):
+        seq_scans.extend(find_seq_scans(subplan))
+
+    return seq_scans
+
+
+@pytest_asyncio.fixture(scope="function")
+async def trade_results_data(start_db, test_session: AsyncSession) -> None:
+    """Fills the testing database with a year and a half of trade results and
+    analyzes them, so the planner chooses plans by real statistics instead of
+    defaults of an empty table.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+    """
+
+    await test_session.execute(text(SEED_STATEMENT))
+    await test_session.commit()
+    await test_session.execute(text(f"ANALYZE {TABLE}"))
+    await test_session.commit()
+
+
+async def explain(
+    session: AsyncSession, query: Callable[..., Awaitable[Any]], **kwargs: Any
+) -> dict[str, Any]:
+    """Runs the CRUD function, captures its statement and explains it.
+
+    The planner runs with default settings, so a sequential scan in the plan means
+    it is cheaper than any index for the statement.
+
+    Args:
+        session (AsyncSession): Sqlalchemy async session to testing database
+        query (Callable[..., Awaitable[Any]]): CRUD function to explain
+        kwargs (Any): Arguments for the CRUD function
+
+    Returns:
+        dict[str, Any]: The root node of the query plan
+    """
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await query(session=session, **kwargs)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+
+    return plan[0]["Plan"]
+
+
+@pytest.mark.parametrize("pagination", PAGINATION)
+@pytest.mark.parametrize("filters", FILTERS)
+async def test_read_all_trade_results_plan(
+    trade_results_data, test_session: AsyncSession, filters: dict, pagination: dict
+) -> None:
+    """Tests that "read_all_trade_results" is served by indexes.
+
+    Args:
+        trade_results_data: Fixture to fill testing database with trade results
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+        filters (dict): Filter parameters
+        pagination (dict): Pagination parameters
+    """
+
+    plan = await explain(test_session, read_all_trade_results, **filters, **pagination)
+
+    assert find_seq_scans(plan) == []
+
+
+@pytest.mark.parametrize("pagination", PAGINATION)
+@pytest.mark.parametrize("filters", FILTERS)
+async def test_read_dynamics_plan(
+    trade_results_data, test_session: AsyncSession, filters: dict, pagination: dict
+) -> None:
+    """Tests that "read_dynamics" is served by indexes.
+
+    Args:
+        trade_results_data: Fixture to fill testing database with trade results
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+        filters (dict): Filter parameters
+        pagination (dict): Pagination parameters
+    """
+
+    plan = await explain(
+        test_session, read_dynamics, **DYNAMICS_PERIOD, **filters, **pagination
+    )
+
+    assert find_seq_scans(plan) == []
+
+
+async def test_read_last_trading_dates_plan(
+    trade_results_data, test_session: AsyncSession
+) -> None:
+    """Tests that "read_last_trading_dates" is served by indexes.
+
+    Args:
+        trade_results_data: Fixture to fill testing database with trade results
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+    """
+
+    plan = await explain(test_session, read_last_trading_dates, days=5)
+
+    assert find_seq_scans(plan) == []
@@ -63,6 +63,12 @@ async def client(start_db, cache) -> AsyncGenerator[AsyncClient, None]:
     """
 
     app.dependency_overrides[db_connector.get_session] = test_db_connector.get_session
+    app.dependency_overrides[db_connector.get_read_session] = (
+        test_db_connector.get_read_session
+    )
+    app.dependency_overrides[db_connector.get_read_session_factory] = (
+        test_db_connector.get_read_session_factory
+    )
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -0,0 +1,37 @@
+import csv
+from pathlib import Path
+
+HEADER = [
+    "Код Инструмента",
+    "Наименование Инструмента",
+    "Базис поставки",
+    "Объем Договоров в единицах измерения",
+    "Обьем Договоров, руб.",
+    "Количество Договоров, шт.",
+]
+
+
+def write_bulletin(path: Path, trade_date: str, products: list[list]) -> Path:
+    """Writes a bulletin exported to csv.
+
+    Args:
+        path (Path): Path to the file
+        trade_date (str): Trading date in "DD.MM.YYYY" format
+        products (list[list]): Rows of the metric ton section
+
+    Returns:
+        Path: Path to the file
+    """
+
+    with path.open("w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(
+            [
+                [f"Дата торгов: {trade_date}"],
+                ["Единица измерения: Метрическая тонна"],
+                HEADER,
+                *products,
+                ["Итого:"],
+            ]
+        )
+
+    return path
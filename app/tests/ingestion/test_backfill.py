@@ -0,0 +1,59 @@
+from pathlib import Path
+
+import pytest
+from ingestion import backfill_bulletins
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import SpimexTradeResult
+
+from .fixtures import write_bulletin
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
+
+async def test_backfill_bulletins(
+    start_db, test_session: AsyncSession, tmp_path: Path
+) -> None:
+    """Tests that backfill loads bulletins with concurrent writers and resumes from
+    the checkpoint.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+        tmp_path (Path): Temporary directory for bulletins
+    """
+
+    bulletins_path = tmp_path / "bulletins"
+    bulletins_path.mkdir()
+    for day in range(10, 20):
+        write_bulletin(
+            bulletins_path / f"oil_202411{day}.csv",
+            f"{day}.11.2024",
+            [
+                ["A100NVY060F", "Бензин (АИ-100-К5)", "ст. Новоярославская", 60, 1, 1],
+                ["A592ACH005A", "Бензин (АИ-92-К5)", "Ачинский НПЗ", 5, 1, 1],
+            ],
+        )
+    checkpoint_path = tmp_path / "checkpoint.txt"
+    checkpoint_path.write_text(f"{bulletins_path / 'oil_20241110.csv'}\n")
+
+    report = await backfill_bulletins(
+        [bulletins_path],
+        test_session.bind,
+        batch_size=1,
+        writers=3,
+        processes=2,
+        queue_size=2,
+        checkpoint_path=checkpoint_path,
+    )
+    resumed_report = await backfill_bulletins(
+        [bulletins_path], test_session.bind, checkpoint_path=checkpoint_path
+    )
+
+    db_count = await test_session.scalar(select(func.count(SpimexTradeResult.id)))
+
+    assert (report.files, report.rows) == (9, 18)
+    assert (resumed_report.files, resumed_report.rows) == (0, 0)
+    assert db_count == 18
+    assert len(checkpoint_path.read_text().splitlines()) == 10
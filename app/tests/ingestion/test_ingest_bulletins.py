@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import pytest
+from ingestion import ingest_bulletins
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import (
+    SpimexDailyAggregate,
+    SpimexDeliveryBasis,
+    SpimexOil,
+    SpimexTradeResult,
+)
+
+from .fixtures import write_bulletin
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
+
+async def test_ingest_bulletins(
+    start_db, test_session: AsyncSession, tmp_path: Path
+) -> None:
+    """Tests that bulletins are loaded in batches and upserted by natural key, and
+    daily aggregates and dictionaries are refreshed.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+        tmp_path (Path): Temporary directory for bulletins
+    """
+
+    write_bulletin(
+        tmp_path / "oil_20241121.csv",
+        "21.11.2024",
+        [
+            ["A100NVY060F", "Бензин (АИ-100-К5)", "ст. Новоярославская", 60, 100, 1],
+            ["A592ACH005A", "Бензин (АИ-92-К5)", "Ачинский НПЗ", 5, 50, 1],
+        ],
+    )
+    write_bulletin(
+        tmp_path / "oil_20241122.csv",
+        "22.11.2024",
+        [["A100NVY060F", "Бензин (АИ-100-К5)", "ст. Новоярославская", 120, 200, 2]],
+    )
+
+    first_report = await ingest_bulletins([tmp_path], test_session.bind, batch_size=2)
+    write_bulletin(
+        tmp_path / "oil_20241122.csv",
+        "22.11.2024",
+        [["A100NVY060F", "Бензин (АИ-100-К5)", "ст. Новоярославская", 180, 300, 3]],
+    )
+    second_report = await ingest_bulletins(
+        [tmp_path / "oil_20241122.csv"], test_session.bind
+    )
+
+    db_results = await test_session.execute(
+        select(SpimexTradeResult.date, SpimexTradeResult.count).order_by(
+            SpimexTradeResult.date, SpimexTradeResult.exchange_product_id
+        )
+    )
+    db_aggregates = await test_session.execute(
+        select(
+            SpimexDailyAggregate.date,
+            SpimexDailyAggregate.oil_id,
+            SpimexDailyAggregate.volume,
+            SpimexDailyAggregate.count,
+        ).order_by(SpimexDailyAggregate.date, SpimexDailyAggregate.oil_id)
+    )
+
+    db_oils = await test_session.scalars(
+        select(SpimexOil.oil_id).order_by(SpimexOil.oil_id)
+    )
+    db_delivery_bases = await test_session.execute(
+        select(
+            SpimexDeliveryBasis.delivery_basis_id,
+            SpimexDeliveryBasis.delivery_basis_name,
+        ).order_by(SpimexDeliveryBasis.delivery_basis_id)
+    )
+
+    assert (first_report.files, first_report.rows) == (2, 3)
+    assert (second_report.files, second_report.rows) == (1, 1)
+    assert [(str(date), count) for date, count in db_results] == [
+        ("2024-11-21", 1),
+        ("2024-11-21", 1),
+        ("2024-11-22", 3),
+    ]
+    assert [(str(date), *totals) for date, *totals in db_aggregates] == [
+        ("2024-11-21", "A100", 60, 1),
+        ("2024-11-21", "A592", 5, 1),
+        ("2024-11-22", "A100", 180, 3),
+    ]
+    assert db_oils.all() == ["A100", "A592"]
+    assert [tuple(row) for row in db_delivery_bases] == [
+        ("ACH", "Ачинский НПЗ"),
+        ("NVY", "ст. Новоярославская"),
+    ]
+
+
+async def test_older_bulletin_keeps_basis_name(
+    start_db, test_session: AsyncSession, tmp_path: Path
+) -> None:
+    """Tests that bulletins older than the last seen trading day of a delivery basis
+    don't change its name.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+        tmp_path (Path): Temporary directory for bulletins
+    """
+
+    for day, basis_name in (("22", "ст. Новоярославская"), ("20", "Новоярославская")):
+        write_bulletin(
+            tmp_path / f"oil_202411{day}.csv",
+            f"{day}.11.2024",
+            [["A100NVY060F", "Бензин (АИ-100-К5)", basis_name, 60, 100, 1]],
+        )
+        await ingest_bulletins([tmp_path / f"oil_202411{day}.csv"], test_session.bind)
+
+    db_delivery_bases = await test_session.execute(
+        select(
+            SpimexDeliveryBasis.delivery_basis_id,
+            SpimexDeliveryBasis.delivery_basis_name,
+            SpimexDeliveryBasis.last_seen_date,
+        )
+    )
+
+    assert [tuple(map(str, row)) for row in db_delivery_bases] == [
+        ("NVY", "ст. Новоярославская", "2024-11-22")
+    ]
@@ -0,0 +1,139 @@
+import asyncio
+import datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import SpimexTradeResult, maintain_partitions
+from core.models.partitions import (
+    DEFAULT_PARTITION,
+    PARTITIONS_STATEMENT,
+    TABLE,
+    add_months,
+    detached_name,
+    partition_name,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="package")
+
+CURRENT_MONTH = datetime.date.today().replace(day=1)
+OLD_MONTH = add_months(CURRENT_MONTH, -24)
+UPCOMING_PARTITIONS = [
+    partition_name(add_months(CURRENT_MONTH, months)) for months in range(4)
+]
+
+
+async def add_trade_results(session: AsyncSession, month: datetime.date) -> None:
+    """Adds two trade results of the month to the testing database.
+
+    Args:
+        session (AsyncSession): Sqlalchemy async session to testing database
+        month (datetime.date): The first day of the month
+    """
+
+    session.add_all(
+        SpimexTradeResult(
+            exchange_product_id=f"exchange_product_id_test {day}",
+            exchange_product_name=f"exchange_product_name_test {day}",
+            oil_id="A100",
+            delivery_basis_id="NVY",
+            delivery_basis_name="ст. Новоярославская",
+            delivery_type_id="F",
+            volume=100,
+            total=101,
+            count=1,
+            date=month.replace(day=day),
+        )
+        for day in (1, 2)
+    )
+    await session.commit()
+
+
+async def count_rows(session: AsyncSession, table: str) -> int:
+    """Counts rows of the table.
+
+    Args:
+        session (AsyncSession): Sqlalchemy async session to testing database
+        table (str): Table name
+
+    Returns:
+        int: The number of rows
+    """
+
+    return await session.scalar(select(func.count()).select_from(text(table)))
+
+
+async def test_maintain_partitions_moves_default_rows(
+    start_db, test_session: AsyncSession
+) -> None:
+    """Tests that partitions are created ahead and for months of rows that fell to
+    the default partition, moving the rows out of it.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+    """
+
+    await add_trade_results(test_session, OLD_MONTH)
+
+    created = await maintain_partitions(test_session.bind)
+
+    assert created == [partition_name(OLD_MONTH), *UPCOMING_PARTITIONS]
+    assert await count_rows(test_session, DEFAULT_PARTITION) == 0
+    assert await count_rows(test_session, partition_name(OLD_MONTH)) == 2
+    assert await count_rows(test_session, TABLE) == 2
+
+
+async def test_maintain_partitions_twice(start_db, test_session: AsyncSession) -> None:
+    """Tests that maintenance creates nothing when partitions exist, also when it
+    runs concurrently.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+    """
+
+    concurrent_created = await asyncio.gather(
+        maintain_partitions(test_session.bind),
+        maintain_partitions(test_session.bind),
+    )
+    created = await maintain_partitions(test_session.bind)
+    partitions = await test_session.scalars(PARTITIONS_STATEMENT, {"table": TABLE})
+
+    assert sorted(sum(concurrent_created, [])) == UPCOMING_PARTITIONS
+    assert created == []
+    assert sorted(partitions) == sorted([DEFAULT_PARTITION, *UPCOMING_PARTITIONS])
+
+
+async def test_maintain_partitions_detaches_expired(
+    start_db, test_session: AsyncSession
+) -> None:
+    """Tests that expired partitions are detached under another name and rows of
+    their months loaded later stay in the default partition.
+
+    Args:
+        start_db: Fixture to recreate testing database
+        test_session (AsyncSession): Sqlalchemy async session to testing database
+    """
+
+    name = partition_name(OLD_MONTH)
+    await add_trade_results(test_session, OLD_MONTH)
+    await maintain_partitions(test_session.bind)
+
+    try:
+        await maintain_partitions(test_session.bind, retention_months=12)
+        partitions = await test_session.scalars(PARTITIONS_STATEMENT, {"table": TABLE})
+
+        assert name not in set(partitions)
+        assert await count_rows(test_session, detached_name(name)) == 2
+        assert await count_rows(test_session, TABLE) == 0
+
+        await add_trade_results(test_session, OLD_MONTH)
+        created = await maintain_partitions(test_session.bind, retention_months=12)
+
+        assert created == []
+        assert await count_rows(test_session, DEFAULT_PARTITION) == 2
+    finally:
+        await test_session.execute(text(f"DROP TABLE IF EXISTS {detached_name(name)}"))
+        await test_session.commit()
@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+from ingestion.backfill import Checkpoint, parse_bulletins
+
+from tests.ingestion.fixtures import write_bulletin
+
+
+def test_checkpoint_resumes(tmp_path: Path):
+    """Tests that bulletins marked as loaded are known to the next run."""
+
+    path = tmp_path / "checkpoint.txt"
+    first_run = Checkpoint(path)
+    first_run.mark_loaded(tmp_path / "oil_20241121.csv")
+
+    second_run = Checkpoint(path)
+
+    assert second_run.is_loaded(tmp_path / "oil_20241121.csv")
+    assert not second_run.is_loaded(tmp_path / "oil_20241122.csv")
+    assert not Checkpoint(None).is_loaded(tmp_path / "oil_20241121.csv")
+
+
+@pytest.mark.asyncio
+async def test_parse_bulletins_backpressure(tmp_path: Path):
+    """Tests that bulletins are parsed in order and parsing waits for the queue."""
+
+    bulletins = [
+        write_bulletin(
+            tmp_path / f"oil_202411{day}.csv",
+            f"{day}.11.2024",
+            [[f"A100NVY0{day}F", "Бензин", "ст. Новоярославская", 1, 1, 1]],
+        )
+        for day in range(10, 15)
+    ]
+    queue = asyncio.Queue(maxsize=1)
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        producer = asyncio.create_task(parse_bulletins(bulletins, queue, pool, 2))
+        while not queue.full():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        assert not producer.done()
+
+        parsed = []
+        while len(parsed) < len(bulletins):
+            path, records = await queue.get()
+            parsed.append((path, records[0].exchange_product_id))
+        await producer
+
+    assert parsed == [
+        (bulletin, f"A100NVY0{day}F")
+        for bulletin, day in zip(bulletins, range(10, 15), strict=False)
+    ]
@@ -0,0 +1,91 @@
+import csv
+import datetime
+from pathlib import Path
+
+from ingestion.bulletin import (
+    TradeResultRecord,
+    find_bulletins,
+    parse_bulletin,
+    parse_bulletin_rows,
+)
+
+BULLETIN_ROWS = [
+    ["", "Бюллетень по итогам торгов в Секции «Нефтепродукты»"],
+    ["", "Дата торгов: 22.11.2024"],
+    ["", "Единица измерения: Метрическая тонна"],
+    [
+        "",
+        "Код\nИнструмента",
+        "Наименование\nИнструмента",
+        "Базис\nпоставки",
+        "Объем\nДоговоров\nв единицах\nизмерения",
+        "Обьем\nДоговоров,\nруб.",
+        "Количество\nДоговоров,\nшт.",
+    ],
+    [
+        "",
+        "A100NVY060F",
+        "Бензин (АИ-100-К5)",
+        "ст. Новоярославская",
+        60.0,
+        5100000.0,
+        1.0,
+    ],
+    ["", "A592ACH005A", "Бензин (АИ-92-К5)", "Ачинский НПЗ", "-", "-", "-"],
+    ["", "DT0KSR060F", "ДТ Л-К5", "ст. Стенькино II", "1 200", "78 000 000", "12"],
+    ["", "Итого:", "", "", "1260", "83100000", "13"],
+    ["", "Единица измерения: Килограмм"],
+    ["", "ST0000000F", "Сера", "ст. Сургут", 10.0, 100.0, 1.0],
+]
+
+
+def test_parse_bulletin_rows():
+    """Tests that trade results with contracts are parsed from the metric ton
+    section."""
+
+    records = list(parse_bulletin_rows(BULLETIN_ROWS))
+
+    assert records == [
+        TradeResultRecord(
+            exchange_product_id="A100NVY060F",
+            exchange_product_name="Бензин (АИ-100-К5)",
+            oil_id="A100",
+            delivery_basis_id="NVY",
+            delivery_basis_name="ст. Новоярославская",
+            delivery_type_id="F",
+            volume=60,
+            total=5100000,
+            count=1,
+            date=datetime.date(2024, 11, 22),
+        ),
+        TradeResultRecord(
+            exchange_product_id="DT0KSR060F",
+            exchange_product_name="ДТ Л-К5",
+            oil_id="DT0K",
+            delivery_basis_id="SR0",
+            delivery_basis_name="ст. Стенькино II",
+            delivery_type_id="F",
+            volume=1200,
+            total=78000000,
+            count=12,
+            date=datetime.date(2024, 11, 22),
+        ),
+    ]
+
+
+def test_parse_bulletin_csv(tmp_path: Path):
+    """Tests that bulletins exported to csv are parsed and found in folders."""
+
+    path = tmp_path / "2024" / "oil_20241122.csv"
+    path.parent.mkdir()
+    with path.open("w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(BULLETIN_ROWS)
+    (tmp_path / "2024" / "notes.txt").write_text("not a bulletin")
+
+    bulletins = find_bulletins([tmp_path])
+
+    assert bulletins == [path]
+    assert [record.exchange_product_id for record in parse_bulletin(path)] == [
+        "A100NVY060F",
+        "DT0KSR060F",
+    ]
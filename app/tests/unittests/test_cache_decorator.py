@@ -0,0 +1,311 @@
+import datetime
+from collections.abc import AsyncGenerator
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Query
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils import compress
+
+from core.config import settings
+from core.redis import cache, data_version, request_key_builder
+from core.redis.cache_decorator import open_sessions
+
+app = FastAPI()
+compute = MagicMock()
+
+
+@app.get("/cached")
+@cache(
+    namespace="test", expire=lambda: compute.expire(), key_builder=request_key_builder
+)
+async def cached_endpoint(days: int = Query(1)) -> list[int]:
+    return compute(days)
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="function")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Provides async client for the test application with in-memory cache."""
+
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), prefix="test_cache_decorator")
+    compute.reset_mock()
+    compute.side_effect = lambda days: list(range(days))
+    compute.expire.return_value = 100
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+    await FastAPICache.clear()
+    FastAPICache.reset()
+
+
+@pytest.mark.asyncio
+async def test_expiration_is_calculated_per_write(client: AsyncClient):
+    """Tests that expiration is calculated for every new cache entry."""
+
+    response_first = await client.get("/cached", params={"days": 1})
+    compute.expire.return_value = 50
+    response_second = await client.get("/cached", params={"days": 2})
+
+    assert response_first.headers["cache-control"] == "max-age=100"
+    assert response_second.headers["cache-control"] == "max-age=50"
+    assert compute.expire.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_generation_invalidates_cache(client: AsyncClient):
+    """Tests that cache entries of the previous generation are not used."""
+
+    with patch(
+        "core.redis.cache_decorator.get_cache_generation", return_value="2024-01-01"
+    ):
+        response_miss = await client.get("/cached")
+        response_hit = await client.get("/cached")
+
+    with patch(
+        "core.redis.cache_decorator.get_cache_generation", return_value="2024-01-02"
+    ):
+        response_next_generation = await client.get("/cached")
+
+    assert response_miss.headers["x-fastapi-cache"] == "MISS"
+    assert response_hit.headers["x-fastapi-cache"] == "HIT"
+    assert response_hit.json() == response_miss.json()
+    assert response_next_generation.headers["x-fastapi-cache"] == "MISS"
+    assert compute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_refreshed_in_background(client: AsyncClient):
+    """Tests that an expired entry is served stale and refreshed in background."""
+
+    counts = {
+        status: REGISTRY.get_sample_value(
+            "cache_requests_total", {"namespace": "test", "status": status}
+        )
+        for status in ("hit", "stale", "miss")
+    }
+
+    with patch.object(settings.cache, "stale_ttl", 600):
+        compute.expire.return_value = 0
+        response_miss = await client.get("/cached")
+        compute.expire.return_value = 100
+        response_stale = await client.get("/cached")
+        response_hit = await client.get("/cached")
+
+    assert response_miss.headers["x-fastapi-cache"] == "MISS"
+    assert response_stale.headers["x-fastapi-cache"] == "STALE"
+    assert response_stale.headers["cache-control"] == "max-age=0"
+    assert response_stale.json() == response_miss.json()
+    assert response_hit.headers["x-fastapi-cache"] == "HIT"
+    assert compute.call_count == 2
+    assert {
+        status: REGISTRY.get_sample_value(
+            "cache_requests_total", {"namespace": "test", "status": status}
+        )
+        - count
+        for status, count in counts.items()
+    } == {"hit": 1, "stale": 1, "miss": 1}
+
+
+@pytest.mark.asyncio
+async def test_previous_generation_is_served_stale(client: AsyncClient):
+    """Tests that the entry of the previous generation is served stale after the
+    cache reset and refreshed in background."""
+
+    with patch.object(settings.cache, "stale_ttl", 600):
+        with patch(
+            "core.redis.cache_decorator.get_cache_generation",
+            side_effect=lambda previous=False: "2024-01-01",
+        ):
+            response_miss = await client.get("/cached")
+
+        with patch(
+            "core.redis.cache_decorator.get_cache_generation",
+            side_effect=lambda previous=False: (
+                "2024-01-01" if previous else "2024-01-02"
+            ),
+        ):
+            response_stale = await client.get("/cached")
+            response_hit = await client.get("/cached")
+
+    assert response_miss.headers["x-fastapi-cache"] == "MISS"
+    assert response_stale.headers["x-fastapi-cache"] == "STALE"
+    assert response_hit.headers["x-fastapi-cache"] == "HIT"
+    assert compute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_conditional_request_is_not_modified(client: AsyncClient):
+    """Tests that a request with the current ETag gets 304 without reading cache."""
+
+    with patch(
+        "core.redis.cache_decorator.get_cache_generation", return_value="2024-01-01"
+    ):
+        response_miss = await client.get("/cached")
+        etag = response_miss.headers["etag"]
+
+        with patch.object(
+            FastAPICache.get_backend(), "get_with_ttl", side_effect=AssertionError
+        ):
+            response_not_modified = await client.get(
+                "/cached", headers={"If-None-Match": f'W/"other", {etag}'}
+            )
+            response_not_modified_since = await client.get(
+                "/cached",
+                headers={"If-Modified-Since": response_miss.headers["last-modified"]},
+            )
+        response_other_params = await client.get(
+            "/cached", params={"days": 2}, headers={"If-None-Match": etag}
+        )
+
+    with patch(
+        "core.redis.cache_decorator.get_cache_generation", return_value="2024-01-02"
+    ):
+        response_next_generation = await client.get(
+            "/cached", headers={"If-None-Match": etag}
+        )
+
+    assert etag.startswith('"')
+    assert response_not_modified.status_code == 304
+    assert response_not_modified.headers["etag"] == etag
+    assert response_not_modified.content == b""
+    assert response_not_modified_since.status_code == 304
+    assert response_other_params.status_code == 200
+    assert response_other_params.headers["etag"] != etag
+    assert response_next_generation.status_code == 200
+    assert response_next_generation.headers["etag"] != etag
+    assert compute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_compressed_body_is_cached(client: AsyncClient):
+    """Tests that the body is compressed once when cached and sent as is on hits."""
+
+    params = {"days": 1000}
+
+    with (
+        patch.object(settings.response, "compression", ["gzip"]),
+        patch("core.redis.cache_decorator.compress", wraps=compress) as mock_compress,
+    ):
+        response_miss = await client.get(
+            "/cached", params=params, headers={"Accept-Encoding": "gzip"}
+        )
+        response_hit = await client.get(
+            "/cached", params=params, headers={"Accept-Encoding": "br;q=1, gzip;q=0.5"}
+        )
+        response_identity = await client.get(
+            "/cached", params=params, headers={"Accept-Encoding": "identity"}
+        )
+        response_small = await client.get(
+            "/cached", params={"days": 2}, headers={"Accept-Encoding": "gzip"}
+        )
+
+    for response in (response_miss, response_hit):
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"].endswith('-gzip"')
+        assert response.json() == list(range(1000))
+    assert response_hit.headers["x-fastapi-cache"] == "HIT"
+    assert "content-encoding" not in response_identity.headers
+    assert response_identity.headers["etag"] != response_hit.headers["etag"]
+    assert response_identity.json() == list(range(1000))
+    assert "content-encoding" not in response_small.headers
+    assert mock_compress.call_count == 1
+    assert compute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_compressed_body_is_not_read(client: AsyncClient):
+    """Tests that hits read a compressed body only if the entry lists it."""
+
+    backend = FastAPICache.get_backend()
+
+    with patch.object(settings.response, "compression", ["gzip"]):
+        await client.get("/cached", params={"days": 2})
+        await client.get("/cached", params={"days": 1000})
+
+        with patch.object(
+            backend, "get_with_ttl", wraps=backend.get_with_ttl
+        ) as mock_get_with_ttl:
+            response_small = await client.get(
+                "/cached", params={"days": 2}, headers={"Accept-Encoding": "gzip"}
+            )
+            response_identity = await client.get(
+                "/cached", params={"days": 1000}, headers={"Accept-Encoding": "br"}
+            )
+            reads = [call.args[0] for call in mock_get_with_ttl.call_args_list]
+
+    assert response_small.headers["x-fastapi-cache"] == "HIT"
+    assert "content-encoding" not in response_small.headers
+    assert response_small.json() == [0, 1]
+    assert response_identity.headers["x-fastapi-cache"] == "HIT"
+    assert response_identity.json() == list(range(1000))
+    assert len(reads) == 2
+    assert not any(key.endswith(":gzip") for key in reads)
+
+
+@pytest.mark.asyncio
+async def test_data_version_invalidates_cache(client: AsyncClient):
+    """Tests that entries of the previous data version are served stale with their
+    ETag and refreshed, and conditional requests with it are not matched."""
+
+    modified = datetime.datetime(2024, 1, 1, 18, tzinfo=datetime.timezone.utc)
+
+    with (
+        patch.object(settings.cache, "stale_ttl", 600),
+        patch(
+            "core.redis.cache_decorator.get_cache_generation", return_value="2024-01-01"
+        ),
+    ):
+        response_miss = await client.get("/cached")
+        etag = response_miss.headers["etag"]
+
+        with (
+            patch.object(data_version, "version", data_version.version + 1),
+            patch.object(data_version, "modified", modified),
+        ):
+            response_stale = await client.get(
+                "/cached", headers={"If-None-Match": etag}
+            )
+            response_hit = await client.get("/cached")
+            response_not_modified = await client.get(
+                "/cached", headers={"If-None-Match": response_hit.headers["etag"]}
+            )
+
+    assert response_stale.status_code == 200
+    assert response_stale.headers["x-fastapi-cache"] == "STALE"
+    assert response_stale.headers["etag"] == etag
+    assert response_hit.headers["x-fastapi-cache"] == "HIT"
+    assert response_hit.headers["etag"] != etag
+    assert response_hit.headers["last-modified"] == format_datetime(modified, True)
+    assert response_not_modified.status_code == 304
+    assert compute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_opens_own_sessions():
+    """Tests that background refresh gets new read sessions instead of request's
+    ones and closes them."""
+
+    request_session = MagicMock(spec=AsyncSession)
+    refresh_session = MagicMock(spec=AsyncSession)
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = refresh_session
+
+    with patch("core.redis.cache_decorator.db_connector") as connector:
+        connector.get_read_session_factory.return_value = session_factory
+        async with open_sessions({"session": request_session, "days": 1}) as kwargs:
+            assert kwargs == {"session": refresh_session, "days": 1}
+            session_factory.return_value.__aexit__.assert_not_awaited()
+
+    session_factory.return_value.__aexit__.assert_awaited_once()
+    request_session.close.assert_not_called()
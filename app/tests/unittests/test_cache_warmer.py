@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from core.redis.cache_warmer import CacheWarmer
+
+app = FastAPI()
+requested = []
+
+
+@app.get("/warmed")
+async def warmed_endpoint(request: Request) -> dict:
+    requested.append((str(request.url), request.headers.get("Cache-Control")))
+    return {}
+
+
+@pytest.fixture(scope="function", autouse=True)
+def cache_prefix() -> None:
+    """Inits FastAPICache prefix used by cache warmer keys."""
+
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), prefix="test_cache_warmer")
+    requested.clear()
+    yield
+    FastAPICache.reset()
+
+
+@pytest.mark.asyncio
+async def test_record_counts_request():
+    """Tests that cached requests are counted by path and query string in process
+    and flushed to Redis at once."""
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    request = MagicMock()
+    request.url.path = "/api/v1/trade-results/last-dates"
+    request.url.query = "days=5"
+    cache_warmer = CacheWarmer(redis)
+
+    cache_warmer.record(request)
+    cache_warmer.record(request)
+
+    redis.pipeline.assert_not_called()
+
+    await cache_warmer.flush()
+    await cache_warmer.flush()
+
+    key, amount, url = pipe.zincrby.call_args.args
+    assert key.startswith("test_cache_warmer:hits:")
+    assert (amount, url) == (2, "/api/v1/trade-results/last-dates?days=5")
+    pipe.expire.assert_called_once()
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_replays_requests():
+    """Tests that configured and popular requests are replayed once without
+    reading cache."""
+
+    redis = AsyncMock()
+    redis.set.return_value = True
+    redis.zrevrange.return_value = [b"/warmed?days=2", b"/warmed?days=1"]
+    cache_warmer = CacheWarmer()
+    cache_warmer.init(app, redis, urls=["/warmed?days=1"], top=2)
+
+    warmed = await cache_warmer.warm_up()
+
+    assert warmed == 2
+    assert requested == [
+        ("http://cache-warmer/warmed?days=1", "no-cache"),
+        ("http://cache-warmer/warmed?days=2", "no-cache"),
+    ]
+    redis.zrevrange.assert_awaited_once()
+    assert redis.zrevrange.call_args.args[1:] == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_once_per_generation():
+    """Tests that only the worker holding the lock warms the generation."""
+
+    redis = AsyncMock()
+    redis.set.return_value = None
+    cache_warmer = CacheWarmer()
+    cache_warmer.init(app, redis, urls=["/warmed"])
+
+    warmed = await cache_warmer.warm_up()
+
+    assert warmed == 0
+    assert requested == []
+    redis.zrevrange.assert_not_awaited()
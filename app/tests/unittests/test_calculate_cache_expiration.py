@@ -1,7 +1,7 @@
 from datetime import datetime, time, timezone
 from unittest.mock import patch
 
-from utils import calculate_cache_expiration
+from utils import calculate_cache_expiration, get_cache_generation
 
 
 def test_calculate_cache_expiration():
@@ -22,3 +22,34 @@ def test_calculate_cache_expiration():
         mock_datetime.now.assert_called_once_with(tz=timezone.utc)
 
         assert result == 60 * 60
+
+
+def test_get_cache_generation():
+    """Tests get_cache_generation before and after the cache reset time"""
+
+    mock_expiration_time = time(hour=11)
+
+    with (
+        patch("utils.cache_expiration.settings") as mock_settings,
+        patch("utils.cache_expiration.datetime") as mock_datetime,
+    ):
+        mock_settings.cache.time_cache_expire_to = mock_expiration_time
+
+        mock_datetime.now.return_value = datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+        assert get_cache_generation() == "2024-01-01"
+
+        mock_datetime.now.return_value = datetime(2024, 1, 2, 11, tzinfo=timezone.utc)
+        assert get_cache_generation() == "2024-01-02"
+
+
+def test_get_previous_cache_generation():
+    """Tests get_cache_generation of the previous trading day"""
+
+    with (
+        patch("utils.cache_expiration.settings") as mock_settings,
+        patch("utils.cache_expiration.datetime") as mock_datetime,
+    ):
+        mock_settings.cache.time_cache_expire_to = time(hour=11)
+        mock_datetime.now.return_value = datetime(2024, 1, 2, 11, tzinfo=timezone.utc)
+
+        assert get_cache_generation(previous=True) == "2024-01-01"
@@ -0,0 +1,83 @@
+import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi_cache.coder import JsonCoder
+from utils import PreEncodedJSONResponse
+
+from core.config import settings
+from core.redis.coders import COMPRESSED, PLAIN, CompactCoder, get_coder
+
+pytest.importorskip("msgpack")
+pytest.importorskip("zstandard")
+
+TRADE_RESULTS = [
+    {
+        "id": trade_id,
+        "oil_id": "A100",
+        "volume": trade_id * 10,
+        "date": datetime.date(2024, 11, trade_id),
+    }
+    for trade_id in range(1, 4)
+]
+ENCODED_TRADE_RESULTS = [
+    {**trade_result, "date": trade_result["date"].isoformat()}
+    for trade_result in TRADE_RESULTS
+]
+
+
+@pytest.mark.parametrize(
+    ("value", "decoded"),
+    [
+        (TRADE_RESULTS, ENCODED_TRADE_RESULTS),
+        (
+            {"results": TRADE_RESULTS, "next_cursor": "abc"},
+            {"results": ENCODED_TRADE_RESULTS, "next_cursor": "abc"},
+        ),
+        ([{"id": 1}, {"id": 2, "extra": True}], [{"id": 1}, {"id": 2, "extra": True}]),
+        ([datetime.date(2024, 11, 22)], ["2024-11-22"]),
+        ([], []),
+    ],
+)
+def test_compact_coder_round_trip(value, decoded):
+    """Tests that values are decoded to the same JSON compatible data."""
+
+    assert CompactCoder.decode(CompactCoder.encode(value)) == decoded
+
+
+def test_compact_coder_pre_encoded_response():
+    """Tests that pre-encoded JSON responses are stored as their content."""
+
+    response = PreEncodedJSONResponse(JsonCoder.encode(ENCODED_TRADE_RESULTS))
+
+    assert CompactCoder.decode(CompactCoder.encode(response)) == ENCODED_TRADE_RESULTS
+
+
+def test_compact_coder_compresses_above_threshold():
+    """Tests that only payloads above the threshold are compressed and both are
+    smaller than JSON."""
+
+    value = TRADE_RESULTS * 100
+
+    with patch.object(settings.cache, "compression_threshold", 1024):
+        compressed = CompactCoder.encode(value)
+        plain = CompactCoder.encode(TRADE_RESULTS)
+
+    assert compressed[:1] == COMPRESSED
+    assert plain[:1] == PLAIN
+    assert len(compressed) < len(JsonCoder.encode(value)) / 10
+    assert len(plain) < len(JsonCoder.encode(TRADE_RESULTS))
+    assert CompactCoder.decode(compressed) == ENCODED_TRADE_RESULTS * 100
+
+
+def test_compact_coder_reads_json_entries():
+    """Tests that entries stored by the JSON coder are still decoded."""
+
+    assert CompactCoder.decode(b'[{"id": 1}]') == [{"id": 1}]
+
+
+def test_get_coder():
+    """Tests that coders are chosen by name."""
+
+    assert get_coder("compact") is CompactCoder
+    assert get_coder("json") is JsonCoder
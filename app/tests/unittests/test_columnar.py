@@ -0,0 +1,57 @@
+import io
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import Column, Date, DateTime, Integer, MetaData, String, Table
+from utils import ColumnarEncoder
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+TABLE = Table(
+    "trade_results",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("oil_id", String, nullable=False),
+    Column("date", Date, nullable=False),
+    Column("created_on", DateTime(timezone=True)),
+)
+ROWS = [
+    {
+        "id": trade_id,
+        "oil_id": f"A{trade_id}",
+        "date": date(2024, 1, trade_id),
+        "created_on": datetime(2024, 1, trade_id, 10, tzinfo=timezone.utc),
+    }
+    for trade_id in range(1, 6)
+]
+
+
+def encode(format: str) -> list[bytes]:
+    encoder = ColumnarEncoder(TABLE, format)
+
+    return [encoder.encode(ROWS[:3]), encoder.encode(ROWS[3:]), encoder.close()]
+
+
+def test_encode_arrow():
+    """Tests ColumnarEncoder writing Arrow IPC stream by batches"""
+
+    chunks = encode("arrow")
+    assert all(chunks)
+
+    reader = pa.ipc.open_stream(b"".join(chunks))
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [3, 2]
+    assert reader.schema.field("date").type == pa.date32()
+    assert reader.schema.field("created_on").type == pa.timestamp("us", tz="UTC")
+    assert pa.Table.from_batches(batches).to_pylist() == ROWS
+
+
+def test_encode_parquet():
+    """Tests ColumnarEncoder writing Parquet file by row groups"""
+
+    chunks = encode("parquet")
+
+    parquet_file = pq.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.read().to_pylist() == ROWS
@@ -0,0 +1,35 @@
+import gzip
+
+import brotli
+import pytest
+from utils import compress, negotiate_encoding
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1, br;q=0.5", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("*;q=0.5, gzip", "gzip"),
+        ("GZIP;q=bad", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str | None, encoding: str | None):
+    """Tests negotiate_encoding"""
+
+    assert negotiate_encoding(accept_encoding, ("br", "gzip")) == encoding
+
+
+def test_compress():
+    """Tests compress with gzip and brotli"""
+
+    body = b'{"id":1}' * 100
+
+    assert gzip.decompress(compress(body, "gzip")) == body
+    assert compress(body, "gzip") == compress(body, "gzip")
+
+    assert brotli.decompress(compress(body, "br")) == body
@@ -0,0 +1,61 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.redis.data_version import DataVersion
+
+
+@pytest.mark.asyncio
+async def test_bump_increments_version():
+    """Tests that bumping increments the version and records the load moment in
+    one transaction."""
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[3, 1])
+    redis = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    data_version = DataVersion(redis, key="test:data-version")
+
+    version = await data_version.bump()
+
+    assert version == data_version.version == 3
+    pipe.hincrby.assert_called_once_with("test:data-version", "version", 1)
+    key, field, modified = pipe.hset.call_args.args
+    assert (key, field) == ("test:data-version", "modified")
+    assert datetime.datetime.fromisoformat(modified) == data_version.modified
+    redis.pipeline.assert_called_once_with(transaction=True)
+
+
+@pytest.mark.asyncio
+async def test_refresh_reads_version():
+    """Tests that refreshing reads the version and keeps the known one if Redis
+    fails."""
+
+    modified = datetime.datetime(2024, 1, 2, 15, tzinfo=datetime.timezone.utc)
+    redis = MagicMock()
+    redis.hgetall = AsyncMock(
+        return_value={b"version": b"7", b"modified": modified.isoformat().encode()}
+    )
+    data_version = DataVersion(redis)
+
+    await data_version.refresh()
+    redis.hgetall.side_effect = ConnectionError("refused")
+    await data_version.refresh()
+
+    assert data_version.version == 7
+    assert data_version.modified == modified
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_loads():
+    """Tests that the version is 0 until trade results are loaded."""
+
+    redis = MagicMock()
+    redis.hgetall = AsyncMock(return_value={})
+    data_version = DataVersion(redis)
+
+    await data_version.refresh()
+
+    assert data_version.version == 0
+    assert data_version.modified is None
@@ -0,0 +1,57 @@
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from utils import encode_csv, encode_ndjson, negotiate_format
+
+ROWS = [
+    {"id": 1, "date": date(2024, 1, 1), "created_on": datetime(2024, 1, 1, 10)},
+    {
+        "id": 2,
+        "date": date(2024, 1, 2),
+        "created_on": datetime(2024, 1, 2, 10, tzinfo=timezone.utc),
+    },
+]
+
+
+def test_encode_ndjson():
+    """Tests encode_ndjson"""
+
+    lines = encode_ndjson(ROWS).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "date": "2024-01-01", "created_on": "2024-01-01T10:00:00"},
+        {"id": 2, "date": "2024-01-02", "created_on": "2024-01-02T10:00:00+00:00"},
+    ]
+
+
+def test_encode_csv():
+    """Tests encode_csv"""
+
+    assert encode_csv(ROWS, header=True).decode().splitlines() == [
+        "id,date,created_on",
+        "1,2024-01-01,2024-01-01T10:00:00",
+        "2,2024-01-02,2024-01-02T10:00:00+00:00",
+    ]
+    assert encode_csv(ROWS[:1]).decode().splitlines() == [
+        "1,2024-01-01,2024-01-01T10:00:00"
+    ]
+
+
+@pytest.mark.parametrize(
+    ("accept", "format"),
+    [
+        (None, "ndjson"),
+        ("*/*", "ndjson"),
+        ("text/csv", "csv"),
+        ("application/json, application/vnd.apache.parquet", "parquet"),
+        ("text/csv;q=0.5, application/vnd.apache.arrow.stream", "arrow"),
+        ("text/csv, application/x-ndjson", "csv"),
+        ("text/csv;q=0, application/x-ndjson;q=0.1", "ndjson"),
+        ("text/csv;q=bad", "ndjson"),
+    ],
+)
+def test_negotiate_format(accept: str | None, format: str):
+    """Tests negotiate_format"""
+
+    assert negotiate_format(accept) == format
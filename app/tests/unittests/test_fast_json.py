@@ -0,0 +1,35 @@
+import json
+from datetime import date, datetime, timezone
+
+from sqlalchemy.engine.result import result_tuple
+from utils import PreEncodedJSONResponse, encode_rows
+
+make_row = result_tuple(["id", "date", "created_on"])
+ROWS = [
+    make_row((1, date(2024, 1, 1), datetime(2024, 1, 1, 10, tzinfo=timezone.utc))),
+    make_row((2, date(2024, 1, 2), datetime(2024, 1, 2, 10, tzinfo=timezone.utc))),
+]
+EXPECTED = [
+    {"id": 1, "date": "2024-01-01", "created_on": "2024-01-01T10:00:00Z"},
+    {"id": 2, "date": "2024-01-02", "created_on": "2024-01-02T10:00:00Z"},
+]
+
+
+def test_encode_rows():
+    """Tests encode_rows"""
+
+    assert json.loads(encode_rows(ROWS)) == EXPECTED
+    assert json.loads(encode_rows(ROWS, next_cursor=None)) == {
+        "results": EXPECTED,
+        "next_cursor": None,
+    }
+
+
+def test_pre_encoded_json_response():
+    """Tests that PreEncodedJSONResponse sends encoded bytes as is."""
+
+    content = encode_rows(ROWS)
+    response = PreEncodedJSONResponse(content)
+
+    assert response.body == content
+    assert response.media_type == "application/json"
@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from core.redis import LayeredBackend
+from core.redis.layered_backend import LocalCache
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Tests that LocalCache evicts least recently used entries over the limits."""
+
+    local = LocalCache(max_entries=2, max_bytes=10)
+    local.set("a", b"1", 60)
+    local.set("b", b"2", 60)
+    local.get_with_ttl("a")
+    local.set("c", b"3", 60)
+
+    assert local.get_with_ttl("b") == (0, None)
+    assert local.get_with_ttl("a")[1] == b"1"
+
+    local.set("d", b"123456789", 60)
+
+    assert list(local.entries) == ["a", "d"]
+    assert local.size == 10
+
+
+def test_local_cache_expiration():
+    """Tests that LocalCache doesn't return expired entries."""
+
+    local = LocalCache(max_entries=2, max_bytes=10)
+    local.set("a", b"1", 0)
+    local.set("b", b"2", 60)
+
+    assert local.get_with_ttl("a") == (0, None)
+    ttl, value = local.get_with_ttl("b")
+    assert 58 <= ttl <= 60
+    assert value == b"2"
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_tiers():
+    """Tests that LayeredBackend serves repeated reads from the local tier reporting
+    the ttl of the remote entry."""
+
+    remote = AsyncMock()
+    remote.get_with_ttl.return_value = (100, b"value")
+    backend = LayeredBackend(remote, local_max_ttl=30)
+    labels = [
+        {"tier": tier, "result": result}
+        for tier in ("local", "remote")
+        for result in ("hit", "miss")
+    ]
+    counts = [
+        REGISTRY.get_sample_value("cache_tier_requests_total", label)
+        for label in labels
+    ]
+
+    assert await backend.get_with_ttl("key") == (100, b"value")
+    ttl, value = await backend.get_with_ttl("key")
+    assert 98 <= ttl <= 100
+    assert value == b"value"
+
+    remote.get_with_ttl.assert_awaited_once_with("key")
+    assert [
+        REGISTRY.get_sample_value("cache_tier_requests_total", label) - count
+        for label, count in zip(labels, counts, strict=True)
+    ] == [1, 1, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_layered_backend_clear():
+    """Tests that LayeredBackend clears both tiers and notifies other workers."""
+
+    remote = AsyncMock()
+    redis = AsyncMock()
+    backend = LayeredBackend(remote, redis=redis)
+
+    await backend.set("ns:key", b"value", 60)
+    await backend.clear(namespace="ns")
+
+    remote.set.assert_awaited_once_with("ns:key", b"value", 60)
+    remote.clear.assert_awaited_once_with("ns", None)
+    redis.publish.assert_awaited_once_with("cache-invalidation", "ns")
+    assert backend.local.entries == {}
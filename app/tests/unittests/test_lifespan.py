@@ -13,19 +13,54 @@ async def test_lifespan():
     mock_redis = MagicMock()
     mock_fastapi_cache = MagicMock()
     mock_redis_backend = MagicMock()
+    mock_layered_backend = AsyncMock()
+    mock_layered_backend_class = MagicMock(return_value=mock_layered_backend)
     mock_db_connector = AsyncMock()
+    mock_single_flight = MagicMock()
+    mock_cache_warmer = MagicMock()
+    mock_cache_warmer.flush = AsyncMock()
+    mock_partition_maintainer = MagicMock()
+    mock_data_version = MagicMock()
+    mock_data_version.refresh = AsyncMock()
+    mock_mark_process_dead = MagicMock()
 
     with (
         patch("core.lifespan.redis_client.get_client", return_value=mock_redis),
         patch("core.lifespan.RedisBackend", return_value=mock_redis_backend),
+        patch("core.lifespan.LayeredBackend", mock_layered_backend_class),
         patch("core.lifespan.FastAPICache.init", mock_fastapi_cache.init),
         patch("core.lifespan.db_connector", mock_db_connector),
+        patch("core.lifespan.single_flight", mock_single_flight),
+        patch("core.lifespan.cache_warmer", mock_cache_warmer),
+        patch("core.lifespan.partition_maintainer", mock_partition_maintainer),
+        patch("core.lifespan.data_version", mock_data_version),
+        patch("core.lifespan.mark_process_dead", mock_mark_process_dead),
     ):
         app = FastAPI(lifespan=lifespan)
 
         async with lifespan(app):
+            assert mock_layered_backend_class.call_args.args == (mock_redis_backend,)
+            assert mock_layered_backend_class.call_args.kwargs["redis"] == mock_redis
             mock_fastapi_cache.init.assert_called_once_with(
-                mock_redis_backend, prefix="main-cache"
+                mock_layered_backend, prefix="main-cache"
             )
+            mock_layered_backend.start.assert_awaited_once()
+            mock_db_connector.start.assert_awaited_once()
+            assert mock_single_flight.init.call_args.args == (mock_redis,)
+            assert mock_cache_warmer.init.call_args.args == (app, mock_redis)
+            mock_cache_warmer.start.assert_called_once()
+            assert mock_data_version.init.call_args.args == (mock_redis,)
+            mock_data_version.refresh.assert_awaited_once()
+            mock_data_version.start.assert_called_once()
+            assert mock_partition_maintainer.start.call_args.args[0] == (
+                mock_db_connector.engine
+            )
+
+        mock_cache_warmer.stop.assert_called_once()
+        mock_cache_warmer.flush.assert_awaited_once()
+        mock_data_version.stop.assert_called_once()
+        mock_partition_maintainer.stop.assert_called_once()
 
+        mock_layered_backend.stop.assert_awaited_once()
         mock_db_connector.dispose.assert_awaited_once()
+        mock_mark_process_dead.assert_called_once()
@@ -0,0 +1,26 @@
+from datetime import date
+
+import pytest
+from utils import TradeResultCursor, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Tests that encoded cursor decodes to the same position."""
+
+    cursor = encode_cursor(date(2024, 11, 22), 42)
+
+    assert decode_cursor(cursor) == TradeResultCursor(date(2024, 11, 22), 42)
+
+
+def test_empty_cursor():
+    """Tests that empty cursor points to the first page."""
+
+    assert decode_cursor("") is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(date.today(), 1)[1:]])
+def test_invalid_cursor(cursor: str):
+    """Tests that malformed cursor raises ValueError."""
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,30 @@
+import datetime
+
+from core.models.partitions import add_months, detached_name, partition_name
+
+
+def test_add_months():
+    """Tests that months are shifted across year boundaries."""
+
+    assert add_months(datetime.date(2024, 11, 1), 3) == datetime.date(2025, 2, 1)
+    assert add_months(datetime.date(2024, 1, 1), -1) == datetime.date(2023, 12, 1)
+    assert add_months(datetime.date(2024, 5, 1), 0) == datetime.date(2024, 5, 1)
+
+
+def test_partition_name():
+    """Tests that partition names sort in the order of months."""
+
+    assert (
+        partition_name(datetime.date(2024, 3, 1)) == "spimex_trading_results_y2024m03"
+    )
+    assert partition_name(datetime.date(2024, 3, 1)) < partition_name(
+        datetime.date(2024, 11, 1)
+    )
+
+
+def test_detached_name():
+    """Tests that detached partitions do not take names of new partitions."""
+
+    name = partition_name(datetime.date(2024, 3, 1))
+
+    assert detached_name(name) == "spimex_trading_results_y2024m03_detached"
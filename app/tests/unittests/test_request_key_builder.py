@@ -0,0 +1,60 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.redis import request_key_builder
+from core.schemas import DynamicsFilterParams, TradingFilterParams
+
+
+async def endpoint(): ...
+
+
+def build_key(**kwargs) -> str:
+    """Builds cache key for the test endpoint with given keyword arguments."""
+
+    kwargs["session"] = MagicMock(spec=AsyncSession)
+
+    return request_key_builder(
+        endpoint, "prefix:", request=MagicMock(), response=MagicMock(), kwargs=kwargs
+    )
+
+
+def test_default_params_share_key():
+    """Tests that explicitly passed default values, params order and types of query
+    args and database sessions don't change the key, while query args values do."""
+
+    assert build_key(filter_query=TradingFilterParams()) == build_key(
+        filter_query=TradingFilterParams(limit=10, skip=0)
+    )
+    assert build_key(
+        filter_query=TradingFilterParams(oil_id="A100", limit=5), days=1
+    ) == build_key(days=1, filter_query=TradingFilterParams(limit="5", oil_id="A100"))
+    assert build_key(days=1) != build_key(days=2)
+    assert build_key(filter_query=TradingFilterParams(oil_id="A100")) != build_key(
+        filter_query=TradingFilterParams(oil_id="A592")
+    )
+
+
+def test_params_change_key():
+    """Tests that different params values produce different keys."""
+
+    keys = {
+        build_key(filter_query=TradingFilterParams()),
+        build_key(filter_query=TradingFilterParams(limit=1)),
+        build_key(filter_query=TradingFilterParams(oil_id="A100")),
+        build_key(filter_query=DynamicsFilterParams(start_date=date(2024, 1, 1))),
+        build_key(days=2),
+    }
+
+    assert len(keys) == 5
+
+
+def test_key_length_is_fixed():
+    """Tests that key length doesn't depend on params length."""
+
+    short_key = build_key(filter_query=TradingFilterParams(oil_id="A"))
+    long_key = build_key(filter_query=TradingFilterParams(oil_id="A" * 1000))
+
+    assert len(short_key) == len(long_key)
+    assert short_key.startswith("prefix::endpoint:")
@@ -0,0 +1,111 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.redis.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_load_once():
+    """Tests that concurrent calls for the same key share a single load."""
+
+    single_flight = SingleFlight()
+    load_started = asyncio.Event()
+    release_load = asyncio.Event()
+    load = AsyncMock()
+
+    async def slow_load() -> bytes:
+        await load()
+        load_started.set()
+        await release_load.wait()
+        return b"value"
+
+    poll = AsyncMock(return_value=None)
+    first = asyncio.create_task(single_flight.do("key", slow_load, poll))
+    await load_started.wait()
+    others = [
+        asyncio.create_task(single_flight.do("key", slow_load, poll)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release_load.set()
+
+    results = await asyncio.gather(first, *others)
+
+    assert results == [b"value"] * 6
+    load.assert_awaited_once()
+    assert single_flight.calls == {}
+
+
+@pytest.mark.asyncio
+async def test_load_error_is_shared():
+    """Tests that a failed load is reported to all concurrent callers and is not
+    remembered.
+    """
+
+    single_flight = SingleFlight()
+    load = AsyncMock(side_effect=[RuntimeError("db is down"), b"value"])
+    poll = AsyncMock(return_value=None)
+
+    with pytest.raises(RuntimeError):
+        await single_flight.do("key", load, poll)
+
+    assert await single_flight.do("key", load, poll) == b"value"
+
+
+@pytest.mark.asyncio
+async def test_waits_for_worker_holding_lock():
+    """Tests that a worker not acquiring the lock takes the value from cache."""
+
+    redis = AsyncMock()
+    redis.set.return_value = None
+    single_flight = SingleFlight(redis, lock_timeout=1, wait_interval=0.01)
+    load = AsyncMock(return_value=b"own value")
+    poll = AsyncMock(side_effect=[None, b"value"])
+
+    assert await single_flight.do("key", load, poll) == b"value"
+
+    load.assert_not_awaited()
+    assert poll.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_loads_holding_lock():
+    """Tests that a worker acquiring the lock loads the value and releases it."""
+
+    redis = AsyncMock()
+    redis.set.return_value = True
+    single_flight = SingleFlight(redis)
+    load = AsyncMock(return_value=b"value")
+
+    assert await single_flight.do("key", load, AsyncMock()) == b"value"
+
+    load.assert_awaited_once()
+    assert redis.set.call_args.args[0] == "key:lock"
+    assert redis.eval.call_args.args[2] == "key:lock"
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_cancelled_load():
+    """Tests that a waiting caller loads the value if the loading caller is
+    cancelled.
+    """
+
+    single_flight = SingleFlight()
+    load_started = asyncio.Event()
+
+    async def hanging_load() -> bytes:
+        load_started.set()
+        await asyncio.Event().wait()
+
+    poll = AsyncMock(return_value=None)
+    first = asyncio.create_task(single_flight.do("key", hanging_load, poll))
+    await load_started.wait()
+    second = asyncio.create_task(
+        single_flight.do("key", AsyncMock(return_value=b"value"), poll)
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == b"value"
+    assert first.cancelled()
@@ -1,3 +1,24 @@
-__all__ = ("calculate_cache_expiration",)
+__all__ = (
+    "calculate_cache_expiration",
+    "get_cache_generation",
+    "TradeResultCursor",
+    "encode_cursor",
+    "decode_cursor",
+    "EXPORT_MEDIA_TYPES",
+    "encode_csv",
+    "encode_ndjson",
+    "negotiate_format",
+    "COLUMNAR_FORMATS",
+    "ColumnarEncoder",
+    "compress",
+    "negotiate_encoding",
+    "PreEncodedJSONResponse",
+    "encode_rows",
+)
 
-from .cache_expiration import calculate_cache_expiration
+from .cache_expiration import calculate_cache_expiration, get_cache_generation
+from .columnar import COLUMNAR_FORMATS, ColumnarEncoder
+from .compression import compress, negotiate_encoding
+from .export import EXPORT_MEDIA_TYPES, encode_csv, encode_ndjson, negotiate_format
+from .fast_json import PreEncodedJSONResponse, encode_rows
+from .pagination import TradeResultCursor, decode_cursor, encode_cursor
@@ -3,16 +3,18 @@ from datetime import datetime, timedelta, timezone
 from core.config import settings
 
 
-def calculate_cache_expiration() -> int:
-    """Calculates cahce expiration (in seconds) to reset time from project settings.
+def get_next_cache_reset(dt_now: datetime) -> datetime:
+    """Calculates the next cache reset moment from project settings.
+
+    Args:
+        dt_now (datetime): Current moment
 
     Returns:
-        int: Expiration in seconds
+        datetime: The nearest cache reset moment after the current one
     """
 
     expiration_time = settings.cache.time_cache_expire_to
 
-    dt_now = datetime.now(tz=timezone.utc)
     dt_reset = dt_now.replace(
         hour=expiration_time.hour,
         minute=expiration_time.minute,
@@ -23,4 +25,37 @@ def calculate_cache_expiration() -> int:
     if dt_now >= dt_reset:
         dt_reset += timedelta(days=1)
 
+    return dt_reset
+
+
+def calculate_cache_expiration() -> int:
+    """Calculates cahce expiration (in seconds) to reset time from project settings.
+
+    Returns:
+        int: Expiration in seconds
+    """
+
+    dt_now = datetime.now(tz=timezone.utc)
+    dt_reset = get_next_cache_reset(dt_now)
+
     return (dt_reset - dt_now).seconds
+
+
+def get_cache_generation(previous: bool = False) -> str:
+    """Returns the trading day generation of cache: the date of the last cache reset.
+
+    The generation changes at the reset time in all workers at once, so cache keys
+    carrying it are invalidated without deleting them.
+
+    Args:
+        previous (bool): Return the generation before the last reset. False by
+        default
+
+    Returns:
+        str: Generation in ISO format
+    """
+
+    dt_now = datetime.now(tz=timezone.utc)
+    dt_last_reset = get_next_cache_reset(dt_now) - timedelta(days=2 if previous else 1)
+
+    return dt_last_reset.date().isoformat()
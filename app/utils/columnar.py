@@ -0,0 +1,139 @@
+import io
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
+
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Table
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+COLUMNAR_FORMATS = ("arrow", "parquet")
+
+
+class ChunkSink(io.RawIOBase):
+    """A writable stream collecting written bytes until they are drained.
+
+    The position keeps growing after draining, so writers recording offsets, like
+    the Parquet footer, see the stream as one file.
+    """
+
+    def __init__(self) -> None:
+        """Inits empty sink."""
+
+        super().__init__()
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        """Returns bytes written since the last drain.
+
+        Returns:
+            bytes: Written bytes
+        """
+
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+
+        return data
+
+
+def get_arrow_schema(table: Table) -> Any:
+    """Builds the Arrow schema of the table's columns.
+
+    Args:
+        table (Table): Sqlalchemy table
+
+    Returns:
+        pyarrow.Schema: Arrow schema with integers as int64, dates as date32,
+        datetimes as UTC timestamps and other columns as strings
+    """
+
+    fields = []
+    for column in table.columns:
+        if isinstance(column.type, (Integer, BigInteger)):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC" if column.type.timezone else None)
+        elif isinstance(column.type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+
+    return pa.schema(fields)
+
+
+class ColumnarEncoder:
+    """A class to encode chunks of rows to an Arrow IPC stream or a Parquet file.
+
+    Every chunk is transposed to columns and written as one record batch or row
+    group, the bytes written for it are returned at once, so the response is
+    streamed without holding all rows.
+    """
+
+    def __init__(self, table: Table, format: Literal["arrow", "parquet"]) -> None:
+        """Inits encoder writing rows of the table.
+
+        Args:
+            table (Table): Sqlalchemy table of encoded rows
+            format (Literal["arrow", "parquet"]): Output format
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+        """
+
+        if pa is None:
+            raise RuntimeError(f'"{format}" export needs "columnar" extra')
+
+        schema = get_arrow_schema(table)
+        self.schema = schema
+        self.sink = ChunkSink()
+        if format == "parquet":
+            self.writer = pq.ParquetWriter(self.sink, schema, compression="zstd")
+        else:
+            self.writer = pa.ipc.new_stream(self.sink, schema)
+
+    def encode(self, rows: Sequence[Mapping[str, Any]]) -> bytes:
+        """Writes rows as one batch.
+
+        Args:
+            rows (Sequence[Mapping[str, Any]]): Rows to encode
+
+        Returns:
+            bytes: Encoded bytes written since the previous call
+        """
+
+        columns = {name: [row[name] for row in rows] for name in self.schema.names}
+        batch = pa.RecordBatch.from_pydict(columns, schema=self.schema)
+        if isinstance(self.writer, pa.ipc.RecordBatchStreamWriter):
+            self.writer.write_batch(batch)
+        else:
+            self.writer.write_batch(batch, row_group_size=len(rows))
+
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        """Finishes the stream or the file.
+
+        Returns:
+            bytes: The end of stream marker or the Parquet footer
+        """
+
+        self.writer.close()
+
+        return self.sink.drain()
@@ -0,0 +1,64 @@
+import gzip
+from collections.abc import Sequence
+
+import brotli
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+
+def negotiate_encoding(
+    accept_encoding: str | None, encodings: Sequence[str]
+) -> str | None:
+    """Picks the content coding by the "Accept-Encoding" header.
+
+    Codings are ranked by their quality values and then by the server's preference.
+
+    Args:
+        accept_encoding (str | None): "Accept-Encoding" header value
+        encodings (Sequence[str]): Available content codings in order of preference
+
+    Returns:
+        str | None: Content coding or None to send the response as is
+    """
+
+    qualities: dict[str, float] = {}
+    for coding in (accept_encoding or "").split(","):
+        name, *params = (part.strip() for part in coding.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+
+    ranked = [
+        (-qualities.get(encoding, qualities.get("*", 0.0)), position, encoding)
+        for position, encoding in enumerate(encodings)
+    ]
+    ranked = [item for item in ranked if item[0] < 0]
+
+    return min(ranked)[2] if ranked else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compresses the response body.
+
+    Levels are high as a body is compressed once per cached response, brotli's
+    quality stops at 9 since the higher ones are two orders of magnitude slower.
+
+    Args:
+        body (bytes): Response body
+        encoding (str): Content coding, "gzip" or "br"
+
+    Returns:
+        bytes: Compressed body
+    """
+
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+
+    return gzip.compress(body, GZIP_LEVEL, mtime=0)
@@ -0,0 +1,95 @@
+import csv
+import datetime
+import io
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _default(value: Any) -> str:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def negotiate_format(accept: str | None) -> str:
+    """Picks the export format by the "Accept" header.
+
+    Media ranges are ranked by their quality values and then by their order, the
+    first one matching an export media type wins. Wildcards and unknown media types
+    fall back to NDJSON.
+
+    Args:
+        accept (str | None): "Accept" header value
+
+    Returns:
+        str: Export format
+    """
+
+    formats = {media_type: name for name, media_type in EXPORT_MEDIA_TYPES.items()}
+    ranges = []
+    for position, media_range in enumerate((accept or "").split(",")):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and media_type.lower() in formats:
+            ranges.append((-quality, position, formats[media_type.lower()]))
+
+    return min(ranges)[2] if ranges else "ndjson"
+
+
+def encode_ndjson(rows: Sequence[Mapping[str, Any]]) -> bytes:
+    """Encodes rows to newline delimited JSON.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Rows to encode
+
+    Returns:
+        bytes: One JSON object per line
+    """
+
+    return "".join(
+        json.dumps(dict(row), default=_default, separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode()
+
+
+def encode_csv(rows: Sequence[Mapping[str, Any]], header: bool = False) -> bytes:
+    """Encodes rows to CSV.
+
+    Args:
+        rows (Sequence[Mapping[str, Any]]): Rows to encode
+        header (bool): Write the header line with column names. False by default
+
+    Returns:
+        bytes: CSV lines
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if header and rows:
+        writer.writerow(rows[0].keys())
+    writer.writerows(
+        [
+            value.isoformat() if isinstance(value, datetime.date) else value
+            for value in row.values()
+        ]
+        for row in rows
+    )
+
+    return buffer.getvalue().encode()
@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic_core import to_json
+from sqlalchemy import Row
+from starlette.responses import JSONResponse
+
+
+class PreEncodedJSONResponse(JSONResponse):
+    """A JSON response that sends already encoded bytes as is.
+
+    Being a "JSONResponse", its body is stored by the cache coder without
+    re-encoding.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return super().render(content)
+
+
+def encode_rows(rows: Sequence[Row], **extra: Any) -> bytes:
+    """Encodes database rows straight to JSON bytes.
+
+    Args:
+        rows (Sequence[Row]): Rows to encode
+        extra (Any): Fields to wrap rows into an object with "results" key
+
+    Returns:
+        bytes: JSON array of row objects or an object with "results" array and
+        extra fields
+    """
+
+    content = [row._asdict() for row in rows]
+    if extra:
+        return to_json({"results": content, **extra})
+
+    return to_json(content)
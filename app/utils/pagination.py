@@ -0,0 +1,57 @@
+import base64
+import datetime
+import json
+from typing import NamedTuple
+
+
+class TradeResultCursor(NamedTuple):
+    """A position in trade results ordered by (date, id) in descending order.
+
+    Attributes:
+        date (datetime.date): The date of the last returned trade result
+        id (int): The id of the last returned trade result
+    """
+
+    date: datetime.date
+    id: int
+
+
+def encode_cursor(date: datetime.date, id: int) -> str:
+    """Encodes the position of the last returned trade result to an opaque cursor.
+
+    Args:
+        date (datetime.date): The date of the last returned trade result
+        id (int): The id of the last returned trade result
+
+    Returns:
+        str: Url-safe cursor string
+    """
+
+    raw = json.dumps([date.isoformat(), id], separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> TradeResultCursor | None:
+    """Decodes an opaque cursor to the position in trade results.
+
+    Args:
+        cursor (str): Cursor string returned by "encode_cursor". An empty string
+        points to the first page
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    Returns:
+        TradeResultCursor | None: The decoded position or None for the first page
+    """
+
+    if not cursor:
+        return None
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        raw_date, raw_id = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        return TradeResultCursor(datetime.date.fromisoformat(raw_date), int(raw_id))
+    except (ValueError, TypeError) as error:
+        raise ValueError("Invalid cursor") from error